@@ -13,6 +13,10 @@ import numpy as np
 cimport numpy as np
 
 cimport cython
+from libc.math cimport isfinite
+from ._speedups_fallback import lut_index_dtype
+from ._speedups_fallback import map_lut_colors as _fallback_map_lut_colors
+from ._speedups_fallback import nanargminmax as _fallback_nanargminmax
 
 
 cdef extern from *:
@@ -127,12 +131,13 @@ def map_colors(
 @cython.cdivision(True)
 def map_colors_uint8(data_array not None,
                int steps,
-               float low,
-               float high,
+               double low,
+               double high,
                np.ndarray[np.uint8_t] red_lut not None,
                np.ndarray[np.uint8_t] green_lut not None,
                np.ndarray[np.uint8_t] blue_lut not None,
-               np.ndarray[np.uint8_t] alpha_lut not None
+               np.ndarray[np.uint8_t] alpha_lut not None,
+               out=None
                ):
     '''
     Map colors from color lookup tables to a data array.
@@ -155,6 +160,9 @@ def map_colors_uint8(data_array not None,
         The blue channel lookup table
     alpha_lut : ndarray of uint8
         The alpha channel lookup table
+    out : ndarray of uint8, optional
+        A C-contiguous array of shape data_array.shape + (4,) to write the
+        result to.
 
     Returns
     -------
@@ -163,56 +171,320 @@ def map_colors_uint8(data_array not None,
         of this array is equal to data_array.shape + (4,).
 
     '''
-    shape = data_array.shape + (4,)
-    cdef int i, idx, N = data_array.size
-    cdef float norm_value, range_diff
-    cdef char red, green, blue, alpha
-    cdef np.ndarray[np.uint8_t, ndim=2] rgba = np.empty((N, 4), np.uint8)
+    lut = np.column_stack([red_lut, green_lut, blue_lut, alpha_lut])
+    return map_colors_rgba32(data_array, steps, low, high, lut, out=out)
 
-    range_diff = high - low
 
+ctypedef fused _color_data_t:
+    np.float32_t
+    np.float64_t
+
+
+ctypedef fused _lut_index_t:
+    np.uint8_t
+    np.uint16_t
+    np.uint32_t
+
+
+cdef inline Py_ssize_t _lut_index(double value, int steps) noexcept nogil:
+    # NaNs fail all of the comparisons and map to the transparent entry
+    if value >= steps - 1:
+        return steps - 1
+    elif value >= 0:
+        return <Py_ssize_t> value
+    elif value < 0:
+        return 0
+    return steps
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+cdef void _map_rgba32(const _color_data_t[:] data, np.uint32_t[:] out,
+                      const np.uint32_t[:] lut, int steps, double low,
+                      double scale) noexcept nogil:
+    cdef Py_ssize_t i
+    for i in range(data.shape[0]):
+        out[i] = lut[_lut_index((data[i] - low) * scale, steps)]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def _fill_lut_indices(const _color_data_t[:] data, _lut_index_t[:] out,
+                      int steps, double low, double scale):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(data.shape[0]):
+            out[i] = <_lut_index_t> _lut_index((data[i] - low) * scale, steps)
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def _gather_lut_colors(const _lut_index_t[:] indices, np.uint32_t[:] out,
+                       const np.uint32_t[:] lut):
+    cdef Py_ssize_t i, n = lut.shape[0]
+    cdef bint in_bounds = True
+    with nogil:
+        for i in range(indices.shape[0]):
+            if indices[i] >= n:
+                in_bounds = False
+                break
+            out[i] = lut[indices[i]]
+    if not in_bounds:
+        raise IndexError("index {} is out of bounds".format(indices[i]))
+
+
+ctypedef fused _minmax_data_t:
+    np.float32_t
+    np.float64_t
+    np.int32_t
+    np.int64_t
+    np.uint8_t
+
+
+# The number of values which _argminmax reduces at a time, before searching
+# the values again for the indices of a new minimum or maximum.  The block
+# stays in the L1 cache for that search.
+cdef enum:
+    _MINMAX_BLOCK_SIZE = 2048
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def _argminmax(const _minmax_data_t[::1] data):
+    cdef Py_ssize_t i, block_start, block_end, n = data.shape[0]
+    cdef Py_ssize_t min_index = 0, max_index = -1
+    cdef _minmax_data_t low, low1, low2, low3, min_value
+    cdef _minmax_data_t high, high1, high2, high3, max_value
+    with nogil:
+        # skip the leading NaNs (a NaN is not equal to itself)
+        for i in range(n):
+            if data[i] == data[i]:
+                min_index = max_index = i
+                min_value = max_value = data[i]
+                break
+        block_start = max_index + 1
+        while 0 < block_start < n:
+            block_end = min(block_start + _MINMAX_BLOCK_SIZE, n)
+            # reduce the block with four independent minimums and maximums,
+            # so that the comparisons do not wait for each other.  NaNs fail
+            # the comparisons.
+            low = low1 = low2 = low3 = min_value
+            high = high1 = high2 = high3 = max_value
+            for i in range(block_start, block_end - 3, 4):
+                low = data[i] if data[i] < low else low
+                high = data[i] if data[i] > high else high
+                low1 = data[i + 1] if data[i + 1] < low1 else low1
+                high1 = data[i + 1] if data[i + 1] > high1 else high1
+                low2 = data[i + 2] if data[i + 2] < low2 else low2
+                high2 = data[i + 2] if data[i + 2] > high2 else high2
+                low3 = data[i + 3] if data[i + 3] < low3 else low3
+                high3 = data[i + 3] if data[i + 3] > high3 else high3
+            for i in range(block_end - (block_end - block_start) % 4,
+                           block_end):
+                low = data[i] if data[i] < low else low
+                high = data[i] if data[i] > high else high
+            low = min(min(low, low1), min(low2, low3))
+            high = max(max(high, high1), max(high2, high3))
+            if low < min_value:
+                min_value = low
+                for i in range(block_start, block_end):
+                    if data[i] == low:
+                        min_index = i
+                        break
+            if high > max_value:
+                max_value = high
+                for i in range(block_start, block_end):
+                    if data[i] == high:
+                        max_index = i
+                        break
+            block_start = block_end
+    if max_index < 0:
+        return 0, -1
+    return min_index, max_index
+
+
+_minmax_dtypes = (np.float32, np.float64, np.int32, np.int64, np.uint8)
+
+
+def nanargminmax(data not None):
+    '''
+    Find the indices of the minimum and maximum values, ignoring NaNs.
+
+    Float, int32, int64 and uint8 data is scanned in a single pass, with the
+    GIL released.  See the pure Python implementation in
+    ``_speedups_fallback`` for the description of the parameter and return
+    values.
+    '''
+    data = np.asarray(data)
+    if data.dtype not in _minmax_dtypes:
+        return _fallback_nanargminmax(data)
+    return _argminmax(np.ascontiguousarray(data).reshape(-1))
+
+
+def map_lut_colors(indices not None,
+                   int steps,
+                   np.ndarray[np.uint8_t, ndim=2] lut not None,
+                   out=None
+                   ):
+    '''
+    Map indices into a color lookup table to colors.
+
+    Indices of the types returned by map_lut_indices are gathered in a
+    single pass, with the GIL released.  See the pure Python implementation
+    in ``_speedups_fallback`` for the description of the parameters and
+    return value.
+    '''
+    indices = np.asarray(indices)
+    if indices.dtype not in (np.uint8, np.uint16, np.uint32):
+        return _fallback_map_lut_colors(indices, steps, lut, out=out)
+    shape = indices.shape + (4,)
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    elif (
+        out.dtype != np.uint8
+        or out.shape != shape
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            "out must be a C-contiguous uint8 array of shape {}".format(shape)
+        )
+
+    packed = np.zeros((steps + 1, 4), dtype=np.uint8)
+    packed[:steps] = lut[:steps]
+    _gather_lut_colors(
+        np.ascontiguousarray(indices).reshape(-1),
+        out.view(np.uint32).reshape(-1),
+        packed.view(np.uint32).ravel(),
+    )
+    return out
+
+
+def map_lut_indices(data_array not None,
+                    int steps,
+                    double low,
+                    double high,
+                    out=None
+                    ):
+    '''
+    Map a data array to indices into a color lookup table.
+
+    Float32 and float64 data is mapped in a single pass, with the GIL
+    released.  See the pure Python implementation in ``_speedups_fallback``
+    for the description of the parameters and return value.
+    '''
+    data_array = np.asarray(data_array)
+    dtype = lut_index_dtype(steps)
+    if out is None:
+        out = np.empty(data_array.shape, dtype=dtype)
+    elif (
+        out.dtype != dtype
+        or out.shape != data_array.shape
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            "out must be a C-contiguous {} array of shape {}".format(
+                dtype.name, data_array.shape
+            )
+        )
+
+    cdef double range_diff = high - low
     # Handle null range, or infinite range (which can happen during
     # initialization before range is connected to a data source).
-    if range_diff == 0.0 or np.isinf(range_diff):
-        idx = (steps - 1) / 2
-        # Pull these out here to avoid N lookups
-        red = red_lut[idx]
-        green = green_lut[idx]
-        blue = blue_lut[idx]
-        alpha = alpha_lut[idx]
-        for i in range(N):
-            rgba[i, 0] = red
-            rgba[i, 1] = green
-            rgba[i, 2] = blue
-            rgba[i, 3] = alpha
-        return rgba.reshape(shape)
+    if range_diff == 0.0 or not isfinite(range_diff):
+        out[...] = (steps - 1) // 2
+        return out
+
+    if data_array.dtype != np.float32:
+        data_array = data_array.astype(np.float64, copy=False)
+    data_array = np.ascontiguousarray(data_array).reshape(-1)
+    _fill_lut_indices(
+        data_array, out.reshape(-1), steps, low, (steps - 1) / range_diff
+    )
+    return out
+
+
+def map_colors_rgba32(data_array not None,
+                      int steps,
+                      double low,
+                      double high,
+                      np.ndarray[np.uint8_t, ndim=2] lut not None,
+                      out=None
+                      ):
+    '''
+    Map colors from a packed RGBA lookup table to a data array.
 
-    # Copy the data into a float32 array so we can use fast iteration.
-    cdef np.ndarray[np.float32_t] norm_data = np.empty(N, np.float32)
-    norm_data[:] = data_array.flat
+    Each color is copied from the lookup table as a single 32 bit value, and
+    NaN values are mapped to transparent black.  Float32 and float64 data is
+    mapped in a single pass without temporary arrays, and the GIL is released
+    while the colors are written, so the rows of an image can be mapped in
+    several threads at once.
 
-    for i in range(N):
-        if isnan(norm_data[i]):
-            rgba[i, 0] = 0
-            rgba[i, 1] = 0
-            rgba[i, 2] = 0
-            rgba[i, 3] = 0
-        else:
-            # range_diff has already been confirmed as non-zero
-            norm_value = (norm_data[i] - low) / range_diff
-            if norm_value > 1:
-                idx = steps - 1
-            elif norm_value < 0:
-                idx = 0
-            else:
-                idx = <int> ((steps - 1) * norm_value)
+    Parameters
+    ----------
+    data_array : ndarray
+        The data array
+    steps: int
+        The number of steps in the color map (depth)
+    low : float
+        The low end of the data range
+    high : float
+        The high end of the data range
+    lut : ndarray of uint8
+        The lookup table, with shape (steps, 4)
+    out : ndarray of uint8, optional
+        A C-contiguous array of shape data_array.shape + (4,) to write the
+        result to.
 
-            rgba[i, 0] = red_lut[idx]
-            rgba[i, 1] = green_lut[idx]
-            rgba[i, 2] = blue_lut[idx]
-            rgba[i, 3] = alpha_lut[idx]
+    Returns
+    -------
+    rgba: ndarray of uint8
+        The rgba values of data_array according to the lookup table. The
+        shape of this array is equal to data_array.shape + (4,).
 
-    return rgba.reshape(shape)
+    '''
+    data_array = np.asarray(data_array)
+    shape = data_array.shape + (4,)
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    elif (
+        out.dtype != np.uint8
+        or out.shape != shape
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            "out must be a C-contiguous uint8 array of shape {}".format(shape)
+        )
+    if steps < 1 or lut.shape[0] < steps or lut.shape[1] != 4:
+        raise ValueError("lut must have shape ({}, 4)".format(steps))
+
+    # The packed table has a transparent entry after the last color for NaN.
+    packed = np.zeros((steps + 1, 4), dtype=np.uint8)
+    packed[:steps] = lut[:steps]
+    cdef const np.uint32_t[:] packed_view = packed.view(np.uint32).ravel()
+    cdef np.uint32_t[:] out_view = out.view(np.uint32).reshape(-1)
+
+    cdef double range_diff = high - low
+    # Handle null range, or infinite range (which can happen during
+    # initialization before range is connected to a data source).
+    if range_diff == 0.0 or not isfinite(range_diff):
+        out_view[:] = packed_view[(steps - 1) // 2]
+        return out
+
+    cdef double scale = (steps - 1) / range_diff
+    if data_array.dtype != np.float32:
+        data_array = data_array.astype(np.float64, copy=False)
+    data_array = np.ascontiguousarray(data_array).reshape(-1)
+    cdef const np.float32_t[:] data32
+    cdef const np.float64_t[:] data64
+    if data_array.dtype == np.float32:
+        data32 = data_array
+        with nogil:
+            _map_rgba32(data32, out_view, packed_view, steps, low, scale)
+    else:
+        data64 = data_array
+        with nogil:
+            _map_rgba32(data64, out_view, packed_view, steps, low, scale)
+    return out
 
 
 @cython.wraparound(False)
@@ -285,3 +557,103 @@ def apply_selection_fade(
             mapped_image[i, j, 0] = red_lut[mapped_image[i, j, 0]]
             mapped_image[i, j, 1] = green_lut[mapped_image[i, j, 1]]
             mapped_image[i, j, 2] = blue_lut[mapped_image[i, j, 2]]
+
+
+cdef np.ndarray _as_flags(mask, Py_ssize_t n):
+    '''Returns a mask as a contiguous uint8 array of length n.'''
+    flags = np.ascontiguousarray(mask, dtype=bool).view(np.uint8)
+    if flags.shape[0] != n:
+        raise ValueError("mask has length %d, expected %d" % (len(flags), n))
+    return flags
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def scatterplot_gather_points(
+        index, double index_low, double index_high,
+        value, double value_low, double value_high,
+        index_mask=None, index_sel=None, index_sel_mask=None,
+        value_mask=None, value_sel=None, value_sel_mask=None,
+        point_mask=None):
+    '''Gathers the points within the index and value ranges.
+
+    This makes a single pass over the data, combining the masking of
+    non-finite values, the data masks, the range tests and the selection
+    masks, and writes the gathered points directly into the output array.
+    See the pure Python implementation in ``_speedups_fallback`` for the
+    description of the parameters and return values.
+    '''
+    cdef const double[:] x = np.ascontiguousarray(index, dtype=np.float64)
+    cdef const double[:] y = np.ascontiguousarray(value, dtype=np.float64)
+    cdef Py_ssize_t n = x.shape[0]
+    if y.shape[0] != n:
+        raise ValueError("index and value must have the same length")
+
+    # Fold the optional masks into at most two flag arrays.
+    data_flags = None
+    for mask in (index_mask, value_mask):
+        if mask is not None:
+            flags = _as_flags(mask, n)
+            data_flags = flags if data_flags is None else flags & data_flags
+    sel_flags = None
+    for mask in (index_sel_mask, value_sel_mask):
+        if mask is not None:
+            flags = _as_flags(mask, n)
+            sel_flags = flags if sel_flags is None else flags & sel_flags
+    for sel in (index_sel, value_sel):
+        if sel is not None:
+            flags = np.zeros(n, dtype=np.uint8)
+            flags[np.asarray(sel, dtype=np.intp)] = 1
+            sel_flags = flags if sel_flags is None else flags & sel_flags
+
+    cdef bint has_data_flags = data_flags is not None
+    cdef bint has_sel_flags = sel_flags is not None
+    cdef bint has_point_mask = point_mask is not None
+    cdef const unsigned char[:] data_view
+    cdef const unsigned char[:] sel_view
+    cdef unsigned char[:] point_view
+    if has_data_flags:
+        data_view = data_flags
+    if has_sel_flags:
+        sel_view = sel_flags
+    if has_point_mask:
+        if point_mask.shape[0] != n or point_mask.dtype != np.bool_:
+            raise ValueError("point_mask must be a bool array like index")
+        point_view = point_mask.view(np.uint8)
+
+    points = np.empty((n, 2), dtype=np.float64)
+    selections = np.empty(n if has_sel_flags else 0, dtype=np.uint8)
+    cdef double[:, :] points_view = points
+    cdef unsigned char[:] selections_view = selections
+    cdef Py_ssize_t i, count = 0
+    cdef double xi, yi
+    cdef bint keep
+
+    with nogil:
+        for i in range(n):
+            xi = x[i]
+            yi = y[i]
+            keep = (
+                isfinite(xi) and isfinite(yi)
+                and xi >= index_low and xi <= index_high
+                and yi >= value_low and yi <= value_high
+            )
+            if keep and has_data_flags:
+                keep = data_view[i] != 0
+            if has_point_mask:
+                point_view[i] = keep
+            if keep:
+                points_view[count, 0] = xi
+                points_view[count, 1] = yi
+                if has_sel_flags:
+                    selections_view[count] = sel_view[i] != 0
+                count += 1
+
+    # Don't keep a mostly empty output array alive.
+    if count < n // 2:
+        points = points[:count].copy()
+    else:
+        points = points[:count]
+    if has_sel_flags:
+        return points, selections[:count].view(bool)
+    return points, None
@@ -14,14 +14,14 @@ _speedups extension module.
 """
 
 from numpy import (
+    asarray,
     clip,
+    column_stack,
     invert,
+    isfinite,
     isnan,
     isinf,
-    array,
-    transpose,
     zeros,
-    compress,
     where,
     take,
     float32,
@@ -32,6 +32,12 @@ import numpy as np
 import operator
 
 
+# The number of values which nanargminmax scans at a time.  This is small
+# enough for a chunk of doubles to stay in the L2 cache while it is scanned
+# for both the minimum and the maximum.
+_MINMAX_CHUNK_SIZE = 2 ** 15
+
+
 def array_combine(a, b, op=operator.and_, func=lambda x: x):
     """Returns op(func(a), func(b)) if a and b are both not None;
     if one is None, then returns func() on the non-None array;
@@ -60,25 +66,28 @@ def scatterplot_gather_points(
     value_mask=None,
     value_sel=None,
     value_sel_mask=None,
+    point_mask=None,
 ):
     """
     Takes index and value arrays, masks, and optional selection arrays,
     and returns the list of points and corresponding selection mask for
     those points.
 
+    Points with a non-finite index or value are never gathered.
+
     Parameters
     ----------
     index : float array (1D)
        Array of indexes of the points
-    index_low : float or None
+    index_low : float
        The minimum acceptable value in the index array
-    index_high : float or None
+    index_high : float
        The maximum acceptable value in the index array
     value : float array (1D)
        Array of values of the points
-    value_low : float or None
+    value_low : float
        The minimum acceptable value in the value array
-    value_high : float or None
+    value_high : float
        The maximum acceptable value in the value array
 
     Optional Parameters
@@ -95,52 +104,52 @@ def scatterplot_gather_points(
        A list/tuple/array of indices of selected positions in the value array
     value_sel_mask : array of ints or bools
        An mask array with True values indicating which points are selected
+    point_mask : bool array (1D)
+       If given, an array of the same length as index which is filled with
+       the mask of the points that are gathered
 
     Returns
     -------
     points : float array (Nx2)
        The points that match all the masking criteria
     sel_mask : bool array (1D)
-       Mask indicating which indices in **points** are selected
+       Mask indicating which indices in **points** are selected, or None if
+       no selection was given.  A point is selected if it is selected by all
+       of the given selection arrays.
     """
+    index = asarray(index)
+    value = asarray(value)
+    with np.errstate(invalid="ignore"):
+        mask = (
+            isfinite(index)
+            & isfinite(value)
+            & (index >= index_low)
+            & (index <= index_high)
+            & (value >= value_low)
+            & (value <= value_high)
+        )
+    for data_mask in (index_mask, value_mask):
+        if data_mask is not None:
+            mask &= asarray(data_mask, dtype=bool)
+    if point_mask is not None:
+        point_mask[:] = mask
+
+    points = column_stack([index[mask], value[mask]])
+
+    selection_mask = None
+    for sel_mask in (index_sel_mask, value_sel_mask):
+        if sel_mask is not None:
+            selection_mask = array_combine(
+                selection_mask, asarray(sel_mask, dtype=bool)
+            )
+    for sel in (index_sel, value_sel):
+        if sel is not None:
+            marks = zeros(len(index), dtype=bool)
+            marks[asarray(sel, dtype=np.intp)] = True
+            selection_mask = array_combine(selection_mask, marks)
 
-    index_range_mask = (index_low < index) & (index < index_high)
-    value_range_mask = (value_low < value) & (value < value_high)
-
-    nan_mask = array_combine(
-        index_mask, value_mask, func=lambda x: invert(isnan(x)) & x
-    )
-
-    if nan_mask is not None:
-        point_mask = nan_mask & index_range_mask & value_range_mask
-    else:
-        point_mask = index_range_mask & value_range_mask
-    points = transpose(array((index, value)))
-
-    # Handle the selection mask
-    selection_mask = array_combine(index_sel_mask, value_sel_mask)
-
-    if index_sel is None and value_sel is None:
-        pass
-    else:
-        if index_sel is not None and value_sel is not None:
-            mask2 = zeros(len(index), int)
-            mask2[index_sel] = 1
-            mask2[value_sel] &= 1
-        elif index_sel is not None:
-            mask2 = zeros(len(index), int)
-            mask2[index_sel] = 1
-        elif value_sel is not None:
-            mask2 = zeros(len(index), int)
-            mask2[value_sel] = 1
-        if selection_mask is None:
-            selection_mask = mask2
-        else:
-            selection_mask &= mask2
-
-    points = compress(point_mask, points, axis=0)
     if selection_mask is not None:
-        selections = compress(point_mask, selection_mask)
+        selections = selection_mask[mask]
     else:
         selections = None
     return points, selections
@@ -227,11 +236,19 @@ def map_colors(
 
 
 def map_colors_uint8(
-    data_array, steps, low, high, red_lut, green_lut, blue_lut, alpha_lut
+    data_array,
+    steps,
+    low,
+    high,
+    red_lut,
+    green_lut,
+    blue_lut,
+    alpha_lut,
+    out=None,
 ):
     """Map colors from color lookup tables to a data array.
 
-    This is used in ColorMapper.map_screen
+    This is used in ColorMapper.map_uint8
 
     Parameters
     ----------
@@ -251,6 +268,9 @@ def map_colors_uint8(
         The blue channel lookup table
     alpha_lut : ndarray of uint8
         The alpha channel lookup table
+    out : ndarray of uint8, optional
+        A C-contiguous array of shape data_array.shape + (4,) to write the
+        result to.
 
     Returns
     -------
@@ -259,21 +279,219 @@ def map_colors_uint8(
         of this array is equal to data_array.shape + (4,).
 
     """
+    lut = column_stack([red_lut, green_lut, blue_lut, alpha_lut])
+    return map_colors_rgba32(data_array, steps, low, high, lut, out=out)
+
+
+def map_colors_rgba32(data_array, steps, low, high, lut, out=None):
+    """Map colors from a packed RGBA lookup table to a data array.
+
+    Each color is copied from the lookup table as a single 32 bit value,
+    and NaN values are mapped to transparent black.
+
+    Parameters
+    ----------
+    data_array : ndarray
+        The data array
+    steps: int
+        The number of steps in the color map (depth)
+    low : float
+        The low end of the data range
+    high : float
+        The high end of the data range
+    lut : ndarray of uint8
+        The lookup table, with shape (steps, 4)
+    out : ndarray of uint8, optional
+        A C-contiguous array of shape data_array.shape + (4,) to write the
+        result to.
+
+    Returns
+    -------
+    rgba: ndarray of uint8
+        The rgba values of data_array according to the lookup table. The
+        shape of this array is equal to data_array.shape + (4,).
+
+    """
+    indices = map_lut_indices(data_array, steps, low, high)
+    return map_lut_colors(indices, steps, lut, out=out)
+
+
+def map_lut_indices(data_array, steps, low, high, out=None):
+    """Map a data array to indices into a color lookup table.
+
+    These are the indices used by map_colors_rgba32: NaN values are mapped
+    to *steps*, the index of the transparent entry which map_lut_colors adds
+    after the last color.
+
+    Parameters
+    ----------
+    data_array : ndarray
+        The data array
+    steps: int
+        The number of steps in the color map (depth)
+    low : float
+        The low end of the data range
+    high : float
+        The high end of the data range
+    out : ndarray, optional
+        A C-contiguous array with the shape of data_array and the dtype
+        returned by lut_index_dtype(steps) to write the result to.
+
+    Returns
+    -------
+    indices: ndarray of uint8, uint16 or uint32
+        The indices, of the smallest unsigned integer type which can hold
+        *steps*.
+
+    """
+    data_array = asarray(data_array)
+    dtype = lut_index_dtype(steps)
+    if out is None:
+        out = np.empty(data_array.shape, dtype=dtype)
+    elif (
+        out.dtype != dtype
+        or out.shape != data_array.shape
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            "out must be a C-contiguous {} array of shape {}".format(
+                dtype.name, data_array.shape
+            )
+        )
     range_diff = high - low
 
     if range_diff == 0.0 or isinf(range_diff):
         # Handle null range, or infinite range (which can happen during
         # initialization before range is connected to a data source).
-        norm_data = 0.5 * ones_like(data_array)
-    else:
-        norm_data = clip((data_array - low) / range_diff, 0.0, 1.0)
+        out[...] = (steps - 1) // 2
+        return out
 
-    nanmask = isnan(norm_data)
-    norm_data = where(nanmask, 0, (norm_data * (steps - 1)).astype("uint8"))
-    rgba = zeros(norm_data.shape + (4,), dtype="uint8")
-    rgba[..., 0] = where(nanmask, 0, take(red_lut, norm_data))
-    rgba[..., 1] = where(nanmask, 0, take(green_lut, norm_data))
-    rgba[..., 2] = where(nanmask, 0, take(blue_lut, norm_data))
-    rgba[..., 3] = where(nanmask, 0, take(alpha_lut, norm_data))
+    indices = (data_array - low) * ((steps - 1) / range_diff)
+    indices = where(isnan(indices), steps, clip(indices, 0, steps - 1))
+    out[...] = indices
+    return out
 
-    return rgba
+
+def map_lut_colors(indices, steps, lut, out=None):
+    """Map indices into a color lookup table to colors.
+
+    Each color is copied from the lookup table as a single 32 bit value, so
+    this is a single integer gather.
+
+    Parameters
+    ----------
+    indices : ndarray of int
+        The indices, as returned by map_lut_indices
+    steps: int
+        The number of steps in the color map (depth)
+    lut : ndarray of uint8
+        The lookup table, with shape (steps, 4)
+    out : ndarray of uint8, optional
+        A C-contiguous array of shape indices.shape + (4,) to write the
+        result to.
+
+    Returns
+    -------
+    rgba: ndarray of uint8
+        The rgba values of the indices.  The shape of this array is equal to
+        indices.shape + (4,).
+
+    """
+    indices = asarray(indices)
+    out = _rgba32_output(indices.shape, out)
+    take(
+        _packed_lut(lut, steps),
+        indices,
+        out=out.view(np.uint32).reshape(indices.shape),
+    )
+    return out
+
+
+def nanargminmax(data):
+    """Find the indices of the minimum and maximum values, ignoring NaNs.
+
+    The data is scanned in chunks which fit in the processor's cache, so
+    that both indices are found with a single pass through memory.
+
+    Parameters
+    ----------
+    data : array-like
+        The data.  If it is not 1-D, it is flattened in C order.
+
+    Returns
+    -------
+    min_index, max_index : int
+        The indices of the first occurrences of the minimum and maximum
+        values.  If there are no values which are not NaN, or the data is
+        not numeric, these are 0 and -1, as for bounded_nanargmin and
+        bounded_nanargmax.
+
+    """
+    data = asarray(data)
+    if not np.issubdtype(data.dtype, np.number):
+        return 0, -1
+    data = data.ravel()
+    has_nans = np.issubdtype(data.dtype, np.inexact)
+
+    min_index, max_index = 0, -1
+    min_value = max_value = None
+    for start in range(0, len(data), _MINMAX_CHUNK_SIZE):
+        chunk = data[start:start + _MINMAX_CHUNK_SIZE]
+        chunk_min = chunk.argmin()
+        chunk_max = chunk.argmax()
+        if has_nans and isnan(chunk[chunk_min]):
+            # argmin and argmax return the first NaN
+            if isnan(chunk).all():
+                continue
+            chunk_min = np.nanargmin(chunk)
+            chunk_max = np.nanargmax(chunk)
+        if min_value is None:
+            min_value = chunk[chunk_min]
+            max_value = chunk[chunk_max]
+            min_index = start + chunk_min
+            max_index = start + chunk_max
+            continue
+        if chunk[chunk_min] < min_value:
+            min_value = chunk[chunk_min]
+            min_index = start + chunk_min
+        if chunk[chunk_max] > max_value:
+            max_value = chunk[chunk_max]
+            max_index = start + chunk_max
+    return int(min_index), int(max_index)
+
+
+def lut_index_dtype(steps):
+    """Returns the smallest unsigned integer dtype which can hold the indices
+    into a lookup table of *steps* colors, plus the index *steps* for NaN.
+    """
+    for dtype in (np.uint8, np.uint16):
+        if steps <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.uint32)
+
+
+def _rgba32_output(shape, out):
+    """Returns an array for the rgba values of data of the given shape,
+    checking that *out* is usable if it is given.
+    """
+    shape = tuple(shape) + (4,)
+    if out is None:
+        return np.empty(shape, dtype=np.uint8)
+    if (
+        out.dtype != np.uint8
+        or out.shape != shape
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            "out must be a C-contiguous uint8 array of shape {}".format(shape)
+        )
+    return out
+
+
+def _packed_lut(lut, steps):
+    """Packs the rows of a (steps, 4) lookup table of uint8 into 32 bit
+    values, followed by a transparent entry for NaN.
+    """
+    packed = np.zeros((steps + 1, 4), dtype=np.uint8)
+    packed[:steps] = lut[:steps]
+    return packed.view(np.uint32).reshape(steps + 1)
@@ -0,0 +1,59 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Worker threads shared by the Chaco components which compute in the
+background, and the passing of their results to the UI thread.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from traits import trait_notifiers
+
+
+# The pools of worker threads, keyed by name.
+_executors = {}
+_executors_lock = Lock()
+
+
+def get_executor(name, max_workers=1):
+    """Returns the pool of worker threads with the given name, which is
+    created with **max_workers** threads the first time it is requested.
+
+    The threads are named "chaco-<name>".  A pool with a single thread runs
+    its tasks one at a time, in the order they are submitted.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="chaco-" + name
+            )
+            _executors[name] = executor
+        return executor
+
+
+def can_dispatch_to_ui():
+    """Whether results can be passed from worker threads to the UI thread.
+
+    This is False if no UI toolkit has registered its event loop with
+    Traits, in which case the callers should compute their results
+    synchronously instead.
+    """
+    return trait_notifiers.get_ui_handler() is not None
+
+
+def dispatch_to_ui(handler, *args):
+    """Calls a handler with the given arguments on the UI thread.
+
+    The handler is called later by the event loop of the UI if this is
+    called from another thread.  This must only be used if
+    can_dispatch_to_ui() is True.
+    """
+    trait_notifiers.ui_dispatch(handler, *args)
@@ -67,13 +67,18 @@ class AbstractColormap(HasTraits):
         """
         raise NotImplementedError()
 
-    def map_uint8(self, val):
+    def map_uint8(self, val, out=None):
         """
         map_uint8(val) -> rgb24 or rgba32 color
 
         Maps a single value to a single color.  Color is represented as either
         length-3 or length-4 array of rgb(a) uint8 values, depending on the
-        **color_depth** setting.
+        **color_depth** setting.  If *out* is given, the colors are written
+        to it and it is returned.
         """
         # default implementation (not efficient)
-        return (self.map_screen(val) * 255.0).astype("uint8")
+        rgba = (self.map_screen(val) * 255.0).astype("uint8")
+        if out is None:
+            return rgba
+        out[...] = rgba
+        return out
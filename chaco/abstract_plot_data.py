@@ -24,7 +24,11 @@ class AbstractPlotData(HasTraits):
 
     #: Indicates that some of the data has changed.  The event object must
     #: be a dict with keys "added", "removed", "changed" and values that are
-    #: lists of strings. This event is used by consumers of this data.
+    #: lists of strings. It may also have the key "appended", mapping names
+    #: to arrays of values appended to the end of the existing data, and the
+    #: key "discarded", mapping names to the number of values discarded from
+    #: the start of the existing data. This event is used by consumers of
+    #: this data.
     data_changed = Event
 
     # -------------------------------------------------------------------------
@@ -35,8 +35,10 @@ Data Model
 - :class:`~.ArrayDataSource`
 - :class:`~.GridDataSource`
 - :class:`~.ImageData`
+- :class:`~.MappedArrayDataSource`
 - :class:`~.MultiArrayDataSource`
 - :class:`~.PointDataSource`
+- :class:`~.TiledImageData`
 - :class:`~.AbstractDataRange`
 - :class:`~.BaseDataRange`
 - :class:`~.DataRange1D`
@@ -295,8 +297,10 @@ from .abstract_data_source import AbstractDataSource
 from .array_data_source import ArrayDataSource
 from .grid_data_source import GridDataSource
 from .image_data import ImageData
+from .mapped_array_data_source import MappedArrayDataSource
 from .multi_array_data_source import MultiArrayDataSource
 from .point_data_source import PointDataSource
+from .tiled_image_data import TiledImageData
 from .abstract_data_range import AbstractDataRange
 from .base_data_range import BaseDataRange
 from .data_range_1d import DataRange1D
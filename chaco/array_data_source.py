@@ -20,6 +20,9 @@ from traits.api import Any, Constant, Int, Tuple
 # Chaco imports
 from .base import NumericalSequenceTrait, reverse_map_1d, SortOrderTrait
 from .abstract_data_source import AbstractDataSource
+from .downsample.lod_pyramid import MinMaxPyramid
+from .ring_buffer import RingBuffer
+from .speedups import nanargminmax
 
 
 def bounded_nanargmin(arr):
@@ -69,6 +72,12 @@ class ArrayDataSource(AbstractDataSource):
 
     This class does not listen to the array for value changes; if you need that
     behavior, create a subclass that hooks up the appropriate listeners.
+
+    Streaming data can be added with :meth:`append_data`, which updates the
+    bounds incrementally.  The **data_changed** event fired by an append
+    carries a dictionary with the keys "appended", the array of new values,
+    and "discarded", the number of values removed from the start of the data;
+    other changes fire the event with the value True.
     """
 
     # ------------------------------------------------------------------------
@@ -111,6 +120,19 @@ class ArrayDataSource(AbstractDataSource):
     # typechecks numpy.int64 on 64-bit Windows systems.
     _max_index = Any
 
+    # Lazily-built level-of-detail pyramid of self._data, or None.
+    _lod_pyramid = Any
+
+    # The RingBuffer holding self._data once data has been appended, or None.
+    _buffer = Any
+
+    # Lazily-built indices which sort self._data, or None.
+    _sort_permutation = Any
+
+    # The sorted values of self._data without NaNs, built with
+    # **_sort_permutation**.
+    _sorted_data = Any
+
     # ------------------------------------------------------------------------
     # Public methods
     # ------------------------------------------------------------------------
@@ -132,9 +154,79 @@ class ArrayDataSource(AbstractDataSource):
         self._data = newdata
         if sort_order is not None:
             self.sort_order = sort_order
+        self._buffer = None
+        self._lod_pyramid = None
+        self._sort_permutation = None
         self._compute_bounds()
         self.data_changed = True
 
+    def append_data(self, new_data, capacity=None):
+        """Appends values to the end of the data.
+
+        The data is kept in a RingBuffer, so appending takes amortized time
+        proportional to the number of new values, and the bounds are updated
+        from the new values alone unless the discarded values included the
+        minimum or the maximum.  Arrays previously returned by get_data() are
+        not modified.
+
+        Parameters
+        ----------
+        new_data : array
+            The values to append.  If the data is sorted, the new values must
+            preserve the sort order.
+        capacity : int or None
+            If given, only the most recent *capacity* values are kept.
+        """
+        if self._buffer is None:
+            self._buffer = RingBuffer(self.get_data())
+        old_size = len(self._buffer)
+        discarded = self._buffer.append(new_data, capacity)
+        data = self._buffer.get()
+        n_appended = len(data) - old_size + discarded
+
+        self._data = data
+        self._lod_pyramid = None
+        self._sort_permutation = None
+        self._update_bounds(old_size, discarded, n_appended)
+        self.data_changed = {
+            "appended": data[len(data) - n_appended:],
+            "discarded": discarded,
+        }
+
+    def set_appended_data(self, data, n_appended, discarded=0):
+        """Sets the data to an array which extends the current data.
+
+        This is for data which is buffered elsewhere, such as the arrays
+        of an ArrayPlotData: *data* must be the current data without its
+        first *discarded* values, followed by *n_appended* new values.  The
+        array is used as it is, and the bounds are updated as in
+        append_data().  If the sizes do not match, this is the same as
+        set_data().
+
+        Parameters
+        ----------
+        data : array
+            The extended data.
+        n_appended : int
+            The number of values appended to the end of the data.
+        discarded : int
+            The number of values discarded from the start of the data.
+        """
+        old_size = self.get_size()
+        if old_size - discarded + n_appended != len(data):
+            self.set_data(data)
+            return
+
+        self._data = data
+        self._buffer = None
+        self._lod_pyramid = None
+        self._sort_permutation = None
+        self._update_bounds(old_size, discarded, n_appended)
+        self.data_changed = {
+            "appended": data[len(data) - n_appended:],
+            "discarded": discarded,
+        }
+
     def set_mask(self, mask):
         """Sets the mask for this data source."""
         self._cached_mask = mask
@@ -159,6 +251,36 @@ class ArrayDataSource(AbstractDataSource):
         else:
             return empty(shape=(0,))
 
+    def get_lod_pyramid(self):
+        """Returns a MinMaxPyramid summarizing the data of this data source.
+
+        The pyramid is built the first time it is requested and is discarded
+        whenever the data changes.
+        """
+        if self._lod_pyramid is None:
+            self._lod_pyramid = MinMaxPyramid(self.get_data())
+        return self._lod_pyramid
+
+    def get_sort_permutation(self):
+        """Returns the indices which sort the data in ascending order.
+
+        NaN values are sorted last, and equal values are kept in the order of
+        the data.  The permutation is computed the first time it is requested
+        and is discarded whenever the data changes, so that reverse mapping
+        unsorted data only takes a binary search.
+        """
+        if self._sort_permutation is None:
+            data = self.get_data().view(ndarray)
+            permutation = np.argsort(data, kind="stable")
+            sorted_data = data[permutation]
+            if np.issubdtype(data.dtype, np.floating):
+                # NaNs are sorted last
+                n_valid = len(data) - np.count_nonzero(np.isnan(data))
+                sorted_data = sorted_data[:n_valid]
+            self._sorted_data = sorted_data
+            self._sort_permutation = permutation
+        return self._sort_permutation
+
     def get_data_mask(self):
         """get_data_mask() -> (data_array, mask_array)
 
@@ -218,10 +340,10 @@ class ArrayDataSource(AbstractDataSource):
             Whether the method returns None if *pt* is outside the range of
             the data source; if False, the method returns the value of the
             bound that *pt* is outside of.
-        """
-        if self.sort_order == "none":
-            raise NotImplementedError
 
+        If the data is not sorted, it is searched through the cached sort
+        permutation (see get_sort_permutation()).
+        """
         # index is ignored for dataseries with 1-dimensional indices
         minval, maxval = self._cached_bounds
         if pt < minval:
@@ -234,6 +356,12 @@ class ArrayDataSource(AbstractDataSource):
                 return None
             else:
                 return self._max_index
+        elif self.sort_order == "none":
+            permutation = self.get_sort_permutation()
+            if len(self._sorted_data) == 0:
+                return None
+            ndx = reverse_map_1d(self._sorted_data, pt, "ascending")
+            return int(permutation[ndx])
         else:
             return reverse_map_1d(self._data, pt, self.sort_order)
 
@@ -247,9 +375,6 @@ class ArrayDataSource(AbstractDataSource):
         If a data array is passed in, then that is used instead of self._data.
         This behavior is useful for subclasses.
         """
-        # TODO: as an optimization, perhaps create and cache a sorted
-        #       version of the dataset?
-
         if data is None:
             data = self.get_data()
 
@@ -280,8 +405,9 @@ class ArrayDataSource(AbstractDataSource):
                     # the data may be in a subclass of numpy.array, viewing
                     # the data as a ndarray will remove side effects of
                     # the subclasses, such as different operator behaviors
-                    self._min_index = bounded_nanargmin(data.view(ndarray))
-                    self._max_index = bounded_nanargmax(data.view(ndarray))
+                    self._min_index, self._max_index = nanargminmax(
+                        data.view(ndarray)
+                    )
                 except (TypeError, IndexError, NotImplementedError):
                     # For strings and objects, we punt...  These show up in
                     # label-ish data sources.
@@ -292,6 +418,44 @@ class ArrayDataSource(AbstractDataSource):
                 data[self._max_index],
             )
 
+    def _update_bounds(self, old_size, discarded, n_appended):
+        """Updates the bounds after values have been appended and discarded.
+
+        Falls back to recomputing the bounds from all of the data if the
+        discarded values included the old minimum or maximum.
+        """
+        data = self._data
+        kept = old_size - discarded
+        if (
+            self.sort_order != "none"
+            or kept < 2
+            or not np.issubdtype(data.dtype, np.number)
+            or not all(isfinite(self._cached_bounds))
+        ):
+            self._compute_bounds()
+            return
+
+        min_index = self._min_index % old_size - discarded
+        max_index = self._max_index % old_size - discarded
+        if min_index < 0 or max_index < 0:
+            self._compute_bounds()
+            return
+
+        if n_appended > 0:
+            start = len(data) - n_appended
+            new_data = data[start:].view(ndarray)
+            new_min, new_max = nanargminmax(new_data)
+            new_min = start + new_min % n_appended
+            new_max = start + new_max % n_appended
+            if data[new_min] < data[min_index]:
+                min_index = new_min
+            if data[new_max] > data[max_index]:
+                max_index = new_max
+
+        self._min_index = min_index
+        self._max_index = max_index
+        self._cached_bounds = (data[min_index], data[max_index])
+
     # ------------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------------
@@ -314,9 +478,16 @@ class ArrayDataSource(AbstractDataSource):
             state.pop("_cached_bounds", None)
             state.pop("_min_index", None)
             state.pop("_max_index", None)
+        state.pop("_lod_pyramid", None)
+        state.pop("_buffer", None)
+        state.pop("_sort_permutation", None)
+        state.pop("_sorted_data", None)
         return state
 
     def _post_load(self):
         super()._post_load()
         self._cached_bounds = ()
         self._cached_mask = None
+        self._lod_pyramid = None
+        self._buffer = None
+        self._sort_permutation = None
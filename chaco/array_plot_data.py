@@ -18,6 +18,7 @@ from traits.api import Dict
 # Local, relative imports
 from .abstract_plot_data import AbstractPlotData
 from .abstract_data_source import AbstractDataSource
+from .ring_buffer import RingBuffer
 
 
 class ArrayPlotData(AbstractPlotData):
@@ -42,6 +43,9 @@ class ArrayPlotData(AbstractPlotData):
     #: Consumers can write data to this object (overrides AbstractPlotData).
     writable = True
 
+    # The RingBuffers holding arrays which have been appended to.
+    _buffers = Dict
+
     def __init__(self, *data, **kw):
         """ArrayPlotData can be constructed by passing in arrays.
 
@@ -98,6 +102,7 @@ class ArrayPlotData(AbstractPlotData):
 
         if name in self.arrays:
             del self.arrays[name]
+            self._buffers.pop(name, None)
             self.data_changed = {"removed": [name]}
         else:
             raise KeyError("Data series '%s' does not exist." % name)
@@ -170,6 +175,53 @@ class ArrayPlotData(AbstractPlotData):
         self._update_data(data)
         self.data_changed = event
 
+    def append_data(self, name, new_data, capacity=None):
+        """Appends values to the end of the specified 1D array.
+
+        The array is kept in a RingBuffer, so appending takes amortized time
+        proportional to the number of new values.  The `data_changed` event
+        has an "appended" key mapping the name to the appended values, and a
+        "discarded" key mapping it to the number of values discarded from the
+        start of the array, which lets a Plot extend its data source rather
+        than replacing the data.  If *name* refers to a data source, the
+        values are appended to the data source instead.
+
+        Parameters
+        ----------
+        name : string
+            The name of the array to append to.  A new array is created if
+            the name does not exist.
+        new_data : array
+            The values to append.
+        capacity : int or None
+            If given, only the most recent *capacity* values are kept.
+        """
+        if not self.writable:
+            return None
+
+        current = self.arrays.get(name, None)
+        if isinstance(current, AbstractDataSource):
+            current.append_data(new_data, capacity)
+            return
+
+        buffer = self._buffers.get(name, None)
+        if buffer is None:
+            buffer = RingBuffer(current)
+            self._buffers[name] = buffer
+        old_size = len(buffer)
+        discarded = buffer.append(new_data, capacity)
+        data = buffer.get()
+        n_appended = len(data) - old_size + discarded
+
+        self.arrays[name] = data
+        if current is None:
+            self.data_changed = {"added": [name]}
+        else:
+            self.data_changed = {
+                "appended": {name: data[len(data) - n_appended:]},
+                "discarded": {name: discarded},
+            }
+
     def set_selection(self, name, selection):
         """Overrides AbstractPlotData to do nothing and not raise an error."""
         pass
@@ -207,5 +259,6 @@ class ArrayPlotData(AbstractPlotData):
                 data[name] = array(value)
             else:
                 data[name] = value
+            self._buffers.pop(name, None)
 
         self.arrays.update(data)
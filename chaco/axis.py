@@ -11,6 +11,7 @@
 """ Defines the PlotAxis class, and associated validator and UI.
 """
 import logging
+from collections import OrderedDict
 
 # Major library import
 from numpy import (
@@ -63,6 +64,99 @@ from .log_mapper import LogMapper
 logger = logging.getLogger(__name__)
 
 
+class TickLabelCache(object):
+    """A least recently used cache of measured tick labels.
+
+    Creating a Label and measuring its text is the most expensive part of
+    laying out an axis, and when a plot is panned or zoomed most of its tick
+    labels are the same as in the previous frame.  The labels are keyed by
+    their text and appearance, so all of the axes which share a cache also
+    share the labels they have in common.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of labels to keep.
+    """
+
+    def __init__(self, max_size=2048):
+        self.max_size = max_size
+        self._labels = OrderedDict()
+
+    def __len__(self):
+        return len(self._labels)
+
+    def clear(self):
+        """Discards all of the cached labels."""
+        self._labels.clear()
+
+    def get(self, gc, text, font, color, rotate_angle=0.0, margin=2):
+        """Returns a label and its bounding box, creating and measuring the
+        label if it is not in the cache.
+
+        The label and bounding box are shared, so they must not be modified.
+
+        Parameters
+        ----------
+        gc : GraphicsContext
+            The graphics context used to measure the label.
+        text : str
+            The text of the label.
+        font : kiva Font
+            The font of the label.
+        color : tuple
+            The RGBA color of the label.
+        rotate_angle : float
+            The rotation of the label, in degrees.
+        margin : int
+            The margin around the label.
+
+        Returns
+        -------
+        label : Label
+            The label.
+        bounding_box : array
+            The (width, height) of the label.
+        """
+        key = (
+            type(gc),
+            text,
+            font.face_name,
+            font.size,
+            font.family,
+            font.weight,
+            font.style,
+            font.underline,
+            font.encoding,
+            tuple(color),
+            rotate_angle,
+            margin,
+        )
+        labels = self._labels
+        entry = labels.get(key)
+        if entry is not None:
+            labels.move_to_end(key)
+            return entry
+
+        label = Label(
+            text=text,
+            font=font,
+            color=color,
+            rotate_angle=rotate_angle,
+            margin=margin,
+        )
+        bounding_box = array(label.get_bounding_box(gc), float64)
+        bounding_box.flags.writeable = False
+        entry = labels[key] = (label, bounding_box)
+        while len(labels) > max(self.max_size, 0):
+            labels.popitem(last=False)
+        return entry
+
+
+#: The cache of tick labels shared by all axes.
+TICK_LABEL_CACHE = TickLabelCache()
+
+
 def DEFAULT_TICK_FORMATTER(val):
     return ("%f" % val).rstrip("0").rstrip(".")
 
@@ -533,18 +627,7 @@ class PlotAxis(AbstractOverlay):
             else:
                 tick_list, labels = tmp
             # compute the labels here
-            self.ticklabel_cache = [
-                Label(
-                    text=lab,
-                    font=self.tick_label_font,
-                    color=self.tick_label_color,
-                )
-                for lab in labels
-            ]
-            self._tick_label_bounding_boxes = [
-                array(ticklabel.get_bounding_box(gc), float64)
-                for ticklabel in self.ticklabel_cache
-            ]
+            self._set_tick_labels(gc, labels, rotate_angle=0.0, margin=2)
         else:
             scale = "log" if isinstance(self.mapper, LogMapper) else "linear"
             if self.small_haxis_style:
@@ -587,24 +670,33 @@ class PlotAxis(AbstractOverlay):
             return
 
         formatter = self.tick_label_formatter
+        if formatter is None:
+            formatter = str
+
+        self._set_tick_labels(
+            gc,
+            [formatter(val) for val in self._tick_label_list],
+            rotate_angle=self.tick_label_rotate_angle,
+            margin=self.tick_label_margin,
+        )
 
-        def build_label(val):
-            tickstring = formatter(val) if formatter is not None else str(val)
-            return Label(
-                text=tickstring,
-                font=self.tick_label_font,
-                color=self.tick_label_color,
-                rotate_angle=self.tick_label_rotate_angle,
-                margin=self.tick_label_margin,
+    def _set_tick_labels(self, gc, texts, rotate_angle, margin):
+        """Sets the tick labels and their bounding boxes from the shared
+        cache of measured labels.
+        """
+        entries = [
+            TICK_LABEL_CACHE.get(
+                gc,
+                text,
+                self.tick_label_font,
+                self.tick_label_color_,
+                rotate_angle=rotate_angle,
+                margin=margin,
             )
-
-        self.ticklabel_cache = [
-            build_label(val) for val in self._tick_label_list
-        ]
-        self._tick_label_bounding_boxes = [
-            array(ticklabel.get_bounding_box(gc), float)
-            for ticklabel in self.ticklabel_cache
+            for text in texts
         ]
+        self.ticklabel_cache = [label for label, _ in entries]
+        self._tick_label_bounding_boxes = [bbox for _, bbox in entries]
 
     def _calculate_geometry(self):
         origin = self.origin
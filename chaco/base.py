@@ -33,6 +33,7 @@ from numpy import (
     seterr,
     sin,
     int8,
+    zeros,
 )
 
 # Enthought library imports
@@ -278,7 +279,51 @@ def point_line_distance(pt, p1, p2):
     return sqrt(dot(diff, diff))
 
 
-def intersect_range(x, low, high, mask=None):
+def sorted_range_slice(x, low, high, sort_order, pad=0):
+    """Find the window of a sorted 1D array which lies within a range
+
+    This uses two binary searches, so it is O(log N), and the returned slice
+    can be used to take zero-copy views of *x* and of any arrays that are
+    parallel to it.
+
+    Parameters
+    ----------
+    x : 1d array
+        The sorted array.
+    low : number
+        The low end of the range.
+    high : number
+        The high end of the range.
+    sort_order : string
+        "ascending" or "descending"
+    pad : int
+        The number of additional points to include on either side of the
+        window.  A *pad* of 1 keeps the endpoints of intervals which cross
+        the ends of the range, which is what polylines need.
+
+    Returns
+    -------
+    window : slice
+        The slice of *x* holding the points with ``low <= x <= high``, plus
+        *pad* points on either side.
+    """
+    n = len(x)
+    if sort_order == "ascending":
+        start = searchsorted(x, low, "left")
+        end = searchsorted(x, high, "right")
+    elif sort_order == "descending":
+        reversed_x = x[::-1]
+        start = n - searchsorted(reversed_x, high, "right")
+        end = n - searchsorted(reversed_x, low, "left")
+    else:
+        raise NotImplementedError(
+            "sorted_range_slice() requires a sorted array"
+        )
+    end = max(start, end)
+    return slice(max(start - pad, 0), min(end + pad, n))
+
+
+def intersect_range(x, low, high, mask=None, sort_order="none"):
     """Discard 1D intervals outside of range, with optional mask
 
     This is an optimized routine for detecting which points are endpoints
@@ -300,6 +345,10 @@ def intersect_range(x, low, high, mask=None):
     mask : 1d array of bools or None
         The mask of points to consider, or None.  If None then any non-finite
         points will be ignored.
+    sort_order : string
+        The sort order of *x*.  If it is "ascending" or "descending" then the
+        visible window is found by binary search and only the points in the
+        window are examined.
 
     Returns
     -------
@@ -308,7 +357,14 @@ def intersect_range(x, low, high, mask=None):
         potentially intersect the range.
     """
     # TODO: write a fast Cython version
-    # TODO: write an optimized version for ordered data
+    if sort_order in ("ascending", "descending"):
+        window = sorted_range_slice(x, low, high, sort_order, pad=1)
+        if mask is not None:
+            mask = mask[window]
+        result = zeros(len(x), dtype=bool)
+        result[window] = intersect_range(x[window], low, high, mask)
+        return result
+
     if mask is None:
         mask = isfinite(x)
 
@@ -8,13 +8,27 @@
 #
 # Thanks for using Enthought open source!
 
-from numpy import array, isscalar, issubdtype, linspace, number
+import logging
+from threading import Lock
+
+from numpy import (
+    array,
+    isfinite,
+    isscalar,
+    issubdtype,
+    linspace,
+    meshgrid,
+    number,
+    transpose,
+)
 
 # Enthought library imports
 from enable.api import ColorTrait
 from traits.api import (
+    Any,
     Bool,
     Constant,
+    Dict,
     Instance,
     Int,
     List,
@@ -26,8 +40,13 @@ from traits.api import (
 )
 
 # Local relative imports
+from ._workers import can_dispatch_to_ui, dispatch_to_ui, get_executor
 from .base_2d_plot import Base2DPlot
 from .color_mapper import ColorMapper
+from .plots.contour.contour import Cntr
+
+
+logger = logging.getLogger(__name__)
 
 
 class BaseContourPlot(Base2DPlot):
@@ -60,6 +79,12 @@ class BaseContourPlot(Base2DPlot):
     #: A global alpha value to apply to all the contours
     alpha = Range(0.0, 1.0, 1.0)
 
+    #: If True, the contours of new levels are traced in a worker thread, and
+    #: the plot draws the contours it already has until they are ready.  The
+    #: contours are traced synchronously if there is no UI event loop to
+    #: pass them back to.
+    trace_in_background = Bool(False)
+
     # ------------------------------------------------------------------------
     # Private traits
     # ------------------------------------------------------------------------
@@ -81,10 +106,33 @@ class BaseContourPlot(Base2DPlot):
     # a time.)
     _color_map_trait = ColorTrait
 
+    # The traced contours, keyed by (level,) for lines or by (low, high) for
+    # the polygons between two levels.
+    _trace_cache = Dict(transient=True)
+
+    # In the background mode, the traces of the previous data, drawn until
+    # the traces of the new data are ready.
+    _stale_traces = Dict(transient=True)
+
+    # The keys being traced in the worker thread.
+    _pending_traces = Instance(set, (), transient=True)
+
+    # Incremented when the data changes, so that traces of old data which
+    # arrive from the worker thread are discarded.
+    _data_version = Int(0, transient=True)
+
+    # The contour tracer of the data, and the data version it was built for.
+    _cntr = Any(transient=True)
+    _cntr_version = Int(-1, transient=True)
+
+    # Serializes the use of the contour tracer between threads.
+    _cntr_lock = Any(transient=True)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.color_mapper:
             self.color_mapper.observe(self._update_color_mapper, "updated")
+        self._cntr_lock = Lock()
 
     def _update_levels(self):
         """ Updates the levels cache.  """
@@ -149,6 +197,115 @@ class BaseContourPlot(Base2DPlot):
 
         self._colors_cache_valid = True
 
+    def _get_traces(self, keys):
+        """Returns a dict of the traces of the contours for the given keys.
+
+        Each key is either a ``(level,)`` tuple for the contour lines of a
+        level, or a ``(low, high)`` tuple for the polygons between two
+        levels.  Only the keys which are not in the cache are traced.  When
+        **trace_in_background** is True, they are traced in the worker
+        thread; until they are ready, they map to the traces of the previous
+        data if they are available, or to an empty list.
+        """
+        cache = self._trace_cache
+        missing = [key for key in keys if key not in cache]
+        if missing:
+            if self.trace_in_background and can_dispatch_to_ui():
+                self._trace_in_background(missing)
+            else:
+                cache.update(
+                    self._trace(missing, self._data_version, self._source())
+                )
+                self._stale_traces = {}
+
+        # keep only the traces which are in use
+        wanted = set(keys)
+        for key in list(cache):
+            if key not in wanted:
+                del cache[key]
+
+        stale = self._stale_traces
+        return {key: cache.get(key, stale.get(key, [])) for key in keys}
+
+    def _source(self):
+        """Returns the x and y coordinates, data and mask of valid points to
+        create a contour tracer from.
+        """
+        if self.value.is_masked():
+            data, mask = self.value.get_data_mask()
+            mask = mask & isfinite(data)
+        else:
+            data = self.value.get_data()
+            mask = isfinite(data)
+        x_data, y_data = self.index.get_data()
+        return x_data.get_data(), y_data.get_data(), data, mask
+
+    def _trace(self, keys, version, source):
+        """Traces the contours of the given keys.
+
+        The contour tracer is only created once per version of the data.
+        This may be called from the worker thread.
+        """
+        with self._cntr_lock:
+            if self._cntr is None or self._cntr_version != version:
+                # The tracer needs the coordinates of every point of the
+                # grid, and copies them, even for a regular grid.
+                xs, ys, data, mask = source
+                xg, yg = meshgrid(xs, ys)
+                # note: contour wants mask True in invalid locations
+                self._cntr = Cntr(xg, yg, data, ~mask)
+                self._cntr_version = version
+            cntr = self._cntr
+            return {
+                key: [transpose(trace) for trace in cntr.trace(*key)]
+                for key in keys
+            }
+
+    def _trace_in_background(self, keys):
+        """Traces the contours of the given keys in the worker thread, and
+        redraws the plot when they are ready.
+        """
+        keys = [key for key in keys if key not in self._pending_traces]
+        if not keys:
+            return
+        self._pending_traces.update(keys)
+        get_executor("contour").submit(
+            self._trace_in_worker, keys, self._data_version, self._source()
+        )
+
+    def _trace_in_worker(self, keys, version, source):
+        """Traces the contours of the given keys in the worker thread, and
+        passes them to the UI thread.
+        """
+        try:
+            traces = self._trace(keys, version, source)
+        except Exception:
+            logger.exception("Error tracing the contours of %s", self)
+            traces = {}
+        dispatch_to_ui(self._background_traces_done, keys, version, traces)
+
+    def _background_traces_done(self, keys, version, traces):
+        if version != self._data_version:
+            return
+        self._pending_traces.difference_update(keys)
+        self._trace_cache.update(traces)
+        if not self._pending_traces:
+            self._stale_traces = {}
+        self._traces_updated()
+
+    def _traces_updated(self):
+        """Called when traces computed in the background are ready."""
+        self.invalidate_and_redraw()
+
+    def _reset_traces(self):
+        """Discards the contour tracer and traces of the previous data."""
+        self._data_version += 1
+        if self.trace_in_background:
+            self._stale_traces.update(self._trace_cache)
+        self._trace_cache = {}
+        self._pending_traces = set()
+        self._cntr = None
+
     # ------------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------------
@@ -156,12 +313,14 @@ class BaseContourPlot(Base2DPlot):
     def _index_data_changed_fired(self):
         # If the index data has changed, the reset the levels cache (which
         # also triggers all the other caches to reset).
+        self._reset_traces()
         self._level_cache_valid = False
         self.invalidate_and_redraw()
 
     def _value_data_changed_fired(self):
         # If the index data has changed, the reset the levels cache (which
         # also triggers all the other caches to reset).
+        self._reset_traces()
         self._level_cache_valid = False
         self.invalidate_and_redraw()
 
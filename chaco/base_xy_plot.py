@@ -105,8 +105,8 @@ class BaseXYPlot(AbstractPlotRenderer):
     # ------------------------------------------------------------------------
 
     #: Does the plot use downsampling?
-    #: This is not used right now.  It needs an implementation of robust, fast
-    #: downsampling, which does not exist yet.
+    #: The BaseXYPlot implementation ignores this; renderers such as LinePlot
+    #: downsample their points in screen space when it is True.
     use_downsampling = Bool(False)
 
     #: Does the plot use a spatial subdivision structure for fast hit-testing?
@@ -434,19 +434,29 @@ class BaseXYPlot(AbstractPlotRenderer):
         if len(value_data) == 0 or len(index_data) == 0:
             return None
 
-        try:
-            # find the closest point to data_pt in index_data
-            ndx = reverse_map_1d(index_data, data_pt, self.index.sort_order)
-        except IndexError:
-            # if reverse_map raises this exception, it means that data_pt is
-            # outside the range of values in index_data.
-            if outside_returns_none:
+        if self.index.sort_order == "none":
+            # search through the sort permutation cached by the data source
+            ndx = self.index.reverse_map(
+                data_pt, outside_returns_none=outside_returns_none
+            )
+            if ndx is None:
                 return None
-            else:
-                if data_pt < index_data[0]:
-                    return 0
+        else:
+            try:
+                # find the closest point to data_pt in index_data
+                ndx = reverse_map_1d(
+                    index_data, data_pt, self.index.sort_order
+                )
+            except IndexError:
+                # if reverse_map raises this exception, it means that data_pt
+                # is outside the range of values in index_data.
+                if outside_returns_none:
+                    return None
                 else:
-                    return len(index_data) - 1
+                    if data_pt < index_data[0]:
+                        return 0
+                    else:
+                        return len(index_data) - 1
 
         if threshold == 0.0:
             # Don't do any threshold testing
@@ -11,6 +11,9 @@
 """ Defines the ColorMapper and ColorMapTemplate classes.
 """
 
+# Standard library imports
+import os
+
 # Major library imports
 import numpy as np
 from numpy import (
@@ -18,6 +21,7 @@ from numpy import (
     array,
     asarray,
     clip,
+    column_stack,
     divide,
     float32,
     int8,
@@ -51,10 +55,59 @@ from traits.api import (
 )
 
 # Relative imports
+from ._workers import get_executor
 from .abstract_colormap import AbstractColormap
 from .data_range_1d import DataRange1D
 
-from .speedups import map_colors, map_colors_uint8
+from .speedups import (
+    map_colors,
+    map_colors_rgba32,
+    map_lut_colors,
+    map_lut_indices,
+)
+
+
+# Arrays with at least this many values are mapped in several threads.
+PARALLEL_MAP_SIZE = 2 ** 22
+
+
+def map_colors_parallel(data_array, steps, low, high, lut, out=None):
+    """Maps colors from a packed RGBA lookup table to a data array.
+
+    This is :func:`chaco.speedups.map_colors_rgba32`, except that arrays of
+    at least **PARALLEL_MAP_SIZE** values are split into bands of rows which
+    are mapped in parallel threads.
+    """
+    data_array = asarray(data_array)
+    n_threads = min(os.cpu_count() or 1, 8)
+    if (
+        n_threads == 1
+        or data_array.size < PARALLEL_MAP_SIZE
+        or data_array.ndim == 0
+        or len(data_array) < n_threads
+    ):
+        return map_colors_rgba32(data_array, steps, low, high, lut, out=out)
+
+    if out is None:
+        out = np.empty(data_array.shape + (4,), dtype=uint8)
+    # the threads are shared by all color mappers
+    executor = get_executor("colormap", n_threads)
+    rows = linspace(0, len(data_array), n_threads + 1).astype(int)
+    futures = [
+        executor.submit(
+            map_colors_rgba32,
+            data_array[start:end],
+            steps,
+            low,
+            high,
+            lut,
+            out=out[start:end],
+        )
+        for start, end in zip(rows[:-1], rows[1:])
+    ]
+    for future in futures:
+        future.result()
+    return out
 
 
 class ColorMapTemplate(HasTraits):
@@ -317,24 +370,57 @@ class ColorMapper(AbstractColormap):
             self._segmentdata[name] = data[::-1]
         self._recalculate()
 
-    def map_uint8(self, data_array):
-        """Maps an array of data values to an array of colors."""
+    def map_uint8(self, data_array, out=None):
+        """Maps an array of data values to an array of colors.
+
+        If *out* is given, it must be a C-contiguous uint8 array with shape
+        ``data_array.shape + (4,)``, and the colors are written to it, so
+        that the array can be reused from one call to the next.
+        """
         if self._dirty:
             self._recalculate()
 
-        rgba = map_colors_uint8(
+        rgba = map_colors_parallel(
             data_array,
             self.steps,
             self.range.low,
             self.range.high,
-            self._red_lut_uint8,
-            self._green_lut_uint8,
-            self._blue_lut_uint8,
-            self._alpha_lut_uint8,
+            self._rgba_lut_uint8,
+            out=out,
         )
 
         return rgba
 
+    def map_lut_indices(self, data_array, out=None):
+        """Maps an array of data values to indices into the lookup table.
+
+        Mapping the indices with :meth:`map_lut_colors` gives the same colors
+        as :meth:`map_uint8`, so a caller can cache the indices of its data
+        and only look up the colors again when the palette changes.  The
+        indices remain valid as long as :meth:`lut_indices_key` returns an
+        equal value.
+        """
+        return map_lut_indices(
+            data_array, self.steps, self.range.low, self.range.high, out=out
+        )
+
+    def map_lut_colors(self, indices, out=None):
+        """Maps an array of indices from :meth:`map_lut_indices` to an array
+        of uint8 RGBA colors.
+        """
+        if self._dirty:
+            self._recalculate()
+
+        return map_lut_colors(
+            indices, self.steps, self._rgba_lut_uint8, out=out
+        )
+
+    def lut_indices_key(self):
+        """Returns a value which changes whenever the indices returned by
+        :meth:`map_lut_indices` for the same data would change.
+        """
+        return (self.steps, self.range.low, self.range.high)
+
     # ------------------------------------------------------------------------
     # Private methods
     # ------------------------------------------------------------------------
@@ -371,6 +457,14 @@ class ColorMapper(AbstractColormap):
         self._green_lut_uint8 = (self._green_lut * 255.0).astype("uint8")
         self._blue_lut_uint8 = (self._blue_lut * 255.0).astype("uint8")
         self._alpha_lut_uint8 = (self._alpha_lut * 255.0).astype("uint8")
+        self._rgba_lut_uint8 = column_stack(
+            [
+                self._red_lut_uint8,
+                self._green_lut_uint8,
+                self._blue_lut_uint8,
+                self._alpha_lut_uint8,
+            ]
+        )
         self.updated = True
         self._dirty = False
 
@@ -20,7 +20,8 @@ from numpy import compress, errstate, inf, isinf, isnan, ndarray
 
 # Enthought library imports
 from traits.api import (
-    Bool, CFloat, Constant, Enum, Float, Property, Callable, Union)
+    Any, Bool, CFloat, Constant, Dict, Enum, Float, Instance, Property,
+    Callable, Union)
 
 # Local relative imports
 from .base import arg_find_runs
@@ -107,6 +108,20 @@ class DataRange1D(BaseDataRange):
     # The actual numerical value for the high setting.
     _high_value = CFloat(inf)
 
+    # The bounds of each source as of the last time it was queried, or None
+    # for sources without data.
+    _source_bounds = Dict(transient=True)
+
+    # The sources whose data has changed since they were last queried.
+    _stale_sources = Instance(set, (), transient=True)
+
+    # The lowest and highest bounds over all sources, or None if no source
+    # has data.  Only meaningful if _data_bounds_valid is True.
+    _data_bounds = Any(transient=True)
+
+    # Whether _data_bounds is up to date with _source_bounds.
+    _data_bounds_valid = Bool(False, transient=True)
+
     # ------------------------------------------------------------------------
     # AbstractRange interface
     # ------------------------------------------------------------------------
@@ -205,14 +220,10 @@ class DataRange1D(BaseDataRange):
         """If any of the bounds is 'auto', this method refreshes the actual
         low and high values from the set of the view filters' data sources.
         """
-        if ("auto" in (self._low_setting, self._high_setting)) or (
-            "track" in (self._low_setting, self._high_setting)
-        ):
-            # If the user has hard-coded bounds, then refresh() doesn't do
-            # anything.
-            self._refresh_bounds()
-        else:
-            return
+        # re-query all of the sources
+        self._source_bounds = {}
+        self._data_bounds_valid = False
+        self._refresh_auto_bounds()
 
     # ------------------------------------------------------------------------
     # Private methods (getters and setters)
@@ -326,21 +337,20 @@ class DataRange1D(BaseDataRange):
     def _set_high_setting(self, val):
         self._do_set_high_setting(val, True)
 
-    def _refresh_bounds(self):
-        null_bounds = False
-        if len(self.sources) == 0:
-            null_bounds = True
-        else:
-            bounds_list = [
-                source.get_bounds()
-                for source in self.sources
-                if source.get_size() > 0
-            ]
+    def _refresh_auto_bounds(self):
+        if ("auto" in (self._low_setting, self._high_setting)) or (
+            "track" in (self._low_setting, self._high_setting)
+        ):
+            # If the user has hard-coded bounds, then refreshing doesn't do
+            # anything.
+            self._refresh_bounds()
 
-            if len(bounds_list) == 0:
-                null_bounds = True
+    def _refresh_bounds(self):
+        data_bounds = None
+        if len(self.sources) > 0:
+            data_bounds = self._get_data_bounds()
 
-        if null_bounds:
+        if data_bounds is None:
             # If we have no sources and our settings are "auto", then reset our
             # bounds to infinity; otherwise, set the _value to the corresponding
             # setting.
@@ -355,13 +365,11 @@ class DataRange1D(BaseDataRange):
             self.updated = (self._low_value, self._high_value)
             return
         else:
-            mins, maxes = zip(*bounds_list)
-
             low_start, high_start = calc_bounds(
                 self._low_setting,
                 self._high_setting,
-                mins,
-                maxes,
+                [data_bounds[0]],
+                [data_bounds[1]],
                 self.epsilon,
                 self.tight_bounds,
                 margin=self.margin,
@@ -374,6 +382,79 @@ class DataRange1D(BaseDataRange):
             self._high_value = high_start
             self.updated = (self._low_value, self._high_value)
 
+    def _get_data_bounds(self):
+        """Returns the lowest and highest bounds over all of the sources, or
+        None if no source has data.
+
+        Only sources which have not been queried, or whose data has changed,
+        are queried for their bounds.  The overall bounds are updated from the
+        changed sources alone unless a changed source held one of the
+        overall bounds and has shrunk, so updating a single source is usually
+        independent of the number of sources.
+        """
+        if not self._data_bounds_valid:
+            for source in self.sources:
+                if (
+                    source in self._stale_sources
+                    or source not in self._source_bounds
+                ):
+                    self._source_bounds[source] = _query_bounds(source)
+            self._stale_sources.clear()
+            self._aggregate_bounds()
+        else:
+            while self._stale_sources:
+                self._update_source_bounds(self._stale_sources.pop())
+        return self._data_bounds
+
+    def _update_source_bounds(self, source):
+        """Queries a single source and updates the overall bounds."""
+        old = self._source_bounds.get(source)
+        new = _query_bounds(source)
+        self._source_bounds[source] = new
+
+        total = self._data_bounds
+        if (
+            new is None
+            or total is None
+            or isnan(new[0]) or isnan(new[1])
+            or isnan(total[0]) or isnan(total[1])
+        ):
+            self._aggregate_bounds()
+            return
+
+        if new[0] <= total[0]:
+            low = new[0]
+        elif old is None or old[0] > total[0]:
+            low = total[0]
+        else:
+            # the source held the lowest bound and has shrunk
+            self._aggregate_bounds()
+            return
+
+        if new[1] >= total[1]:
+            high = new[1]
+        elif old is None or old[1] < total[1]:
+            high = total[1]
+        else:
+            self._aggregate_bounds()
+            return
+
+        self._data_bounds = (low, high)
+
+    def _aggregate_bounds(self):
+        """Recomputes the overall bounds from the cached source bounds."""
+        bounds_list = [
+            self._source_bounds[source]
+            for source in self.sources
+            if self._source_bounds.get(source) is not None
+        ]
+        if len(bounds_list) == 0:
+            self._data_bounds = None
+        else:
+            mins, maxes = zip(*bounds_list)
+            self._data_bounds = (min(mins), max(maxes))
+        self._data_bounds_valid = True
+
     def _do_track(self):
         changed = False
         if self._low_setting == "track":
@@ -394,18 +475,31 @@ class DataRange1D(BaseDataRange):
     # ------------------------------------------------------------------------
 
     def _sources_items_changed(self, event):
-        self.refresh()
         for source in event.removed:
-            source.observe(self.refresh, "data_changed", remove=True)
+            self._source_bounds.pop(source, None)
+            self._stale_sources.discard(source)
+        self._stale_sources.update(event.added)
+        self._data_bounds_valid = False
+        self._refresh_auto_bounds()
+        for source in event.removed:
+            source.observe(
+                self._source_data_changed, "data_changed", remove=True
+            )
         for source in event.added:
-            source.observe(self.refresh, "data_changed")
+            source.observe(self._source_data_changed, "data_changed")
 
     def _sources_changed(self, old, new):
         self.refresh()
         for source in old:
-            source.observe(self.refresh, "data_changed", remove=True)
+            source.observe(
+                self._source_data_changed, "data_changed", remove=True
+            )
         for source in new:
-            source.observe(self.refresh, "data_changed")
+            source.observe(self._source_data_changed, "data_changed")
+
+    def _source_data_changed(self, event):
+        self._stale_sources.add(event.object)
+        self._refresh_auto_bounds()
 
     # ------------------------------------------------------------------------
     # Serialization interface
@@ -415,6 +509,13 @@ class DataRange1D(BaseDataRange):
         self._sources_changed(None, self.sources)
 
 
+def _query_bounds(source):
+    """Returns the bounds of a data source, or None if it has no data."""
+    if source.get_size() > 0:
+        return source.get_bounds()
+    return None
+
+
 # method to calculate bounds for a given 1-dimensional set of data
 def calc_bounds(
     low_set,
@@ -8,7 +8,7 @@
 #
 # Thanks for using Enthought open source!
 
-from numpy import asarray, floor, ones
+from numpy import asarray, floor, ones, take
 
 from traits.api import Array, Str, observe
 from chaco.abstract_colormap import AbstractColormap
@@ -67,9 +67,9 @@ class DiscreteColorMapper(AbstractColormap):
         index = index.clip(0, len(self.palette) - 1).astype(int, copy=False)
         return index
 
-    def map_uint8(self, data):
+    def map_uint8(self, data, out=None):
         """ Maps an array of data to an array of colors """
-        return self._uint8_palette[self.map_index(data)]
+        return take(self._uint8_palette, self.map_index(data), axis=0, out=out)
 
     def reverse_colormap(self):
         """ Reverses the palette of this colormap. """
@@ -0,0 +1,35 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Defines the publicly accessible items of the Chaco downsampling package.
+
+- :func:`~.largest_triangle_three_buckets`
+- :func:`~.m4`
+- :func:`~.m4_rows`
+- :func:`~.min_max`
+- :func:`~.stride`
+- :class:`~.MinMaxPyramid`
+- :class:`~.IncrementalDownsampler`
+- :attr:`~.downsample_methods`
+- :func:`~.get_downsample_method`
+- :func:`~.register_downsample_method`
+"""
+
+from .extrema import m4, m4_rows, min_max
+from .incremental import IncrementalDownsampler
+from .lod_pyramid import MinMaxPyramid
+from .lttb import largest_triangle_three_buckets
+from .methods import (
+    downsample_methods,
+    get_downsample_method,
+    register_downsample_method,
+)
+from .stride import stride
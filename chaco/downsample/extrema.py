@@ -0,0 +1,201 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Downsampling methods which keep the extreme values of each bucket.
+"""
+import numpy as np
+
+
+def m4(points, n_buckets, bounds=None):
+    """Apply the M4 downsampling algorithm to data points
+
+    The index values are divided into *n_buckets* equal-width buckets and the
+    first, last, minimum and maximum points of each bucket are kept.  When
+    the buckets correspond to pixel columns, drawing the result as a
+    polyline is pixel-identical to drawing all of the points.
+
+    This function assumes that all values are finite.
+
+    Parameters
+    ----------
+    points : N, 2 array of float
+        The points as a N by 2 array of floats.
+    n_buckets : int
+        The number of buckets, usually the number of pixel columns.
+    bounds : (low, high) or None
+        The range of index values covered by the buckets.  Points outside
+        of the bounds are put in the first or last bucket.  If None, then the
+        range of the index values of the points is used.
+
+    Returns
+    -------
+    points : M, 2 array of float
+        The downsampled points, in their original order.
+
+    References
+    ----------
+
+    Uwe Jugel et al., "M4: A Visualization-Oriented Time Series Data
+    Aggregation," Proceedings of the VLDB Endowment 7 (10), 2014.
+    """
+    if n_buckets <= 0 or points.shape[0] <= 4 * n_buckets:
+        return points
+
+    starts = _bucket_starts(points[:, 0], n_buckets, bounds)
+    ends = np.append(starts[1:], points.shape[0])
+    argmin, argmax = _segment_extrema(points[:, 1], starts, ends)
+    positions = np.column_stack([starts, argmin, argmax, ends - 1])
+    return points[_ordered_unique(positions)]
+
+
+def m4_rows(x, ys, n_buckets, bounds=None, chunk_size=2 ** 20):
+    """Apply the M4 downsampling algorithm to several series which share
+    their index values.
+
+    The buckets are found once from *x*, and the first, last, minimum and
+    maximum points of each bucket are found for all of the rows of *ys* at
+    once.
+
+    This function assumes that all values are finite.
+
+    Parameters
+    ----------
+    x : N array of float
+        The monotone index values shared by the series.
+    ys : M, N array of float
+        The values of the series, one per row.
+    n_buckets : int
+        The number of buckets, usually the number of pixel columns.
+    bounds : (low, high) or None
+        The range of index values covered by the buckets, as for m4().
+    chunk_size : int
+        The approximate number of values processed at a time, to bound the
+        size of the temporary arrays.
+
+    Returns
+    -------
+    positions : M, K array of int
+        The positions into *x* of the points to keep for each row, in
+        order.  All of the rows keep the same number of points, so a row
+        may repeat a position.  If the series are too short to benefit from
+        downsampling, this is every position.
+    """
+    n_rows, n_points = ys.shape
+    if n_buckets <= 0 or n_points <= 4 * n_buckets:
+        return np.broadcast_to(np.arange(n_points), (n_rows, n_points))
+
+    starts = _bucket_starts(x, n_buckets, bounds)
+    ends = np.append(starts[1:], n_points)
+    segment = np.repeat(np.arange(len(starts)), ends - starts)
+    columns = np.arange(n_points)
+
+    positions = np.empty((n_rows, len(starts), 4), dtype=np.intp)
+    positions[:, :, 0] = starts
+    positions[:, :, 3] = ends - 1
+    step = max(1, chunk_size // n_points)
+    for low in range(0, n_rows, step):
+        rows = ys[low:low + step]
+        for reduce, column in ((np.minimum, 1), (np.maximum, 2)):
+            extremes = reduce.reduceat(rows, starts, axis=1)
+            # the first position of the extreme value in each bucket
+            candidates = np.where(
+                rows == extremes[:, segment], columns, n_points
+            )
+            positions[low:low + step, :, column] = np.minimum.reduceat(
+                candidates, starts, axis=1
+            )
+    positions.sort(axis=2)
+    return positions.reshape(n_rows, -1)
+
+
+def min_max(points, n_buckets, bounds=None):
+    """Downsample data points to the min/max envelope of each bucket
+
+    The index values are divided into *n_buckets* equal-width buckets and the
+    minimum and maximum points of each bucket are kept.
+
+    This function assumes that all values are finite.
+
+    Parameters
+    ----------
+    points : N, 2 array of float
+        The points as a N by 2 array of floats.
+    n_buckets : int
+        The number of buckets, usually the number of pixel columns.
+    bounds : (low, high) or None
+        The range of index values covered by the buckets.  Points outside
+        of the bounds are put in the first or last bucket.  If None, then the
+        range of the index values of the points is used.
+
+    Returns
+    -------
+    points : M, 2 array of float
+        The downsampled points, in their original order.
+    """
+    if n_buckets <= 0 or points.shape[0] <= 2 * n_buckets:
+        return points
+
+    starts = _bucket_starts(points[:, 0], n_buckets, bounds)
+    ends = np.append(starts[1:], points.shape[0])
+    argmin, argmax = _segment_extrema(points[:, 1], starts, ends)
+    positions = np.column_stack([argmin, argmax])
+    return points[_ordered_unique(positions)]
+
+
+def _bucket_starts(x, n_buckets, bounds):
+    """Returns the start positions of the runs of consecutive points of *x*
+    which fall into the same bucket.
+    """
+    if bounds is None:
+        low, high = x[0], x[-1]
+    else:
+        low, high = bounds
+    if low > high:
+        low, high = high, low
+    span = high - low
+    if not np.isfinite(span) or span <= 0:
+        return np.zeros(1, dtype=np.intp)
+
+    buckets = np.floor((x - low) * (n_buckets / span))
+    np.clip(buckets, 0, n_buckets - 1, out=buckets)
+    starts = np.flatnonzero(buckets[1:] != buckets[:-1]) + 1
+    return np.concatenate([[0], starts])
+
+
+def _segment_extrema(y, starts, ends):
+    """Returns the positions of the first minimum and first maximum of *y* in
+    each of the segments ``y[starts[i]:ends[i]]``.
+    """
+    segment = np.repeat(np.arange(len(starts)), ends - starts)
+    mins = np.minimum.reduceat(y, starts)
+    maxes = np.maximum.reduceat(y, starts)
+    argmin = _first_in_segment(y == mins[segment], segment, len(starts))
+    argmax = _first_in_segment(y == maxes[segment], segment, len(starts))
+    return argmin, argmax
+
+
+def _first_in_segment(mask, segment, n_segments):
+    """Returns the position of the first True value of *mask* in each
+    segment.  Every segment must contain at least one True value.
+    """
+    candidates = np.flatnonzero(mask)
+    first = np.searchsorted(segment[candidates], np.arange(n_segments))
+    return candidates[first]
+
+
+def _ordered_unique(positions):
+    """Sorts each row of an array of positions and returns the flattened
+    result with consecutive duplicates removed.
+    """
+    positions = np.sort(positions, axis=1).ravel()
+    keep = np.empty(len(positions), dtype=bool)
+    keep[0] = True
+    keep[1:] = positions[1:] != positions[:-1]
+    return positions[keep]
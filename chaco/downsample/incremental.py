@@ -0,0 +1,196 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Defines a cache which reuses downsampled data as the view is panned.
+"""
+from math import ceil, floor
+
+import numpy as np
+
+from chaco.base import arg_true_runs
+from .methods import get_downsample_method
+
+
+class IncrementalDownsampler(object):
+    """ Downsamples data over a fixed grid of buckets, caching the result.
+
+    The buckets have a fixed width in data units and are aligned to
+    multiples of that width, so when the view is panned at a fixed zoom
+    level the buckets which remain visible are unchanged.  Only the buckets
+    which are newly exposed at the edges of the view are downsampled, and
+    their points are added to the cached result.
+
+    The downsampled points are stored as a single N by 2 array sorted on the
+    index.  Breaks in the line, caused by NaNs in the data, are stored as
+    rows whose value is NaN.
+
+    Bucket-local methods such as "m4" and "min_max" give the same result as
+    downsampling the whole view at once, apart from rounding of samples which
+    lie exactly on a bucket boundary.  Sequential methods such
+    as "lttb" may choose slightly different points next to the boundaries
+    of each incrementally computed block.
+
+    The index data must be sorted in ascending order.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """ Discards all cached points. """
+        self.method_name = None
+        self.bucket_width = None
+        self.points = None
+        # the cached points cover buckets first_bucket to last_bucket - 1
+        self.first_bucket = 0
+        self.last_bucket = 0
+
+    def discard_outside(self, low, high):
+        """ Discards the cached buckets not entirely between low and high.
+
+        This is used when data is appended or discarded: the buckets which
+        only contain unchanged data remain valid.
+        """
+        if self.points is None:
+            return
+        width = self.bucket_width
+        first = max(self.first_bucket, floor(low / width) + 1)
+        last = min(self.last_bucket, floor(high / width))
+        if last <= first:
+            self.points = None
+        else:
+            self._trim(first, last)
+
+    def downsample(self, index, value, low, high, n_buckets, method="m4"):
+        """ Returns the downsampled points of the data between low and high.
+
+        Parameters
+        ----------
+        index, value : 1D arrays
+            The data; the index must be sorted in ascending order.
+        low, high : float
+            The visible range of index values.
+        n_buckets : int
+            The number of buckets between low and high, usually the number
+            of pixel columns spanned by the view.
+        method : str
+            The name of a registered downsampling method.
+
+        Returns
+        -------
+        points : N, 2 array of float
+            The downsampled points.  Rows with a NaN value separate the
+            runs of points which should be drawn as connected lines.
+        """
+        width = (high - low) / n_buckets
+        if (
+            method != self.method_name
+            or self.bucket_width is None
+            or abs(width - self.bucket_width) > 1e-9 * abs(width)
+        ):
+            self.clear()
+            self.method_name = method
+            self.bucket_width = width
+        width = self.bucket_width
+
+        # include a bucket on either side so that lines reach the edges
+        first = floor(low / width) - 1
+        last = ceil(high / width) + 1
+
+        if (
+            self.points is None
+            or last <= self.first_bucket
+            or first >= self.last_bucket
+        ):
+            self.points = self._compute(index, value, first, last)
+            self.first_bucket, self.last_bucket = first, last
+        else:
+            # Extend the cache by a little more than is needed, so that small
+            # pans do not each downsample a sliver of only a few buckets.
+            margin = max((last - first) // 8, 1)
+            if first < self.first_bucket:
+                new_first = first - margin
+                new_points = self._compute(
+                    index, value, new_first, self.first_bucket
+                )
+                self.points = np.concatenate([new_points, self.points])
+                self.first_bucket = new_first
+            if last > self.last_bucket:
+                new_last = last + margin
+                new_points = self._compute(
+                    index, value, self.last_bucket, new_last
+                )
+                self.points = np.concatenate([self.points, new_points])
+                self.last_bucket = new_last
+
+            # keep at most one view's width of buckets on either side
+            span = last - first
+            if self.last_bucket - self.first_bucket > 3 * span:
+                self._trim(
+                    max(self.first_bucket, first - span),
+                    min(self.last_bucket, last + span),
+                )
+
+        return self._select(first, last)
+
+    # ------------------------------------------------------------------------
+    # Private methods
+    # ------------------------------------------------------------------------
+
+    def _compute(self, index, value, first, last):
+        """ Downsamples the data in buckets first to last - 1. """
+        width = self.bucket_width
+        low = first * width
+        high = last * width
+        start = np.searchsorted(index, low, "left")
+        end = np.searchsorted(index, high, "left")
+        if end <= start:
+            return np.empty(shape=(0, 2))
+
+        index = index[start:end]
+        value = value[start:end]
+        finite = np.isfinite(index) & np.isfinite(value)
+        method = get_downsample_method(self.method_name)
+
+        pieces = []
+        if not finite[0]:
+            pieces.append(_break_at(low))
+        for run_start, run_end in arg_true_runs(finite):
+            points = np.column_stack(
+                [index[run_start:run_end], value[run_start:run_end]]
+            )
+            points = method(points, last - first, (low, high))
+            pieces.append(points)
+            pieces.append(_break_at(points[-1, 0]))
+        if finite[-1]:
+            # the data continues into the next block
+            pieces.pop()
+
+        if len(pieces) == 0:
+            return np.empty(shape=(0, 2))
+        return np.concatenate(pieces)
+
+    def _select(self, first, last):
+        """ Returns the cached points in buckets first to last - 1. """
+        x = self.points[:, 0]
+        start = np.searchsorted(x, first * self.bucket_width, "left")
+        end = np.searchsorted(x, last * self.bucket_width, "left")
+        return self.points[start:end]
+
+    def _trim(self, first, last):
+        """ Discards the cached points outside buckets first to last - 1. """
+        self.points = self._select(first, last)
+        self.first_bucket = first
+        self.last_bucket = last
+
+
+def _break_at(x):
+    """ Returns a line-break row located at index value *x*. """
+    return np.array([[x, np.nan]])
@@ -0,0 +1,297 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Defines a multi-resolution min/max pyramid for level-of-detail rendering.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+#: One level of a MinMaxPyramid.  Each of the array fields has one entry
+#: per bucket; the position fields are indices into the original data, and
+#: the minimum and maximum fields are the values at argmin and argmax (inf
+#: and -inf for buckets without finite samples).
+PyramidLevel = namedtuple(
+    "PyramidLevel",
+    [
+        "bucket_size",
+        "first",
+        "last",
+        "argmin",
+        "argmax",
+        "count",
+        "minimum",
+        "maximum",
+    ],
+)
+
+
+class MinMaxPyramid(object):
+    """ A level-of-detail pyramid of per-bucket extreme samples.
+
+    Level ``k`` of the pyramid splits the data into consecutive buckets of
+    ``base_size * factor**k`` samples.  For every bucket it records the
+    positions of the first and last finite samples, the positions of the
+    minimum and maximum samples, and the number of finite samples in the
+    bucket.  The finite count is used to keep track of NaN runs: a bucket
+    whose count is smaller than its length contains a gap in the data.
+
+    Drawing the first, minimum, maximum and last sample of every bucket
+    (the "M4" scheme) is visually indistinguishable from drawing all of the
+    data when there is at least one bucket per screen pixel, so a renderer
+    only needs to touch ``O(pixels)`` entries of the pyramid to draw any
+    window of the data.
+
+    Building the pyramid reads the data once, in order, and coarser levels
+    are built from the finer ones without reading the data again, so the
+    data can be a numpy.memmap which is too large to be held in memory.
+    The pyramid can be saved with to_arrays() and restored with
+    from_arrays(), to avoid building it again.
+
+    Parameters
+    ----------
+    data : 1D array
+        The data to summarize.
+    base_size : int
+        The number of samples in each bucket of the finest level.
+    factor : int
+        The ratio of bucket sizes between successive levels.
+    """
+
+    def __init__(self, data, base_size=64, factor=4):
+        if base_size < 2 or factor < 2:
+            raise ValueError("base_size and factor must both be at least 2")
+        self.data = np.asarray(data)
+        self.size = len(self.data)
+        self.base_size = base_size
+        self.factor = factor
+        self.levels = []
+
+        if self.size > base_size:
+            level = _reduce_data(self.data, base_size)
+            self.levels.append(level)
+            while len(level.count) > factor:
+                level = _reduce_level(level, factor)
+                self.levels.append(level)
+
+    @classmethod
+    def from_arrays(cls, data, arrays):
+        """ Restores a pyramid saved with to_arrays().
+
+        Parameters
+        ----------
+        data : 1D array
+            The data summarized by the pyramid.
+        arrays : dict
+            The arrays returned by to_arrays(), for example as read back
+            with numpy.load().
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not a pyramid of data of the size of *data*.
+        """
+        pyramid = cls.__new__(cls)
+        pyramid.data = np.asarray(data)
+        pyramid.size = len(pyramid.data)
+        pyramid.base_size = int(arrays["base_size"])
+        pyramid.factor = int(arrays["factor"])
+        if int(arrays["size"]) != pyramid.size:
+            raise ValueError(
+                "the pyramid summarizes {} samples, not {}".format(
+                    int(arrays["size"]), pyramid.size
+                )
+            )
+        pyramid.levels = []
+        bucket_size = pyramid.base_size
+        for k in range(int(arrays["n_levels"])):
+            fields = [
+                arrays["level{}_{}".format(k, field)]
+                for field in PyramidLevel._fields[1:]
+            ]
+            pyramid.levels.append(PyramidLevel(bucket_size, *fields))
+            bucket_size *= pyramid.factor
+        return pyramid
+
+    def to_arrays(self):
+        """ Returns a dictionary of arrays from which from_arrays() can
+        restore the pyramid, for example to save with numpy.savez().
+        """
+        arrays = {
+            "size": np.array(self.size),
+            "base_size": np.array(self.base_size),
+            "factor": np.array(self.factor),
+            "n_levels": np.array(len(self.levels)),
+        }
+        for k, level in enumerate(self.levels):
+            for field in PyramidLevel._fields[1:]:
+                arrays["level{}_{}".format(k, field)] = getattr(level, field)
+        return arrays
+
+    def select_level(self, n_samples, n_buckets):
+        """ Returns the coarsest level that has at least *n_buckets* buckets
+        spanning *n_samples* samples, or None if no level is fine enough and
+        the raw data should be used instead.
+        """
+        selected = None
+        for level in self.levels:
+            if n_samples < level.bucket_size * n_buckets:
+                break
+            selected = level
+        return selected
+
+    def gather(self, start, end, n_buckets):
+        """ Returns the positions of the samples needed to draw a window.
+
+        Parameters
+        ----------
+        start, end : int
+            The window of data to draw, as a slice ``data[start:end]``.
+        n_buckets : int
+            The minimum number of buckets the window should be split into;
+            usually the width of the window in screen pixels.
+
+        Returns
+        -------
+        runs : list of 1D int arrays or None
+            Sorted positions into the data, split into runs which should be
+            drawn as separate connected lines.  Returns None if the window
+            is too small to benefit from the pyramid.
+        """
+        start = max(start, 0)
+        end = min(end, self.size)
+        level = self.select_level(end - start, max(n_buckets, 1))
+        if level is None:
+            return None
+
+        size = level.bucket_size
+        first_bucket = start // size
+        last_bucket = min(-(-end // size), len(level.count))
+        if last_bucket <= first_bucket:
+            return []
+
+        window = slice(first_bucket, last_bucket)
+        count = level.count[window]
+        positions = np.column_stack(
+            [
+                level.first[window],
+                level.argmin[window],
+                level.argmax[window],
+                level.last[window],
+            ]
+        )
+        positions.sort(axis=1)
+
+        # The last bucket of the data may be shorter than the others.
+        bucket_starts = np.arange(first_bucket, last_bucket) * size
+        lengths = np.minimum(size, self.size - bucket_starts)
+
+        # Lines are broken on either side of any bucket which contains NaNs.
+        solid = count == lengths
+        breaks = np.nonzero(~(solid[:-1] & solid[1:]))[0] + 1
+
+        runs = []
+        for run_positions, run_count in zip(
+            np.split(positions, breaks), np.split(count, breaks)
+        ):
+            run_positions = run_positions[run_count > 0].ravel()
+            if len(run_positions) > 0:
+                keep = np.empty(len(run_positions), dtype=bool)
+                keep[0] = True
+                keep[1:] = run_positions[1:] != run_positions[:-1]
+                runs.append(run_positions[keep])
+        return runs
+
+
+def _reduce_data(data, size, chunk_samples=2 ** 22):
+    """ Builds the finest pyramid level directly from the data.
+
+    The data is processed in chunks of about *chunk_samples* samples so that
+    the temporary arrays stay small regardless of the size of the data.
+    """
+    n_samples = len(data)
+    n_buckets = -(-n_samples // size)
+    first = np.empty(n_buckets, dtype=np.intp)
+    last = np.empty(n_buckets, dtype=np.intp)
+    argmin = np.empty(n_buckets, dtype=np.intp)
+    argmax = np.empty(n_buckets, dtype=np.intp)
+    count = np.empty(n_buckets, dtype=np.intp)
+    minimum = np.empty(n_buckets)
+    maximum = np.empty(n_buckets)
+
+    chunk_buckets = max(1, chunk_samples // size)
+    for low in range(0, n_buckets, chunk_buckets):
+        high = min(low + chunk_buckets, n_buckets)
+        chunk = data[low * size:high * size].astype(float)
+        if len(chunk) < (high - low) * size:
+            # pad the final partial bucket with NaNs
+            padded = np.full((high - low) * size, np.nan)
+            padded[:len(chunk)] = chunk
+            chunk = padded
+        blocks = chunk.reshape(high - low, size)
+        finite = np.isfinite(blocks)
+        offsets = np.arange(low, high) * size
+
+        count[low:high] = finite.sum(axis=1)
+        first[low:high] = offsets + finite.argmax(axis=1)
+        last[low:high] = offsets + size - 1 - finite[:, ::-1].argmax(axis=1)
+        low_blocks = np.where(finite, blocks, np.inf)
+        high_blocks = np.where(finite, blocks, -np.inf)
+        argmin[low:high] = offsets + low_blocks.argmin(axis=1)
+        argmax[low:high] = offsets + high_blocks.argmax(axis=1)
+        minimum[low:high] = low_blocks.min(axis=1)
+        maximum[low:high] = high_blocks.max(axis=1)
+
+    return PyramidLevel(
+        size, first, last, argmin, argmax, count, minimum, maximum
+    )
+
+
+def _reduce_level(child, factor):
+    """ Builds a pyramid level by merging *factor* buckets of *child*.
+    """
+    n_children = len(child.count)
+    n_buckets = -(-n_children // factor)
+    pad = n_buckets * factor - n_children
+
+    def grouped(ary, fill=0):
+        if pad:
+            ary = np.concatenate([ary, np.full(pad, fill, dtype=ary.dtype)])
+        return ary.reshape(n_buckets, factor)
+
+    child_count = grouped(child.count)
+    child_argmin = grouped(child.argmin)
+    child_argmax = grouped(child.argmax)
+    occupied = child_count > 0
+    rows = np.arange(n_buckets)
+
+    first = grouped(child.first)[rows, occupied.argmax(axis=1)]
+    last = grouped(child.last)[
+        rows, factor - 1 - occupied[:, ::-1].argmax(axis=1)
+    ]
+    mins = grouped(child.minimum, np.inf)
+    maxes = grouped(child.maximum, -np.inf)
+    min_children = mins.argmin(axis=1)
+    max_children = maxes.argmax(axis=1)
+    argmin = child_argmin[rows, min_children]
+    argmax = child_argmax[rows, max_children]
+    count = child_count.sum(axis=1)
+
+    return PyramidLevel(
+        child.bucket_size * factor,
+        first,
+        last,
+        argmin,
+        argmax,
+        count,
+        mins[rows, min_children],
+        maxes[rows, max_children],
+    )
@@ -8,7 +8,8 @@
 #
 # Thanks for using Enthought open source!
 import logging
-import platform
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,8 @@ try:
 except ImportError:
     _lttb = None
     logger.warning(
-        "Can't import _lttb extension module, lttb downsampling will not work."
+        "Can't import _lttb extension module, lttb downsampling will use a "
+        "slower NumPy implementation."
     )
 
 
@@ -54,5 +56,42 @@ def largest_triangle_three_buckets(points, n_buckets):
     if _lttb is not None:
         return _lttb.lttb(points, n_buckets)
     else:
-        # can't downsample, do nothing, but better than crashing
-        return points
+        return _lttb_fallback(points, n_buckets)
+
+
+def _lttb_fallback(points, n_buckets):
+    """NumPy implementation of the largest triangle three buckets algorithm
+
+    This is used when the _lttb extension module is not available.  It loops
+    over the buckets in Python, but the work within each bucket is
+    vectorized, so it is O(n_buckets) Python operations.
+    """
+    points = np.asarray(points, dtype=float)
+    data_length = points.shape[0]
+    sampled = np.empty(shape=(n_buckets, 2), dtype=float)
+    sampled[0] = points[0]
+    sampled[-1] = points[-1]
+
+    bucket_size = (data_length - 2.0) / (n_buckets - 2.0)
+    # bucket i covers points[edges[i]:edges[i + 1]]; the final bucket is the
+    # last point on its own.
+    edges = (np.arange(n_buckets) * bucket_size).astype(np.intp) + 1
+    edges = np.minimum(edges, data_length)
+    sums = np.add.reduceat(points, edges[:-1], axis=0)
+    averages = sums / np.diff(edges)[:, np.newaxis]
+
+    a = points[0]
+    for i in range(n_buckets - 2):
+        bucket = points[edges[i]:edges[i + 1]]
+        if len(bucket) == 0:
+            sampled[i + 1] = a
+            continue
+        avg_x, avg_y = averages[i + 1]
+        area = np.abs(
+            (a[0] - avg_x) * (bucket[:, 1] - a[1])
+            - (a[0] - bucket[:, 0]) * (avg_y - a[1])
+        )
+        a = bucket[np.argmax(area)]
+        sampled[i + 1] = a
+
+    return sampled
@@ -0,0 +1,66 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Registry of the downsampling methods available to renderers.
+
+Every downsampling method is a callable with the signature
+``method(points, n_buckets, bounds=None)``, where *points* is an N by 2
+array of finite (index, value) points with monotone index values,
+*n_buckets* is the target resolution (usually the number of pixel columns
+spanned by *bounds*) and *bounds* is the (low, high) range of index values
+being displayed.  It returns an M by 2 array of points.
+"""
+from .extrema import m4, min_max
+from .lttb import largest_triangle_three_buckets
+from .stride import stride
+
+
+def lttb(points, n_buckets, bounds=None):
+    """Largest triangle three buckets downsampling; *bounds* is ignored.
+    """
+    return largest_triangle_three_buckets(points, n_buckets)
+
+
+#: The registered downsampling methods, keyed by name.
+downsample_methods = {
+    "lttb": lttb,
+    "m4": m4,
+    "min_max": min_max,
+    "stride": stride,
+}
+
+
+def register_downsample_method(name, method):
+    """Registers a downsampling method under the given name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the method, as used by a renderer's
+        ``downsample_method`` trait.
+    method : callable
+        A callable with the signature ``method(points, n_buckets, bounds)``.
+    """
+    downsample_methods[name] = method
+
+
+def get_downsample_method(name):
+    """Returns the downsampling method registered under *name*.
+
+    Raises a ValueError if there is no such method.
+    """
+    try:
+        return downsample_methods[name]
+    except KeyError:
+        raise ValueError(
+            "Unknown downsampling method '{}'; expected one of {}".format(
+                name, sorted(downsample_methods)
+            )
+        ) from None
@@ -0,0 +1,44 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Stride (decimation) downsampling.
+"""
+import numpy as np
+
+
+def stride(points, n_buckets, bounds=None):
+    """Downsample data points by keeping every k-th point
+
+    This is the cheapest downsampling method, but it can miss narrow peaks.
+    The first and last points are always kept.
+
+    Parameters
+    ----------
+    points : N, 2 array of float
+        The points as a N by 2 array of floats.
+    n_buckets : int
+        The approximate number of points to keep.
+    bounds : (low, high) or None
+        Ignored; accepted for compatibility with the other methods.
+
+    Returns
+    -------
+    points : M, 2 array of float
+        The downsampled points.
+    """
+    n_points = points.shape[0]
+    if n_buckets <= 0 or n_points <= n_buckets:
+        return points
+
+    step = -(-n_points // n_buckets)
+    positions = np.arange(0, n_points, step)
+    if positions[-1] != n_points - 1:
+        positions = np.append(positions, n_points - 1)
+    return points[positions]
@@ -0,0 +1,88 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from ..extrema import m4
+from ..incremental import IncrementalDownsampler
+from ..methods import downsample_methods, register_downsample_method
+
+
+class TestIncrementalDownsampler(unittest.TestCase):
+    def setUp(self):
+        # offset the samples so that none lie exactly on a bucket boundary
+        self.index = np.linspace(0.0, 100.0, 1000001) + 3.3e-5
+        self.value = np.sin(self.index * 7)
+        self.value[500000] = 3.0
+        self.n_downsampled = 0
+
+        def counting_m4(points, n_buckets, bounds=None):
+            self.n_downsampled += len(points)
+            return m4(points, n_buckets, bounds)
+
+        register_downsample_method("counting_m4", counting_m4)
+        self.addCleanup(downsample_methods.pop, "counting_m4")
+
+    def test_pan_only_downsamples_new_data(self):
+        cache = IncrementalDownsampler()
+        cache.downsample(
+            self.index, self.value, 40.0, 60.0, 200, "counting_m4"
+        )
+        initial = self.n_downsampled
+        self.assertGreater(initial, 190000)
+
+        self.n_downsampled = 0
+        points = cache.downsample(
+            self.index, self.value, 40.5, 60.5, 200, "counting_m4"
+        )
+
+        # at most an eighth of the view plus the pan distance is new
+        self.assertLess(self.n_downsampled, initial / 4)
+        self.assertEqual(np.nanmax(points[:, 1]), 3.0)
+        self.assertLessEqual(points[0, 0], 40.5)
+        self.assertGreaterEqual(points[-1, 0], 60.5)
+        self.assertTrue(np.all(np.diff(points[:, 0]) >= 0))
+
+    def test_matches_full_downsample(self):
+        cache = IncrementalDownsampler()
+        cache.downsample(self.index, self.value, 40.0, 60.0, 200, "m4")
+        panned = cache.downsample(
+            self.index, self.value, 45.0, 65.0, 200, "m4"
+        )
+
+        fresh = IncrementalDownsampler().downsample(
+            self.index, self.value, 45.0, 65.0, 200, "m4"
+        )
+
+        assert_array_equal(panned, fresh)
+
+    def test_zoom_resets_cache(self):
+        cache = IncrementalDownsampler()
+        cache.downsample(self.index, self.value, 40.0, 60.0, 200, "m4")
+        width = cache.bucket_width
+
+        cache.downsample(self.index, self.value, 45.0, 55.0, 200, "m4")
+
+        self.assertAlmostEqual(cache.bucket_width, width / 2)
+
+    def test_nan_breaks(self):
+        value = self.value.copy()
+        value[500100:500200] = np.nan
+        cache = IncrementalDownsampler()
+
+        points = cache.downsample(self.index, value, 40.0, 60.0, 200, "m4")
+
+        breaks = np.isnan(points[:, 1])
+        self.assertEqual(breaks.sum(), 1)
+        break_x = points[breaks, 0][0]
+        self.assertTrue(50.0 < break_x < 50.02)
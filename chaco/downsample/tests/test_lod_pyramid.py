@@ -0,0 +1,118 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from ..lod_pyramid import MinMaxPyramid
+
+
+class TestMinMaxPyramid(unittest.TestCase):
+    def test_levels(self):
+        data = np.random.RandomState(0).normal(size=10000)
+        pyramid = MinMaxPyramid(data, base_size=16, factor=4)
+
+        sizes = [level.bucket_size for level in pyramid.levels]
+        self.assertEqual(sizes, [16, 64, 256, 1024, 4096])
+        for level in pyramid.levels:
+            self.assertEqual(data[level.argmin].min(), data.min())
+            self.assertEqual(data[level.argmax].max(), data.max())
+            self.assertEqual(level.count.sum(), len(data))
+
+    def test_small_data_has_no_levels(self):
+        pyramid = MinMaxPyramid(np.arange(10.0))
+
+        self.assertEqual(pyramid.levels, [])
+        self.assertIsNone(pyramid.gather(0, 10, 5))
+
+    def test_gather_preserves_extremes(self):
+        data = np.sin(np.linspace(0, 100, 100000))
+        data[54321] = 5.0
+        data[12345] = -5.0
+        pyramid = MinMaxPyramid(data, base_size=16)
+
+        runs = pyramid.gather(0, len(data), 200)
+
+        self.assertEqual(len(runs), 1)
+        positions = runs[0]
+        self.assertLess(len(positions), 4 * len(data) // 200)
+        self.assertTrue(np.all(np.diff(positions) > 0))
+        self.assertIn(54321, positions)
+        self.assertIn(12345, positions)
+        self.assertEqual(positions[0], 0)
+        self.assertEqual(positions[-1], len(data) - 1)
+
+    def test_gather_breaks_on_nans(self):
+        data = np.arange(10000.0)
+        data[5000:5100] = np.nan
+        data[9000:] = np.nan
+        pyramid = MinMaxPyramid(data, base_size=16)
+
+        runs = pyramid.gather(0, len(data), 50)
+
+        positions = np.concatenate(runs)
+        self.assertGreater(len(runs), 1)
+        self.assertFalse(np.any(np.isnan(data[positions])))
+        for run in runs:
+            # no run may bridge the NaN gap
+            self.assertFalse(run[0] < 5000 and run[-1] >= 5100)
+
+    def test_gather_window(self):
+        data = np.arange(100000.0)
+        pyramid = MinMaxPyramid(data, base_size=16)
+
+        runs = pyramid.gather(40000, 60000, 100)
+
+        positions = np.concatenate(runs)
+        level = pyramid.select_level(20000, 100)
+        self.assertGreaterEqual(positions.min(), 40000 - level.bucket_size)
+        self.assertLess(positions.max(), 60000 + level.bucket_size)
+        assert_array_equal(np.sort(positions), positions)
+
+    def test_to_and_from_arrays(self):
+        data = np.random.RandomState(0).normal(size=10000)
+        data[100:200] = np.nan
+        pyramid = MinMaxPyramid(data, base_size=16, factor=4)
+
+        restored = MinMaxPyramid.from_arrays(data, pyramid.to_arrays())
+
+        self.assertEqual(restored.base_size, 16)
+        self.assertEqual(restored.factor, 4)
+        self.assertEqual(len(restored.levels), len(pyramid.levels))
+        for level, restored_level in zip(pyramid.levels, restored.levels):
+            self.assertEqual(level.bucket_size, restored_level.bucket_size)
+            for field in level._fields[1:]:
+                assert_array_equal(
+                    getattr(level, field), getattr(restored_level, field)
+                )
+        for run, restored_run in zip(
+            pyramid.gather(0, 10000, 50), restored.gather(0, 10000, 50)
+        ):
+            assert_array_equal(run, restored_run)
+
+        with self.assertRaises(ValueError):
+            MinMaxPyramid.from_arrays(data[:-1], pyramid.to_arrays())
+
+    def test_level_extremes(self):
+        data = np.random.RandomState(0).normal(size=1000)
+        data[:64] = np.nan
+        pyramid = MinMaxPyramid(data, base_size=16, factor=4)
+
+        for level in pyramid.levels:
+            occupied = level.count > 0
+            assert_array_equal(
+                level.minimum[occupied], data[level.argmin[occupied]]
+            )
+            assert_array_equal(
+                level.maximum[occupied], data[level.argmax[occupied]]
+            )
+            self.assertTrue(np.all(np.isinf(level.minimum[~occupied])))
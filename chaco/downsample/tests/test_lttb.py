@@ -15,7 +15,7 @@ import platform
 import numpy as np
 from numpy.testing import assert_array_equal, assert_almost_equal
 
-from ..lttb import largest_triangle_three_buckets, _lttb
+from ..lttb import largest_triangle_three_buckets, _lttb, _lttb_fallback
 
 
 TIMING_SETUP = """
@@ -173,3 +173,44 @@ class TestLargestTriangleThreeBuckets(unittest.TestCase):
         result = largest_triangle_three_buckets(a, n_buckets)
 
         assert_array_equal(result, [[0.0, 0.0]] * 3)
+
+
+class TestLargestTriangleThreeBucketsFallback(unittest.TestCase):
+    def test_spike(self):
+        a = np.empty(shape=(31, 2))
+        a[:, 0] = np.linspace(0.0, 3.0, 31)
+        a[:, 1] = np.linspace(0.0, 3.0, 31)
+        a[15, 1] = 100.0
+
+        result = _lttb_fallback(a, 5)
+
+        assert_almost_equal(
+            result,
+            [
+                [0.0, 0.0],
+                [0.9, 0.9],
+                [1.5, 100],
+                [2.0, 2.0],
+                [3.0, 3.0],
+            ],
+        )
+
+    def test_concave_down(self):
+        a = np.empty(shape=(101, 2))
+        a[:, 0] = np.linspace(0.0, 10.0, 101)
+        a[:, 1] = -np.linspace(0.0, 10.0, 101) ** 2
+
+        result = _lttb_fallback(a, 12)
+
+        expected_points = np.array(
+            [0.0, 0.8, 1.7, 2.6, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.2, 10.0]
+        )
+        assert_almost_equal(result[:, 0], expected_points)
+        assert_almost_equal(result[:, 1], -(expected_points ** 2))
+
+    @unittest.skipIf(_lttb is None, "extension is not compiled")
+    def test_matches_extension(self):
+        random = np.random.RandomState(0)
+        a = np.column_stack([np.sort(random.rand(5000)), random.rand(5000)])
+
+        assert_almost_equal(_lttb_fallback(a, 100), _lttb.lttb(a, 100))
@@ -0,0 +1,137 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from ..methods import (
+    downsample_methods,
+    get_downsample_method,
+    register_downsample_method,
+)
+from ..extrema import m4, m4_rows, min_max
+from ..stride import stride
+
+
+def make_points(n=100000):
+    points = np.empty(shape=(n, 2))
+    points[:, 0] = np.linspace(0.0, 10.0, n)
+    points[:, 1] = np.sin(points[:, 0] * 20)
+    points[n // 8, 1] = 5.0
+    points[n // 2, 1] = -5.0
+    return points
+
+
+class TestM4(unittest.TestCase):
+    def test_keeps_bucket_extremes(self):
+        points = make_points()
+
+        result = m4(points, 100, (0.0, 10.0))
+
+        self.assertLessEqual(len(result), 400)
+        assert_array_equal(result[0], points[0])
+        assert_array_equal(result[-1], points[-1])
+        self.assertTrue(np.all(np.diff(result[:, 0]) > 0))
+        self.assertIn(5.0, result[:, 1])
+        self.assertIn(-5.0, result[:, 1])
+
+        # every bucket has the same extrema as the raw data
+        buckets = np.floor(points[:, 0] * 10).clip(0, 99)
+        result_buckets = np.floor(result[:, 0] * 10).clip(0, 99)
+        for i in (0, 17, 99):
+            raw = points[buckets == i, 1]
+            kept = result[result_buckets == i, 1]
+            self.assertEqual(raw.min(), kept.min())
+            self.assertEqual(raw.max(), kept.max())
+
+    def test_small_input_unchanged(self):
+        points = make_points(100)
+
+        self.assertIs(m4(points, 100), points)
+
+    def test_descending_index(self):
+        points = make_points()[::-1]
+
+        result = m4(points, 100, (0.0, 10.0))
+
+        self.assertTrue(np.all(np.diff(result[:, 0]) < 0))
+        self.assertIn(5.0, result[:, 1])
+
+
+class TestM4Rows(unittest.TestCase):
+    def test_same_points_as_m4(self):
+        points = make_points()
+        ys = np.array([points[:, 1], -points[:, 1], np.cos(points[:, 0])])
+
+        positions = m4_rows(points[:, 0], ys, 100, (0.0, 10.0), 5000)
+
+        self.assertEqual(positions.shape[0], 3)
+        self.assertLessEqual(positions.shape[1], 400)
+        for row, row_positions in zip(ys, positions):
+            row_points = np.column_stack([points[:, 0], row])
+            expected = m4(row_points, 100, (0.0, 10.0))
+            assert_array_equal(
+                np.unique(row_points[row_positions], axis=0),
+                np.unique(expected, axis=0),
+            )
+            self.assertTrue(np.all(np.diff(row_positions) >= 0))
+
+    def test_small_input_unchanged(self):
+        points = make_points(100)
+        ys = np.array([points[:, 1]] * 2)
+
+        positions = m4_rows(points[:, 0], ys, 100)
+
+        assert_array_equal(positions, [np.arange(100)] * 2)
+
+
+class TestMinMax(unittest.TestCase):
+    def test_envelope(self):
+        points = make_points()
+
+        result = min_max(points, 100)
+
+        self.assertLessEqual(len(result), 200)
+        self.assertEqual(result[:, 1].max(), 5.0)
+        self.assertEqual(result[:, 1].min(), -5.0)
+
+
+class TestStride(unittest.TestCase):
+    def test_stride(self):
+        points = make_points(1001)
+
+        result = stride(points, 100)
+
+        assert_array_equal(result[0], points[0])
+        assert_array_equal(result[-1], points[-1])
+        self.assertLessEqual(len(result), 101)
+
+
+class TestRegistry(unittest.TestCase):
+    def test_builtin_methods(self):
+        points = make_points()
+        for name in ["lttb", "m4", "min_max", "stride"]:
+            result = get_downsample_method(name)(points, 100, (0.0, 10.0))
+            self.assertLess(len(result), len(points))
+
+    def test_register(self):
+        def first_last(points, n_buckets, bounds=None):
+            return points[[0, -1]]
+
+        register_downsample_method("first_last", first_last)
+        self.addCleanup(downsample_methods.pop, "first_last")
+
+        self.assertIs(get_downsample_method("first_last"), first_last)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            get_downsample_method("no_such_method")
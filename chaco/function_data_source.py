@@ -21,14 +21,20 @@ from traits.api import Callable, Instance, observe
 from .abstract_data_source import AbstractDataSource
 from .array_data_source import ArrayDataSource
 from .data_range_1d import DataRange1D
+from .function_evaluation_mixin import FunctionEvaluationMixin
 
 
-class FunctionDataSource(ArrayDataSource):
+class FunctionDataSource(ArrayDataSource, FunctionEvaluationMixin):
     """A data source that lazily generates its data array from a callable.
 
     The signature of the :attr:`func` attribute is `func(low, high)` where
     `low` and `high` are attributes of the :attr:`data_range` attribute
-    (instance of a :class:`DataRange1D`).
+    (instance of a :class:`DataRange1D`).  If :attr:`resolutions` is not
+    empty, the signature is `func(low, high, resolution)`, where the
+    resolution is, for example, the number of points to compute.
+
+    The function can be evaluated in the background and its results cached;
+    see :class:`FunctionEvaluationMixin`.
 
     This class does not listen to the array for value changes; if you need that
     behavior, create a subclass that hooks up the appropriate listeners.
@@ -47,12 +53,12 @@ class FunctionDataSource(ArrayDataSource):
         AbstractDataSource.__init__(self, **kw)
         self.recalculate()
 
-    @observe("data_range.updated")
+    @observe("data_range.updated", post_init=True)
     def recalculate(self, event=None):
         if self.func is not None and self.data_range is not None:
-            newarray = self.func(self.data_range.low, self.data_range.high)
-            ArrayDataSource.set_data(self, newarray)
+            self._evaluate((self.data_range.low, self.data_range.high))
         else:
+            self._cancel_evaluation()
             self._data = array([], dtype=float)
 
     def set_data(self, *args, **kw):
@@ -66,3 +72,20 @@ class FunctionDataSource(ArrayDataSource):
 
     def remove_mask(self):
         raise NotImplementedError
+
+    # ------------------------------------------------------------------------
+    # FunctionEvaluationMixin interface
+    # ------------------------------------------------------------------------
+
+    def _call_func(self, bounds, resolution):
+        if resolution is None:
+            return self.func(*bounds)
+        return self.func(*bounds, resolution)
+
+    def _set_result(self, result):
+        ArrayDataSource.set_data(self, result)
+
+    def _func_changed(self):
+        # results of the previous function must not be set later
+        self._cancel_evaluation()
+        self._clear_result_cache()
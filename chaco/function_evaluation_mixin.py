@@ -0,0 +1,197 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Defines the FunctionEvaluationMixin class.
+"""
+from collections import OrderedDict
+import logging
+
+from traits.api import Any, Bool, HasTraits, Instance, Int, List
+
+from ._workers import can_dispatch_to_ui, dispatch_to_ui, get_executor
+
+
+logger = logging.getLogger(__name__)
+
+
+class FunctionEvaluationMixin(HasTraits):
+    """A mix-in class for data sources which compute their data by calling a
+    function with the bounds of a data range.
+
+    The results can be cached, keyed by the bounds and the resolution, so
+    that returning to a previous view does not call the function again.
+    The function can also be called in a worker thread, so that panning and
+    zooming do not wait for it: the data source keeps its previous data until
+    the new data is ready, and requests which are superseded before their
+    evaluation starts are cancelled.  With several **resolutions**, the
+    function is called with each of them in turn, and the data is updated
+    with each result, so a coarse result is shown while the finer ones are
+    computed.
+
+    Subclasses must implement _call_func() and _set_result(), and call
+    _evaluate() when their range changes.
+    """
+
+    #: Whether to call the function in a worker thread instead of waiting
+    #: for it when the range changes.  The function is called synchronously
+    #: if there is no UI event loop to pass its results back to.
+    evaluate_in_background = Bool(False)
+
+    #: The maximum number of results to cache, keyed by the bounds of the
+    #: range and the resolution.  If 0, the function is called whenever the
+    #: range changes.
+    max_cached_results = Int(0)
+
+    #: The resolutions to call the function with, from the coarsest to the
+    #: finest.  If empty, the function is called without a resolution.  If
+    #: the function is evaluated in the background, the data is updated with
+    #: the result at each resolution; otherwise only the finest resolution
+    #: is used.
+    resolutions = List(Int)
+
+    # ------------------------------------------------------------------------
+    # Private traits
+    # ------------------------------------------------------------------------
+
+    # The cached results, keyed by (bounds, resolution) and ordered from the
+    # least to the most recently used.
+    _result_cache = Instance(OrderedDict, (), transient=True)
+
+    # The number of the latest request, which supersedes earlier requests.
+    _request = Int(0, transient=True)
+
+    # Incremented when the cache is cleared, so that the results of earlier
+    # requests are not cached.
+    _cache_version = Int(0, transient=True)
+
+    # The future of the latest request evaluated in the background.
+    _future = Any(transient=True)
+
+    # ------------------------------------------------------------------------
+    # Abstract methods
+    # ------------------------------------------------------------------------
+
+    def _call_func(self, bounds, resolution):
+        """Calls the function with the bounds of the range and a resolution,
+        which is None if **resolutions** is empty.
+
+        This may be called from the worker thread.
+        """
+        raise NotImplementedError
+
+    def _set_result(self, result):
+        """Sets the data of the data source to a result of the function."""
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------------
+    # Protected methods for subclasses to use
+    # ------------------------------------------------------------------------
+
+    def _evaluate(self, bounds):
+        """Updates the data of the data source for the bounds of a range."""
+        self._cancel_evaluation()
+        resolutions = list(self.resolutions) or [None]
+        if not (self.evaluate_in_background and can_dispatch_to_ui()):
+            self._set_result(self._get_result(bounds, resolutions[-1]))
+            return
+
+        # show the finest cached result, and compute the finer ones
+        for ndx in range(len(resolutions) - 1, -1, -1):
+            result = self._get_cached_result(bounds, resolutions[ndx])
+            if result is not None:
+                self._set_result(result)
+                resolutions = resolutions[ndx + 1:]
+                break
+        if resolutions:
+            self._future = get_executor("function").submit(
+                self._evaluate_in_background,
+                self._request,
+                self._cache_version,
+                bounds,
+                resolutions,
+            )
+
+    def _cancel_evaluation(self):
+        """Supersedes the requests which are evaluated in the background."""
+        self._request += 1
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def _clear_result_cache(self):
+        """Discards the cached results, for example when the function
+        changes.
+        """
+        self._cache_version += 1
+        self._result_cache.clear()
+
+    # ------------------------------------------------------------------------
+    # Private methods
+    # ------------------------------------------------------------------------
+
+    def _get_result(self, bounds, resolution):
+        result = self._get_cached_result(bounds, resolution)
+        if result is None:
+            result = self._call_func(bounds, resolution)
+            self._cache_result(bounds, resolution, result)
+        return result
+
+    def _get_cached_result(self, bounds, resolution):
+        key = (bounds, resolution)
+        result = self._result_cache.get(key)
+        if result is not None:
+            self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_result(self, bounds, resolution, result):
+        if self.max_cached_results <= 0:
+            return
+        cache = self._result_cache
+        cache[(bounds, resolution)] = result
+        cache.move_to_end((bounds, resolution))
+        while len(cache) > self.max_cached_results:
+            cache.popitem(last=False)
+
+    def _evaluate_in_background(self, request, version, bounds, resolutions):
+        """Calls the function with each resolution in turn, in the worker
+        thread, until the request is superseded.
+        """
+        for resolution in resolutions:
+            if request != self._request:
+                return
+            try:
+                result = self._call_func(bounds, resolution)
+            except Exception:
+                logger.exception("Error evaluating %s", self)
+                return
+            dispatch_to_ui(
+                self._background_result_ready,
+                request,
+                version,
+                bounds,
+                resolution,
+                result,
+            )
+
+    def _background_result_ready(
+        self, request, version, bounds, resolution, result
+    ):
+        if version == self._cache_version:
+            self._cache_result(bounds, resolution, result)
+        if request == self._request:
+            self._set_result(result)
+
+    # ------------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------------
+
+    def _max_cached_results_changed(self, new):
+        while len(self._result_cache) > max(new, 0):
+            self._result_cache.popitem(last=False)
@@ -11,27 +11,29 @@
 from numpy import array
 from traits.api import Instance, Callable, observe
 from .data_range_2d import DataRange2D
+from .function_evaluation_mixin import FunctionEvaluationMixin
 from .image_data import ImageData
 
 # Adapted (ie. copied and modified) from function_data_source.
 
-# Given the time frequently required for image manipulation,
-# it would be awesome if there was a mechanism for returning
-# partial results as they become available.
 
-
-class FunctionImageData(ImageData):
+class FunctionImageData(ImageData, FunctionEvaluationMixin):
     """A class that provides data for a 2-D image based upon the range
     supplied.  This class can be used as the data source for an image plot
     or contour plot.
 
-    Computation should be fairly swift for acceptable interactive performance.
+    Computation should be fairly swift for acceptable interactive performance,
+    unless the function is evaluated in the background; partial results can
+    then be shown as they become available by computing the image at
+    increasing **resolutions**.  See :class:`FunctionEvaluationMixin`.
     """
 
     #: The function to call with the low and high values of the range
     #: in the x and y dimensions.  It should return either a 2-D array
     #: of numerical values, or an array of RGB or RGBA values (shape should
-    #: be (n, m), (n, m, 3) or (n, m, 4)).
+    #: be (n, m), (n, m, 3) or (n, m, 4)).  If **resolutions** is not empty,
+    #: the resolution is passed as a fifth argument, for example the number
+    #: of pixels to compute along each dimension.
     func = Callable
 
     #: the 2D data_range required for the data shown
@@ -42,17 +44,19 @@ class FunctionImageData(ImageData):
         # Explicitly construct the initial data set for ImageData
         self.recalculate()
 
-    @observe("data_range.updated")
+    @observe("data_range.updated", post_init=True)
     def recalculate(self, event=None):
         if self.func is not None and self.data_range is not None:
-            newarray = self.func(
-                self.data_range.x_range.low,
-                self.data_range.x_range.high,
-                self.data_range.y_range.low,
-                self.data_range.y_range.high,
+            self._evaluate(
+                (
+                    self.data_range.x_range.low,
+                    self.data_range.x_range.high,
+                    self.data_range.y_range.low,
+                    self.data_range.y_range.high,
+                )
             )
-            ImageData.set_data(self, newarray)
         else:
+            self._cancel_evaluation()
             self._data = array([], dtype=float)
 
     def set_data(self, *args, **kw):
@@ -64,3 +68,20 @@ class FunctionImageData(ImageData):
 
     def remove_mask(self):
         raise NotImplementedError
+
+    # ------------------------------------------------------------------------
+    # FunctionEvaluationMixin interface
+    # ------------------------------------------------------------------------
+
+    def _call_func(self, bounds, resolution):
+        if resolution is None:
+            return self.func(*bounds)
+        return self.func(*bounds, resolution)
+
+    def _set_result(self, result):
+        ImageData.set_data(self, result)
+
+    def _func_changed(self):
+        # results of the previous function must not be set later
+        self._cancel_evaluation()
+        self._clear_result_cache()
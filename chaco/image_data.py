@@ -11,7 +11,7 @@
 """ Defines the ImageData class.
 """
 # Standard library imports
-from numpy import fmax, fmin, swapaxes
+from numpy import fmax, fmin, issubdtype, number, swapaxes
 
 # Enthought library imports
 from traits.api import Bool, Int, Property, ReadOnly, Tuple
@@ -19,6 +19,7 @@ from traits.api import Bool, Int, Property, ReadOnly, Tuple
 # Local relative imports
 from .base import DimensionTrait, ImageTrait
 from .abstract_data_source import AbstractDataSource
+from .speedups import nanargminmax
 
 
 class ImageData(AbstractDataSource):
@@ -160,10 +161,15 @@ class ImageData(AbstractDataSource):
         if not self._bounds_cache_valid:
             if self.raw_value.size == 0:
                 self._cached_bounds = (0, 0)
+            elif issubdtype(self.raw_value.dtype, number):
+                # find both bounds in one pass, ignoring NaNs; if all the
+                # values are NaN, the bounds are NaN.
+                values = self.raw_value.ravel()
+                min_index, max_index = nanargminmax(values)
+                self._cached_bounds = (values[min_index], values[max_index])
             else:
-                # nanmin and nanmax raise an annoying RuntimeWarning when
-                # all raw_value entries are NaN.  Use fmin.reduce and
-                # fmax.reduce to avoid this.
+                # nanargminmax only handles numbers, so reduce bool and
+                # object data as before.
                 self._cached_bounds = (
                     fmin.reduce(self.raw_value, axis=None),
                     fmax.reduce(self.raw_value, axis=None),
@@ -19,7 +19,6 @@ from traits.api import ArrayOrNone, Str, List, Float
 
 # Local, relative imports
 from .axis import PlotAxis
-from .label import Label
 
 
 class LabelAxis(PlotAxis):
@@ -125,19 +124,11 @@ class LabelAxis(PlotAxis):
         Overrides PlotAxis.
         """
         try:
-            self.ticklabel_cache = []
-            for text in self._tick_label_list:
-                ticklabel = Label(
-                    text=text,
-                    font=self.tick_label_font,
-                    color=self.tick_label_color,
-                    rotate_angle=self.label_rotation,
-                )
-                self.ticklabel_cache.append(ticklabel)
-
-            self._tick_label_bounding_boxes = [
-                array(ticklabel.get_bounding_box(gc), float64)
-                for ticklabel in self.ticklabel_cache
-            ]
+            self._set_tick_labels(
+                gc,
+                self._tick_label_list,
+                rotate_angle=self.label_rotation,
+                margin=2,
+            )
         except:
             print_exc()
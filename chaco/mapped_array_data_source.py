@@ -0,0 +1,238 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Defines the MappedArrayDataSource class.
+"""
+# Standard library imports
+import logging
+import mmap
+import os
+
+# Major library imports
+import numpy as np
+
+# Enthought library imports
+from traits.api import Any, Int, Str
+
+# Local relative imports
+from .array_data_source import ArrayDataSource
+from .downsample.lod_pyramid import MinMaxPyramid
+
+
+logger = logging.getLogger(__name__)
+
+
+class MappedArrayDataSource(ArrayDataSource):
+    """An ArrayDataSource for data which is too large to be held in memory,
+    such as a numpy.memmap of a recording.
+
+    The data is never copied.  Its bounds and its level-of-detail pyramid
+    (see get_lod_pyramid()) are computed with a single pass through the data
+    each, and a LinePlot of the data with a sorted index and
+    **use_lod_pyramid** set only reads the samples it draws.
+
+    If **summary_file** is set and the data is a numpy.memmap, the bounds and
+    the pyramid are saved to that file and read back instead of being
+    computed again when the same data is plotted later.  The saved summaries
+    are ignored if the memory-mapped file has been modified since, so the
+    file should not be modified through the memmap while it is plotted.
+    """
+
+    #: The path of a file to save the summaries of the data to, or "" to
+    #: compute them every time the data is set.
+    summary_file = Str
+
+    #: The number of samples in each bucket of the finest level of the
+    #: level-of-detail pyramid.  The pyramid takes about 64 bytes per bucket.
+    lod_base_size = Int(4096)
+
+    # ------------------------------------------------------------------------
+    # Private traits
+    # ------------------------------------------------------------------------
+
+    # The summaries of the data, keyed by name: the indices of its minimum
+    # and maximum values, the arrays of its pyramid prefixed with "lod_", and
+    # the description of the memory-mapped file they were computed from.
+    # None if they have not been loaded from the summary file yet.
+    _summaries = Any(transient=True)
+
+    # ------------------------------------------------------------------------
+    # Public methods
+    # ------------------------------------------------------------------------
+
+    def set_data(self, newdata, sort_order=None):
+        """Sets the data, and optionally the sort order, for this data source.
+
+        Parameters
+        ----------
+        newdata : array
+            The data to use, usually a numpy.memmap.
+        sort_order : SortOrderTrait
+            The sort order of the data
+        """
+        self._summaries = None
+        super().set_data(newdata, sort_order)
+
+    def append_data(self, new_data, capacity=None):
+        """Appends values to the end of the data.
+
+        The data is copied into memory, and its summaries are no longer
+        saved.  See ArrayDataSource.append_data() for the parameters.
+        """
+        self._summaries = {}
+        super().append_data(new_data, capacity)
+
+    def set_appended_data(self, data, n_appended, discarded=0):
+        """Sets the data to an array which extends the current data.
+
+        The summaries are no longer saved.  See
+        ArrayDataSource.set_appended_data() for the parameters.
+        """
+        self._summaries = {}
+        super().set_appended_data(data, n_appended, discarded)
+
+    def get_lod_pyramid(self):
+        """Returns a MinMaxPyramid summarizing the data of this data source.
+
+        The pyramid is read from the summary file if it was saved there for
+        the same data, and is otherwise built the first time it is requested
+        and saved.
+        """
+        if self._lod_pyramid is None:
+            summaries = self._get_summaries()
+            pyramid = None
+            if "lod_size" in summaries:
+                arrays = {
+                    name[len("lod_"):]: value
+                    for name, value in summaries.items()
+                    if name.startswith("lod_")
+                }
+                pyramid = MinMaxPyramid.from_arrays(self.get_data(), arrays)
+                if pyramid.base_size != self.lod_base_size:
+                    pyramid = None
+
+            if pyramid is None:
+                pyramid = MinMaxPyramid(
+                    self.get_data(), base_size=self.lod_base_size
+                )
+                for name in list(summaries):
+                    if name.startswith("lod_"):
+                        del summaries[name]
+                for name, value in pyramid.to_arrays().items():
+                    summaries["lod_" + name] = value
+                self._save_summaries()
+            self._lod_pyramid = pyramid
+        return self._lod_pyramid
+
+    # ------------------------------------------------------------------------
+    # Private methods
+    # ------------------------------------------------------------------------
+
+    def _compute_bounds(self, data=None):
+        """Computes the minimum and maximum values of self._data, or reads
+        them from the summary file.
+        """
+        if data is not None or self.sort_order != "none":
+            super()._compute_bounds(data)
+            return
+
+        summaries = self._get_summaries()
+        if "min_index" in summaries:
+            data = self.get_data()
+            self._min_index = int(summaries["min_index"])
+            self._max_index = int(summaries["max_index"])
+            self._cached_bounds = (
+                data[self._min_index],
+                data[self._max_index],
+            )
+        else:
+            super()._compute_bounds()
+            summaries["min_index"] = np.array(self._min_index)
+            summaries["max_index"] = np.array(self._max_index)
+            self._save_summaries()
+
+    def _get_summaries(self):
+        if self._summaries is None:
+            self._summaries = self._load_summaries()
+        return self._summaries
+
+    def _load_summaries(self):
+        """Returns the summaries saved in the summary file for the data, or
+        an empty dictionary.
+        """
+        source = self._describe_source()
+        if source is None or not self.summary_file:
+            return {}
+        try:
+            with np.load(self.summary_file) as saved:
+                summaries = dict(saved)
+        except (OSError, ValueError):
+            # missing or unreadable file
+            return {}
+
+        for name, value in source.items():
+            if name not in summaries or summaries[name] != value:
+                return {}
+        return summaries
+
+    def _save_summaries(self):
+        """Saves the summaries to the summary file, if the data is a memory
+        mapped file.
+        """
+        source = self._describe_source()
+        if source is None or not self.summary_file:
+            return
+        self._summaries.update(source)
+
+        # write to a temporary file first, so that an interrupted save does
+        # not leave a partial file
+        temp_file = self.summary_file + ".tmp"
+        try:
+            with open(temp_file, "wb") as fp:
+                np.savez(fp, **self._summaries)
+            os.replace(temp_file, self.summary_file)
+        except OSError:
+            logger.warning(
+                "Could not save data summaries to %s",
+                self.summary_file,
+                exc_info=True,
+            )
+
+    def _describe_source(self):
+        """Returns the arrays which identify the memory-mapped file of the
+        data, or None if the data is not a memory-mapped file.
+        """
+        data = self._data
+        # views of a memmap have its filename and offset, but not its size,
+        # so only the memmap itself is described
+        if (
+            not isinstance(data, np.memmap)
+            or not isinstance(data.base, mmap.mmap)
+            or data.filename is None
+        ):
+            return None
+        try:
+            mtime = os.stat(data.filename).st_mtime_ns
+        except OSError:
+            return None
+        return {
+            "source_file": np.array(data.filename),
+            "source_offset": np.array(data.offset),
+            "source_dtype": np.array(data.dtype.str),
+            "source_size": np.array(len(data)),
+            "source_mtime": np.array(mtime),
+        }
+
+    # ------------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------------
+
+    def _lod_base_size_changed(self):
+        self._lod_pyramid = None
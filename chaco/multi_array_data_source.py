@@ -13,14 +13,25 @@
 import warnings
 
 # Major package imports
-from numpy import nanmax, nanmin, array, shape, ones, newaxis, nan_to_num
+from numpy import (
+    array,
+    issubdtype,
+    nan_to_num,
+    nanmax,
+    nanmin,
+    newaxis,
+    number,
+    ones,
+    shape,
+)
 
 # Enthought library imports
-from traits.api import Any, Int, Tuple
+from traits.api import Any, Dict, Int
 
 # Chaco imports
 from .base import NumericalSequenceTrait, SortOrderTrait
 from .abstract_data_source import AbstractDataSource
+from .speedups import nanargminmax
 
 
 class MultiArrayDataSource(AbstractDataSource):
@@ -59,8 +70,9 @@ class MultiArrayDataSource(AbstractDataSource):
     # The data array itself.
     _data = NumericalSequenceTrait
 
-    # Cached values of min and max as long as **_data** doesn't change.
-    _cached_bounds = Tuple
+    # Cached values of min and max as long as **_data** doesn't change, keyed
+    # by the (value, index) arguments of get_bounds().
+    _cached_bounds = Dict
 
     # Not necessary, since this is not a filter, but provided for convenience.
     _cached_mask = Any
@@ -170,33 +182,16 @@ class MultiArrayDataSource(AbstractDataSource):
             return (0.0, 0.0)
 
         if type(value) == int:
-            if self.value_dimension == 0:
-                maxi = nanmax(self._data[value, ::])
-                mini = nanmin(self._data[value, ::])
-            else:
-                # value_dimension == 1
-                maxi = nanmax(self._data[::, value])
-                mini = nanmin(self._data[::, value])
+            key = (value, None)
         elif type(index) == int:
-            if self.index_dimension == 0:
-                maxi = nanmax(self._data[index, ::])
-                mini = nanmin(self._data[index, ::])
-            else:
-                # index_dimension == 1
-                maxi = nanmax(self._data[::, index])
-                mini = nanmin(self._data[::, index])
+            key = (None, index)
         else:
-            # value is None and index is None:
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore",
-                    "All-NaN (slice|axis) encountered",
-                    RuntimeWarning,
-                )
-                maxi = nanmax(self._data)
-                mini = nanmin(self._data)
-
-        return (mini, maxi)
+            key = (None, None)
+        bounds = self._cached_bounds.get(key)
+        if bounds is None:
+            bounds = self._compute_bounds(*key)
+            self._cached_bounds[key] = bounds
+        return bounds
 
     def get_shape(self):
         """Returns the shape of the multi-dimensional data source."""
@@ -213,6 +208,40 @@ class MultiArrayDataSource(AbstractDataSource):
         self._set_data(value)
         self.data_changed = True
 
+    def _compute_bounds(self, value, index):
+        """Returns the (min, max) of the *value* or *index* slice of the
+        data, or of all the data if both are None, ignoring NaNs.
+        """
+        if value is not None:
+            if self.value_dimension == 0:
+                data = self._data[value, ::]
+            else:
+                # value_dimension == 1
+                data = self._data[::, value]
+        elif index is not None:
+            if self.index_dimension == 0:
+                data = self._data[index, ::]
+            else:
+                # index_dimension == 1
+                data = self._data[::, index]
+        else:
+            data = self._data.ravel()
+
+        if not issubdtype(data.dtype, number):
+            # nanargminmax only handles numbers, so reduce bool and object
+            # data as before.
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore",
+                    "All-NaN (slice|axis) encountered",
+                    RuntimeWarning,
+                )
+                return (nanmin(data), nanmax(data))
+
+        # if all the values are NaN, the bounds are NaN
+        min_index, max_index = nanargminmax(data)
+        return (data[min_index], data[max_index])
+
     def _set_data(self, value):
         """Forces 1-D data to 2-D."""
         if len(value.shape) == 1:
@@ -229,3 +258,14 @@ class MultiArrayDataSource(AbstractDataSource):
             raise ValueError(msg)
 
         self._data = value
+        self._cached_bounds = {}
+
+    # ------------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------------
+
+    def _index_dimension_changed(self):
+        self._cached_bounds = {}
+
+    def _value_dimension_changed(self):
+        self._cached_bounds = {}
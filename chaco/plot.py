@@ -1471,6 +1471,21 @@ class Plot(DataView):
                     source = self.datasources[name]
                     source.set_data(self.data.get_data(name))
 
+        if "appended" in data_changed_event:
+            discarded = data_changed_event.get("discarded", {})
+            for name, new_data in data_changed_event["appended"].items():
+                if name in self.datasources:
+                    source = self.datasources[name]
+                    data = self.data.get_data(name)
+                    if isinstance(source, ArrayDataSource):
+                        # the plot data buffers the values, so the source
+                        # shares its array and only updates its bounds
+                        source.set_appended_data(
+                            data, len(new_data), discarded.get(name, 0)
+                        )
+                    else:
+                        source.set_data(data)
+
     def _plots_items_changed(self, event):
         if self.legend:
             self.legend.plots = self.plots
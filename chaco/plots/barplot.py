@@ -40,7 +40,7 @@ from kiva.constants import FILL_STROKE
 from chaco.abstract_plot_renderer import AbstractPlotRenderer
 from chaco.abstract_mapper import AbstractMapper
 from chaco.array_data_source import ArrayDataSource
-from chaco.base import reverse_map_1d
+from chaco.base import reverse_map_1d, sorted_range_slice
 
 
 logger = logging.getLogger(__name__)
@@ -277,11 +277,28 @@ class BarPlot(AbstractPlotRenderer):
         # fail on extreme zoom in.
         # Ideally we would work out all the boxes and compute intersections.
 
-        index_range_mask = self.index_mapper.range.mask_data(index)
-        # include points on either side of clipped range (1D dilation)
-        # - not perfect, but better than simple clipping
-        index_range_mask[:-1] |= index_range_mask[1:]
-        index_range_mask[1:] |= index_range_mask[:-1]
+        index_range = self.index_mapper.range
+        if self.index.sort_order == "none":
+            index_range_mask = index_range.mask_data(index)
+            # include points on either side of clipped range (1D dilation)
+            # - not perfect, but better than simple clipping
+            index_range_mask[:-1] |= index_range_mask[1:]
+            index_range_mask[1:] |= index_range_mask[:-1]
+        else:
+            # For a sorted index, find the (dilated) visible window by binary
+            # search and only look at the data inside it.
+            window = sorted_range_slice(
+                index,
+                index_range.low,
+                index_range.high,
+                self.index.sort_order,
+                pad=1,
+            )
+            index = index[window]
+            value = value[window]
+            index_mask = index_mask[window]
+            value_mask = value_mask[window]
+            index_range_mask = True
 
         nan_mask = isfinite(index) & isfinite(value)
         point_mask = index_mask & value_mask & nan_mask & index_range_mask
@@ -290,6 +307,8 @@ class BarPlot(AbstractPlotRenderer):
             starting_values = zeros(len(index))
         else:
             starting_values = self.starting_value.get_data()
+            if self.index.sort_order != "none":
+                starting_values = starting_values[window]
             point_mask &= isfinite(starting_values)
 
         if self.bar_width_type == "data":
@@ -16,7 +16,9 @@ from traits.api import Any, Bool, Float, Instance, Property, Tuple
 # Local relative imports
 from chaco.plots.image_plot import ImagePlot
 from chaco.abstract_colormap import AbstractColormap
-from chaco.speedups import apply_selection_fade
+from chaco.color_mapper import ColorMapper
+from chaco.speedups import apply_selection_fade, lut_index_dtype
+from chaco.tiled_image_data import TiledImageData
 
 
 class CMapImagePlot(ImagePlot):
@@ -46,7 +48,8 @@ class CMapImagePlot(ImagePlot):
     #: RGB color to use to fade out unselected points.
     fade_background = Tuple((0, 0, 0))
 
-    #: whether to pre-compute the full colormapped RGB(A) image
+    #: whether to pre-compute the full colormapped RGB(A) image (ignored for
+    #: a TiledImageData, whose visible region is always mapped on demand)
     cache_full_map = Bool(True)
 
     # ------------------------------------------------------------------------
@@ -59,6 +62,14 @@ class CMapImagePlot(ImagePlot):
     # Cache of the fully mapped RGB(A) image.
     _cached_mapped_image = Any(transient=True)
 
+    # The indices of the full image into the lookup table of a ColorMapper,
+    # so that a change of palette only needs to look up the colors again.
+    _cached_lut_indices = Any(transient=True)
+
+    # The lut_indices_key() of the color mapper for the cached indices, or
+    # None if they are not valid.
+    _lut_indices_key = Any(transient=True)
+
     # ------------------------------------------------------------------------
     # Public methods
     # ------------------------------------------------------------------------
@@ -108,26 +119,59 @@ class CMapImagePlot(ImagePlot):
         """Maps the data to RGB(A) with optional selection masks overlayed"""
         # get the RGBA values from the color map as uint8
         mapped_image = self.value_mapper.map_uint8(data)
+        self._apply_selection_fade(mapped_image, selection_masks)
+        return mapped_image
+
+    def _cmap_full_image(self, selection_masks=None):
+        """Maps the full image to RGB(A) with optional selection masks
+        overlayed.
+
+        With a ColorMapper, the lookup table indices of the data are cached,
+        so they are only recomputed when the data or the range of the color
+        mapper change, and the previous image is reused for the result.
+        """
+        mapper = self.value_mapper
+        if not isinstance(mapper, ColorMapper):
+            return self._cmap_values(self.value.data, selection_masks)
+
+        key = mapper.lut_indices_key()
+        indices = self._cached_lut_indices
+        if key != self._lut_indices_key or indices is None:
+            data = self.value.data
+            if indices is not None and (
+                indices.shape != data.shape
+                or indices.dtype != lut_index_dtype(mapper.steps)
+            ):
+                indices = None
+            indices = mapper.map_lut_indices(data, out=indices)
+            self._cached_lut_indices = indices
+            self._lut_indices_key = key
+
+        out = self._cached_mapped_image
+        if out is not None and out.shape != indices.shape + (4,):
+            out = None
+        mapped_image = mapper.map_lut_colors(indices, out=out)
+        self._apply_selection_fade(mapped_image, selection_masks)
+        return mapped_image
+
+    def _apply_selection_fade(self, mapped_image, selection_masks):
+        """Fades out the unselected pixels of a mapped image in place."""
         if selection_masks is not None:
             # construct a composite mask
-            if len(selection_masks) > 0:
-                mask = zeros(mapped_image.shape[:2], dtype=bool)
-                for m in selection_masks:
-                    mask = mask | m
-            else:
-                mask = zeros(self._cached_mapped_image.shape[:2], dtype=bool)
+            mask = zeros(mapped_image.shape[:2], dtype=bool)
+            for m in selection_masks:
+                mask = mask | m
             # Apply the selection fade, from speedups.py
             apply_selection_fade(
                 mapped_image, mask, self.fade_alpha, self.fade_background
             )
-        return mapped_image
 
     def _compute_cached_image(self, selection_masks=None):
         """Updates the cached image."""
-        if self.cache_full_map:
+        if self.cache_full_map and not isinstance(self.value, TiledImageData):
             if not self._mapped_image_cache_valid:
-                self._cached_mapped_image = self._cmap_values(
-                    self.value.data, selection_masks
+                self._cached_mapped_image = self._cmap_full_image(
+                    selection_masks
                 )
                 self._mapped_image_cache_valid = True
 
@@ -136,9 +180,7 @@ class CMapImagePlot(ImagePlot):
         else:
             self._mapped_image_cache_valid = True
             ImagePlot._compute_cached_image(
-                self,
-                self.value.data,
-                mapper=lambda data: self._cmap_values(data),
+                self, mapper=lambda data: self._cmap_values(data)
             )
 
     def _update_value_mapper(self, event=None):
@@ -185,6 +227,7 @@ class CMapImagePlot(ImagePlot):
     def _value_data_changed_fired(self):
         super()._value_data_changed_fired()
         self._mapped_image_cache_valid = False
+        self._lut_indices_key = None
 
     def _index_data_changed_fired(self):
         super()._index_data_changed_fired()
@@ -35,7 +35,11 @@ from traitsui.api import Item, RangeEditor
 from chaco.array_data_source import ArrayDataSource
 from chaco.base import left_shift, right_shift
 from chaco.abstract_colormap import AbstractColormap
-from chaco.plots.scatterplot import ScatterPlot, ScatterPlotView
+from chaco.plots.scatterplot import (
+    ScatterPlot,
+    ScatterPlotView,
+    bin_screen_points,
+)
 
 
 class ColormappedScatterPlotView(ScatterPlotView):
@@ -92,6 +96,18 @@ class ColormappedScatterPlot(ScatterPlot):
     #: so perhaps banded should be removed.
     render_method = Enum("auto", "banded", "bruteforce")
 
+    #: How the color values of the points in each pixel are combined when
+    #: the points are drawn as a density image (see **render_style**):
+    #:
+    #: mean:
+    #:     Map the mean color value of the points through the color mapper.
+    #: max:
+    #:     Map the maximum color value of the points through the color mapper.
+    #: count:
+    #:     Ignore the color values and draw the number of points, as in a
+    #:     ScatterPlot.
+    density_statistic = Enum("mean", "max", "count", requires_redraw=True)
+
     # A dict mapping color-map indices to arrays of indices into self.data.
     # This is used for the "banded" render method.
     # This mapping is only valid if **_cache_valid** is True.
@@ -206,6 +222,12 @@ class ColormappedScatterPlot(ScatterPlot):
         else:
             batch_capable = False
 
+        if self._use_density_rendering(len(points)):
+            with gc:
+                gc.clip_to_rect(self.x, self.y, self.width, self.height)
+                self._render_density(gc, points)
+            return
+
         if self.render_method == "auto":
             method = self._calc_render_method(len(points))
         else:
@@ -375,6 +397,26 @@ class ColormappedScatterPlot(ScatterPlot):
                 "Batch drawing requested on non-batch-capable GC."
             )
 
+    def _render_density(self, gc, points):
+        """Draws the aggregated color value of the points in each pixel
+        as an image.
+        """
+        if self.density_statistic == "count":
+            super()._render_density(gc, points[:, :2])
+            return
+
+        rect = self._density_rect()
+        counts, values = bin_screen_points(
+            points[:, :2], rect, points[:, 2], self.density_statistic
+        )
+        image = zeros(counts.shape + (4,))
+        occupied = counts > 0
+        if occupied.any():
+            colors = self.color_mapper.map_screen(values[occupied])
+            image[occupied, :3] = colors[:, :3]
+            image[occupied, 3] = self.fill_alpha
+        self._draw_density_image(gc, image, rect)
+
     def _render_bruteforce(self, gc, points):
         """Draws the points, setting the stroke color for each one."""
         x, y, colors = transpose(points)
@@ -1400,6 +1400,7 @@ cntr_trace(Csite *site, double levels[], int nlevels, int points)
     long ntotal = 0;
     long nparts2 = 0;
     long ntotal2 = 0;
+    const char *pass2_error = NULL;
 
     site->zlevel[0] = levels[0];
     site->zlevel[1] = levels[0];
@@ -1410,7 +1411,11 @@ cntr_trace(Csite *site, double levels[], int nlevels, int points)
     site->n = site->count = 0;
     data_init (site, 0, nchunk);
 
+    /* the tracing passes do not touch any Python objects, so other threads
+       may run while they do; the caller must not share the site between
+       threads without a lock */
     /* make first pass to compute required sizes for second pass */
+    Py_BEGIN_ALLOW_THREADS
     for (;;)
     {
         n = curve_tracer (site, 0);
@@ -1427,6 +1432,7 @@ cntr_trace(Csite *site, double levels[], int nlevels, int points)
             ntotal -= n;
         }
     }
+    Py_END_ALLOW_THREADS
     xp0 = (double *) PyMem_Malloc(ntotal * sizeof(double));
     yp0 = (double *) PyMem_Malloc(ntotal * sizeof(double));
     nseg0 = (long *) PyMem_Malloc(nparts * sizeof(long));
@@ -1436,14 +1442,14 @@ cntr_trace(Csite *site, double levels[], int nlevels, int points)
     site->xcp = xp0;
     site->ycp = yp0;
     iseg = 0;
+    Py_BEGIN_ALLOW_THREADS
     for (;;iseg++)
     {
         n = curve_tracer (site, 1);
         if (ntotal2 + n > ntotal)
         {
-            PyErr_SetString(PyExc_RuntimeError,
-                "curve_tracer: ntotal2, pass 2 exceeds ntotal, pass 1");
-            goto error;
+            pass2_error = "curve_tracer: ntotal2, pass 2 exceeds ntotal, pass 1";
+            break;
         }
         if (n == 0)
             break;
@@ -1458,11 +1464,16 @@ cntr_trace(Csite *site, double levels[], int nlevels, int points)
         }
         else
         {
-            PyErr_SetString(PyExc_RuntimeError,
-                "Negative n from curve_tracer in pass 2");
-            goto error;
+            pass2_error = "Negative n from curve_tracer in pass 2";
+            break;
         }
     }
+    Py_END_ALLOW_THREADS
+    if (pass2_error != NULL)
+    {
+        PyErr_SetString(PyExc_RuntimeError, pass2_error);
+        goto error;
+    }
 
 
     if (points)
@@ -11,17 +11,29 @@
 """ Defines the ContourLinePlot class.
 """
 
+# Standard library imports
+from collections import OrderedDict
+from math import floor, isfinite, log2
+
 # Major library imports
-from numpy import array, isfinite, meshgrid, transpose
+from numpy import (
+    array,
+    concatenate,
+    cumsum,
+    empty,
+    flatnonzero,
+    floor as ufloor,
+    ones,
+)
 
 # Enthought library imports
 from enable.api import LineStyle
 from kiva import constants
-from traits.api import Bool, Dict, Float, List, Str, Union
+from traits.api import Bool, Dict, Float, Instance, Int, List, Str, Union
 
 # Local relative imports
 from chaco.base_contour_plot import BaseContourPlot
-from chaco.plots.contour.contour import Cntr
+from chaco.linear_mapper import LinearMapper
 
 
 class ContourLinePlot(BaseContourPlot):
@@ -51,6 +63,13 @@ class ContourLinePlot(BaseContourPlot):
     #: Line style for negative levels.
     negative_style = LineStyle("dash")
 
+    #: If True, points of the contour lines closer than a pixel to the
+    #: previous point are not drawn.  This only applies to linear mappers.
+    simplify = Bool(True)
+
+    #: The number of zoom levels for which the simplified lines are cached.
+    simplify_cache_size = Int(4)
+
     # ------------------------------------------------------------------------
     # Private traits
     # ------------------------------------------------------------------------
@@ -61,6 +80,15 @@ class ContourLinePlot(BaseContourPlot):
     # Cached collection of traces.
     _cached_contours = Dict(transient=True)
 
+    # The data space bounding boxes of the traces of each level, as
+    # (traces, array of (x_min, y_min, x_max, y_max) rows) pairs.
+    _cached_bounds = Dict(transient=True)
+
+    # The simplified traces of each level, as (traces, simplified traces)
+    # pairs, keyed by the size of the cells used to simplify them and ordered
+    # from the least to the most recently used.
+    _simplified_contours = Instance(OrderedDict, (), transient=True)
+
     # Is the cached width data valid?
     _widths_cache_valid = Bool(False, transient=True)
 
@@ -105,45 +133,128 @@ class ContourLinePlot(BaseContourPlot):
             gc.set_line_join(constants.JOIN_BEVEL)
             gc.set_line_cap(constants.CAP_ROUND)
 
-            for i in range(len(self._levels)):
+            view = self._visible_data_bounds()
+            cell_size = self._simplify_cell_size() if self.simplify else None
+            for i, level in enumerate(self._levels):
+                traces = self._visible_traces(level, view, cell_size)
+                if len(traces) == 0:
+                    continue
                 gc.set_stroke_color(self._colors[i])
                 gc.set_line_width(self._widths[i])
                 gc.set_line_dash(self._styles[i])
-                for trace in self._cached_contours[self._levels[i]]:
-                    if self.orientation == "h":
-                        strace = self.index_mapper.map_screen(trace)
-                    else:
-                        rev_strace = self.index_mapper.map_screen(trace)
-                        strace = array(rev_strace)[:, ::-1]
+
+                # map all of the visible traces of the level at once
+                points = self.index_mapper.map_screen(concatenate(traces))
+                if self.orientation == "v":
+                    points = points[:, ::-1]
+                lengths = [len(trace) for trace in traces]
+                ends = cumsum(lengths)
+                for start, end in zip(ends - lengths, ends):
                     gc.begin_path()
-                    gc.lines(strace)
+                    gc.lines(points[start:end])
                     gc.stroke_path()
 
     def _update_contours(self):
         """ Updates the cache of contour lines """
-        if self.value.is_masked():
-            # XXX masked data and get_data_mask not currently implemented
-            data, mask = self.value.get_data_mask()
-            mask &= isfinite(data)
+        traces = self._get_traces([(level,) for level in self._levels])
+        self._cached_contours = {
+            key[0]: key_traces for key, key_traces in traces.items()
+        }
+        # lines which are still being traced are drawn when they are ready
+        self._contour_cache_valid = not self._pending_traces
+
+        bounds = {}
+        for level, level_traces in self._cached_contours.items():
+            cached = self._cached_bounds.get(level)
+            if cached is None or cached[0] is not level_traces:
+                cached = (level_traces, _trace_bounds(level_traces))
+            bounds[level] = cached
+        self._cached_bounds = bounds
+
+    def _visible_data_bounds(self):
+        """Returns the (x_min, y_min, x_max, y_max) data space bounds of the
+        plot, extended by the widest line.
+        """
+        margin = max(self._widths, default=0.0)
+        corners = array(
+            [
+                [self.x - margin, self.y - margin],
+                [self.x2 + margin, self.y2 + margin],
+            ]
+        )
+        if self.orientation == "v":
+            corners = corners[:, ::-1]
+        corners = self.index_mapper.map_data(corners)
+        return (
+            corners[:, 0].min(),
+            corners[:, 1].min(),
+            corners[:, 0].max(),
+            corners[:, 1].max(),
+        )
+
+    def _visible_traces(self, level, view, cell_size):
+        """Returns the traces of a level which overlap the view, simplified
+        with the given cell size if it is not None.
+        """
+        level_traces, bounds = self._cached_bounds[level]
+        x_min, y_min, x_max, y_max = view
+        visible = flatnonzero(
+            (bounds[:, 0] <= x_max)
+            & (bounds[:, 2] >= x_min)
+            & (bounds[:, 1] <= y_max)
+            & (bounds[:, 3] >= y_min)
+        )
+        if cell_size is not None:
+            level_traces = self._simplified_traces(level, cell_size)
+        return [level_traces[i] for i in visible]
+
+    def _simplified_traces(self, level, cell_size):
+        """Returns the traces of a level simplified with the given cell size,
+        simplifying them if they are not in the cache.
+        """
+        cache = self._simplified_contours
+        if cell_size in cache:
+            cache.move_to_end(cell_size)
         else:
-            data = self.value.get_data()
-            mask = isfinite(data)
-
-        x_data, y_data = self.index.get_data()
-        xs = x_data.get_data()
-        ys = y_data.get_data()
-        xg, yg = meshgrid(xs, ys)
-
-        # note: contour wants mask True in invalid locations
-        c = Cntr(xg, yg, data, ~mask)
-
-        self._cached_contours = {}
-        for level in self._levels:
-            self._cached_contours[level] = []
-            traces = c.trace(level)
-            for trace in traces:
-                self._cached_contours[level].append(transpose(trace))
-        self._contour_cache_valid = True
+            cache[cell_size] = {}
+            while len(cache) > max(self.simplify_cache_size, 1):
+                cache.popitem(last=False)
+        simplified = cache[cell_size]
+
+        level_traces = self._cached_contours[level]
+        cached = simplified.get(level)
+        if cached is None or cached[0] is not level_traces:
+            cached = (
+                level_traces,
+                [_simplify(trace, cell_size) for trace in level_traces],
+            )
+            simplified[level] = cached
+        return cached[1]
+
+    def _simplify_cell_size(self):
+        """Returns the size in data units of the cells used to simplify the
+        lines at the current zoom level, or None if they should not be
+        simplified.
+
+        The sizes are rounded down to powers of two, so that the simplified
+        lines can be reused while panning and for small changes of zoom, and
+        the cells are between half a pixel and a pixel wide.
+        """
+        if self.orientation == "h":
+            mappers = (self.x_mapper, self.y_mapper)
+        else:
+            mappers = (self.y_mapper, self.x_mapper)
+
+        cell_size = []
+        for mapper in mappers:
+            if not isinstance(mapper, LinearMapper):
+                return None
+            pixels = abs(mapper.high_pos - mapper.low_pos)
+            span = abs(mapper.range.high - mapper.range.low)
+            if not (pixels > 0 and span > 0 and isfinite(span)):
+                return None
+            cell_size.append(2.0 ** floor(log2(span / pixels)))
+        return tuple(cell_size)
 
     def _update_levels(self):
         """ Extends the parent method to also invalidate some other things """
@@ -152,6 +263,10 @@ class ContourLinePlot(BaseContourPlot):
         self._widths_cache_valid = False
         self._styles_cache_valid = False
 
+    def _traces_updated(self):
+        self._contour_cache_valid = False
+        super()._traces_updated()
+
     def _update_widths(self):
         """Updates the widths cache."""
         # If we are given a single width, apply it to all levels
@@ -217,3 +332,33 @@ class ContourLinePlot(BaseContourPlot):
         if self._level_cache_valid:
             self._update_styles()
             self.invalidate_draw()
+
+    def _simplify_changed(self):
+        self.invalidate_draw()
+
+    def _simplify_cache_size_changed(self, new):
+        while len(self._simplified_contours) > max(new, 1):
+            self._simplified_contours.popitem(last=False)
+
+
+def _trace_bounds(traces):
+    """Returns the bounding boxes of a list of N by 2 traces, as an array of
+    (x_min, y_min, x_max, y_max) rows.
+    """
+    bounds = empty((len(traces), 4))
+    for i, trace in enumerate(traces):
+        bounds[i, :2] = trace.min(axis=0)
+        bounds[i, 2:] = trace.max(axis=0)
+    return bounds
+
+
+def _simplify(trace, cell_size):
+    """Removes the points of a trace which are in the same cell of a grid as
+    the previous point, keeping the first and last points.
+    """
+    if len(trace) <= 2:
+        return trace
+    cells = ufloor(trace / cell_size)
+    keep = ones(len(trace), dtype=bool)
+    keep[1:-1] = (cells[1:-1] != cells[:-2]).any(axis=1)
+    return trace[keep]
@@ -13,14 +13,13 @@
 
 
 # Major library imports
-from numpy import array, isfinite, meshgrid, transpose
+from numpy import array
 
 # Enthought library imports
 from traits.api import Bool, Dict
 
 # Local relative imports
 from chaco.base_contour_plot import BaseContourPlot
-from chaco.plots.contour.contour import Cntr
 
 
 class ContourPolyPlot(BaseContourPlot):
@@ -78,35 +77,19 @@ class ContourPolyPlot(BaseContourPlot):
 
     def _update_polys(self):
         """ Updates the cache of contour polygons """
-        if self.value.is_masked():
-            # XXX masked data and get_data_mask not currently implemented
-            data, mask = self.value.get_data_mask()
-            mask &= isfinite(data)
-        else:
-            data = self.value.get_data()
-            mask = isfinite(data)
-
-        x_data, y_data = self.index.get_data()
-        xs = x_data.get_data()
-        ys = y_data.get_data()
-        xg, yg = meshgrid(xs, ys)
-
-        # note: contour wants mask True in invalid locations
-        c = Cntr(xg, yg, data, ~mask)
-
-        self._cached_contours = {}
-        for i in range(len(self._levels) - 1):
-            key = (self._levels[i], self._levels[i + 1])
-            self._cached_polys[key] = []
-            polys = c.trace(*key)
-            for poly in polys:
-                self._cached_polys[key].append(transpose(poly))
-        self._poly_cache_valid = True
+        levels = self._levels
+        self._cached_polys = self._get_traces(list(zip(levels, levels[1:])))
+        # polygons which are still being traced are drawn when they are ready
+        self._poly_cache_valid = not self._pending_traces
 
     def _update_levels(self):
         """ Extends the parent method to also invalidate some other things """
         super()._update_levels()
         self._poly_cache_valid = False
 
+    def _traces_updated(self):
+        self._poly_cache_valid = False
+        super()._traces_updated()
+
     def _update_colors(self):
         BaseContourPlot._update_colors(self, numcolors=len(self._levels) - 1)
@@ -17,6 +17,7 @@ from traits.api import Any, Enum, Float, Instance
 
 # Chaco imports
 from chaco.plots.lineplot import LinePlot
+from chaco.base import sorted_range_slice
 from chaco.abstract_data_source import AbstractDataSource
 
 # Set up a logger for this module
@@ -86,7 +87,22 @@ class ErrorBarPlot(LinePlot):
             self._cache_valid = True
             return
 
-        index_range_mask = self.index_mapper.range.mask_data(index)
+        index_range = self.index_mapper.range
+        if self.index.sort_order == "none":
+            index_range_mask = index_range.mask_data(index)
+        else:
+            # the points within the range of a sorted index form a window
+            # which can be found by binary search
+            window = sorted_range_slice(
+                index, index_range.low, index_range.high, self.index.sort_order
+            )
+            index = index[window]
+            index_mask = index_mask[window]
+            value_low = value_low[window]
+            value_high = value_high[window]
+            value_mask = value_mask[window]
+            index_range_mask = True
+
         value_low_mask = self.value_mapper.range.mask_data(value_low)
         value_high_mask = self.value_mapper.range.mask_data(value_high)
         value_range_mask = value_low_mask | value_high_mask
@@ -8,10 +8,11 @@
 #
 # Thanks for using Enthought open source!
 
-from numpy import empty
+from numpy import column_stack, empty
 from traits.api import Property, Enum
 
 # Local imports
+from chaco.base import sorted_range_slice
 from chaco.plots.lineplot import LinePlot
 from chaco.plots.polygon_plot import PolygonPlot
 
@@ -46,6 +47,40 @@ class FilledLinePlot(PolygonPlot):
     #:     point.  Also called a "right angle plot".
     render_style = Enum("connectedpoints", "hold", "connectedhold")
 
+    def _gather_points(self):
+        """Collects the data points that are within the bounds of the plot and
+        caches them.
+
+        For a sorted index only the visible window of the data, plus a point
+        on either side of it, is kept.
+        """
+        if self._cache_valid:
+            return
+
+        if not self.index or not self.value:
+            return
+
+        if self.index.sort_order == "none":
+            super()._gather_points()
+            return
+
+        index = self.index.get_data()
+        value = self.value.get_data()
+        if len(index) == 0 or len(value) == 0 or len(index) != len(value):
+            self._cached_data_pts = []
+            self._cache_valid = True
+            return
+
+        window = sorted_range_slice(
+            index,
+            self.index_range.low,
+            self.index_range.high,
+            self.index.sort_order,
+            pad=1,
+        )
+        self._cached_data_pts = column_stack([index[window], value[window]])
+        self._cache_valid = True
+
     def _render(self, gc, points):
         if len(points) == 0:
             return
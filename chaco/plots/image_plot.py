@@ -13,7 +13,7 @@
 
 
 # Standard library imports
-from math import ceil, floor, pi
+from math import ceil, floor, log2, pi
 from contextlib import contextmanager
 
 import numpy as np
@@ -34,6 +34,7 @@ from kiva.agg import GraphicsContextArray
 # Local relative imports
 from chaco.base_2d_plot import Base2DPlot
 from chaco.image_utils import trim_screen_rect
+from chaco.tiled_image_data import TiledImageData
 
 try:
     # InterpolationQuality required for Quartz backend only (requires OSX).
@@ -254,6 +255,9 @@ class ImagePlot(Base2DPlot):
         """Computes the correct screen coordinates and renders an image into
         `self._cached_image`.
 
+        If the `value` is a TiledImageData, only the region of the pyramid
+        level which has about one pixel per screen pixel is used.
+
         Parameters
         ----------
         data : array
@@ -263,6 +267,7 @@ class ImagePlot(Base2DPlot):
             region. This may be used to adapt grayscale images to RGB(A)
             images.
         """
+        tiled = data is None and isinstance(self.value, TiledImageData)
         if data is None:
             data = self.value.data
 
@@ -274,7 +279,13 @@ class ImagePlot(Base2DPlot):
         sub_array_size = (col_max - col_min, row_max - row_min)
         screen_rect = trim_screen_rect(screen_rect, view_rect, sub_array_size)
 
-        data = data[row_min:row_max, col_min:col_max]
+        level = self._calc_pyramid_level(index_bounds, screen_rect)
+        if tiled and level > 0:
+            data, screen_rect = self._pyramid_region(
+                level, index_bounds, screen_rect
+            )
+        else:
+            data = data[row_min:row_max, col_min:col_max]
 
         if mapper is not None:
             data = mapper(data)
@@ -287,6 +298,67 @@ class ImagePlot(Base2DPlot):
         self._cached_dest_rect = tuple(screen_rect)
         self._image_cache_valid = True
 
+    def _calc_pyramid_level(self, index_bounds, screen_rect):
+        """Returns the coarsest level of a TiledImageData pyramid which has
+        at least one pixel per screen pixel for the given region.
+        """
+        if not isinstance(self.value, TiledImageData):
+            return 0
+        col_min, col_max, row_min, row_max = index_bounds
+        screen_width, screen_height = screen_rect[2:]
+        if screen_width <= 0 or screen_height <= 0:
+            return 0
+        pixels_per_screen_pixel = min(
+            (col_max - col_min) / screen_width,
+            (row_max - row_min) / screen_height,
+        )
+        if pixels_per_screen_pixel < 2:
+            return 0
+        level = int(floor(log2(pixels_per_screen_pixel)))
+        return min(level, self.value.levels - 1)
+
+    def _pyramid_region(self, level, index_bounds, screen_rect):
+        """Returns the region of a pyramid level covering the given region
+        of the image, and the screen rectangle to draw it in.
+
+        The region is extended to whole pixels of the level, so the screen
+        rectangle is extended by the same amount.
+        """
+        col_min, col_max, row_min, row_max = index_bounds
+        x, y, width, height = screen_rect
+        scale = 2 ** level
+
+        level_col_min, level_row_min = col_min // scale, row_min // scale
+        level_col_max = -(-col_max // scale)
+        level_row_max = -(-row_max // scale)
+        data = self.value.get_region(
+            level, level_row_min, level_row_max, level_col_min, level_col_max
+        )
+
+        # The extensions of the region at the low and high array indices.
+        array_width = self.value.get_width()
+        array_height = self.value.get_height()
+        x_scale = width / (col_max - col_min)
+        y_scale = height / (row_max - row_min)
+        low_x = (col_min - level_col_min * scale) * x_scale
+        high_x = (min(level_col_max * scale, array_width) - col_max) * x_scale
+        low_y = (row_min - level_row_min * scale) * y_scale
+        high_y = (min(level_row_max * scale, array_height) - row_max) * y_scale
+
+        # The screen rectangle is flipped with respect to the array indices
+        # along flipped axes.
+        if self.x_axis_is_flipped:
+            low_x, high_x = high_x, low_x
+        if self.y_axis_is_flipped:
+            low_y, high_y = high_y, low_y
+        screen_rect = [
+            x - low_x,
+            y - low_y,
+            width + low_x + high_x,
+            height + low_y + high_y,
+        ]
+        return data, screen_rect
+
     def _kiva_array_from_numpy_array(self, data):
         if data.shape[2] not in KIVA_DEPTH_MAP:
             msg = "Unknown colormap depth value: {}"
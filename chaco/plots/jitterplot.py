@@ -32,7 +32,12 @@ class JitterPlot(ScatterPlot1D):
     # Private traits
     # ------------------------------------------------------------------------
 
-    _cached_screen_map = Any()  # dict mapping index to value points
+    # The jitter of each point of _jitter_data, as a fraction of the jitter
+    # width.
+    _cached_jitter = Any(transient=True)
+
+    # The data array for which _cached_jitter was computed.
+    _jitter_data = Any(transient=True)
 
     # ------------------------------------------------------------------------
     # Component/AbstractPlotRenderer interface
@@ -43,37 +48,32 @@ class JitterPlot(ScatterPlot1D):
         an array.  Although the orthogonal (non-scaled) axis does not have
         a mapper, this method returns the scattered values in that dimension.
 
+        The scattered value of each point is derived from a hash of its value
+        and its position in *data_array*, so the points of a data source
+        stay in the same place as the plot is panned or redrawn.
+
         Implements the AbstractPlotRenderer interface.
         """
         if len(data_array) == 0:
             return np.empty(shape=(0,))
 
-        if self._screen_cache_valid:
-            sm = self._cached_screen_map
-            new_x = [x for x in data_array if x not in sm]
-            if new_x:
-                new_y = self._make_jitter_vals(len(new_x))
-                sm.update(
-                    dict((new_x[i], new_y[i]) for i in range(len(new_x)))
-                )
-            xs = self.index_mapper.map_screen(data_array)
-            ys = [sm[x] for x in xs]
-
-        else:
-            xs = self.index_mapper.map_screen(data_array)
-            ys = self._make_jitter_vals(data_array)
+        xs = self.index_mapper.map_screen(data_array)
+        ys = self._make_jitter_vals(data_array)
 
         if self.orientation == "h":
-            return np.vstack((xs, ys)).T
+            return np.column_stack((xs, ys))
         else:
-            return np.vstack((ys, xs)).T
+            return np.column_stack((ys, xs))
 
     def _make_jitter_vals(self, data_array):
-        random_state = np.random.RandomState(data_array[:100].astype(int))
-        numpts = len(data_array)
-        vals = random_state.uniform(0, self.jitter_width, numpts)
-        vals += self._marker_position
-        return vals
+        if data_array is self._jitter_data:
+            jitter = self._cached_jitter
+        else:
+            jitter = _hash_uniform(data_array)
+            if data_array is self._cached_data:
+                self._cached_jitter = jitter
+                self._jitter_data = data_array
+        return jitter * self.jitter_width + self._marker_position
 
     def map_index(
         self,
@@ -136,22 +136,7 @@ class JitterPlot(ScatterPlot1D):
     # ------------------------------------------------------------------------
 
     def get_screen_points(self):
-        if not self._screen_cache_valid:
-            self._gather_points()
-            pts = self.map_screen(self._cached_data)
-            if self.orientation == "h":
-                self._cached_screen_map = dict(
-                    (x, y) for x, y in zip(pts[:, 0], pts[:, 1])
-                )
-            else:
-                self._cached_screen_map = dict(
-                    (y, x) for x, y in zip(pts[:, 0], pts[:, 1])
-                )
-            self._cached_screen_pts = pts
-            self._screen_cache_valid = True
-            self._cached_data_pts_sorted = None
-            self._cached_data_argsort = None
-        return self._cached_screen_pts
+        return self._compute_screen_coord()
 
     def _get_marker_position(self):
         x, y = self.position
@@ -169,3 +154,23 @@ class JitterPlot(ScatterPlot1D):
 
         position += self.marker_offset
         return position
+
+
+def _hash_uniform(data_array):
+    """Returns a pseudo-random value in [0, 1) for each value of an array,
+    computed from the value and its position in the array.
+
+    This uses the finalizer of the SplitMix64 generator, which thoroughly
+    mixes the bits of its input, so nearby values and positions give
+    unrelated results.
+    """
+    values = np.ascontiguousarray(data_array, dtype=float).view(np.uint64)
+    positions = np.arange(len(values), dtype=np.uint64)
+    bits = values ^ (positions * np.uint64(0x9E3779B97F4A7C15))
+    bits ^= bits >> np.uint64(30)
+    bits *= np.uint64(0xBF58476D1CE4E5B9)
+    bits ^= bits >> np.uint64(27)
+    bits *= np.uint64(0x94D049BB133111EB)
+    bits ^= bits >> np.uint64(31)
+    # use the top 53 bits, the precision of a double
+    return (bits >> np.uint64(11)) * (1.0 / 2 ** 53)
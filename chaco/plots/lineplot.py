@@ -17,12 +17,15 @@ import warnings
 
 # Major library imports
 from numpy import (
+    append,
     argsort,
     array,
     concatenate,
     inf,
     invert,
+    isfinite,
     isnan,
+    searchsorted,
     take,
     transpose,
     zeros,
@@ -34,12 +37,23 @@ from numpy import (
 
 # Enthought library imports
 from enable.api import black_color_trait, ColorTrait, LineStyle
-from traits.api import Enum, Float, List, Str, Property, Tuple, cached_property
+from traits.api import (
+    Any, Bool, Enum, Float, List, Str, Property, Tuple, cached_property
+)
 from traitsui.api import Item, View
 
 # Local relative imports
-from chaco.base import arg_find_runs, arg_true_runs, reverse_map_1d, intersect_range
+from chaco.array_data_source import ArrayDataSource
+from chaco.base import (
+    arg_find_runs,
+    arg_true_runs,
+    reverse_map_1d,
+    intersect_range,
+    sorted_range_slice,
+)
 from chaco.base_xy_plot import BaseXYPlot
+from chaco.downsample.incremental import IncrementalDownsampler
+from chaco.downsample.methods import get_downsample_method
 
 
 class LinePlot(BaseXYPlot):
@@ -89,6 +103,29 @@ class LinePlot(BaseXYPlot):
     #:     point.  Also called a "right angle plot".
     render_style = Enum("connectedpoints", "hold", "connectedhold")
 
+    #: Whether to gather points from the value data source's min/max
+    #: level-of-detail pyramid (see :meth:`ArrayDataSource.get_lod_pyramid`).
+    #: This is only used when the index is sorted and the value is an
+    #: ArrayDataSource.  Panning and zooming then only touch the pyramid
+    #: buckets which are visible, rather than the whole data set, at the cost
+    #: of building the pyramid once per data change.
+    use_lod_pyramid = Bool(False)
+
+    #: The name of the method used to downsample the line in screen space
+    #: when :attr:`use_downsampling` is True.  This is one of the methods
+    #: registered in :mod:`chaco.downsample.methods`; the built-in methods
+    #: are "lttb" (largest triangle three buckets), "m4" (first, last,
+    #: minimum and maximum point of each pixel column, which is pixel-exact),
+    #: "min_max" (minimum and maximum of each pixel column) and "stride".
+    downsample_method = Str("lttb")
+
+    #: Whether downsampled points are cached on a grid of buckets of fixed
+    #: width in data space, so that panning at a fixed zoom level only
+    #: downsamples the data newly exposed at the edges of the view.  This is
+    #: only used when :attr:`use_downsampling` is True and the index is sorted
+    #: in ascending order.
+    incremental_downsampling = Bool(False)
+
     #: TraitsUI View for customizing the plot.
     traits_view = View(
         Item("color", style="custom"),
@@ -109,6 +146,10 @@ class LinePlot(BaseXYPlot):
     # Cached list of non-NaN arrays of (x,y) screen-space points.
     _cached_screen_pts = List
 
+    # Cache of downsampled data-space points used for incremental
+    # downsampling.
+    _downsample_cache = Any
+
     def hittest(self, screen_pt, threshold=7.0, return_distance=False):
         """
         Tests whether the given screen point is within *threshold* pixels of
@@ -254,6 +295,9 @@ class LinePlot(BaseXYPlot):
         return yp
 
     def get_screen_points(self):
+        incremental = self._incremental_downsampling_available()
+        if self.use_downsampling and incremental:
+            return self._downsample_incremental()
         self._gather_points()
         if self.use_downsampling:
             return self._downsample()
@@ -304,6 +348,28 @@ class LinePlot(BaseXYPlot):
                 index_max = len(value)
                 index = index[:index_max]
 
+            # With a sorted index, the visible window can be found by binary
+            # search, and only (zero-copy) slices of the data are examined.
+            window = slice(None)
+            if self.index.sort_order != "none":
+                window = sorted_range_slice(
+                    index,
+                    self.index_range.low,
+                    self.index_range.high,
+                    self.index.sort_order,
+                    pad=1,
+                )
+
+            if self._lod_pyramid_available():
+                points = self._gather_lod_points(index, value, window)
+                if points is not None:
+                    self._cached_data_pts = points
+                    self._cache_valid = True
+                    return
+
+            index = index[window]
+            value = value[window]
+
             # TODO: restore the functionality of rendering highlighted portions
             # of the line
             # selection = self.index.metadata.get(self.metadata_name, None)
@@ -329,20 +395,59 @@ class LinePlot(BaseXYPlot):
             self._cached_data_pts = points
             self._cache_valid = True
 
+    def _lod_pyramid_available(self):
+        """ Whether points can be gathered from a level-of-detail pyramid.
+        """
+        return (
+            self.use_lod_pyramid
+            and self.index.sort_order != "none"
+            and isinstance(self.value, ArrayDataSource)
+        )
+
+    def _gather_lod_points(self, index, value, window):
+        """ Gathers the points of the visible window of a sorted index from
+        the value's min/max pyramid.
+
+        The pyramid level is chosen so that there is at least one bucket per
+        screen pixel along the index axis.  Returns None if the window is
+        small enough to be drawn from the raw data.
+        """
+        m = self.index_mapper
+        n_pixels = int(abs(m.high_pos - m.low_pos))
+        runs = self.value.get_lod_pyramid().gather(
+            window.start, window.stop, n_pixels
+        )
+        if runs is None:
+            return None
+
+        # The pyramid covers all of the values, so its buckets may extend
+        # past the end of a shorter index.
+        n_points = len(index)
+        points = []
+        for pos in runs:
+            n_kept = searchsorted(pos, n_points)
+            if n_kept == 0:
+                break
+            if n_kept < len(pos):
+                # end the run at the last point of the index instead
+                pos = pos[:n_kept]
+                last = n_points - 1
+                if pos[-1] != last and not isnan(value[last]):
+                    pos = append(pos, last)
+            points.append(column_stack([take(index, pos), take(value, pos)]))
+        return points
+
     def _downsample(self):
         if not self._screen_cache_valid:
             m = self.index_mapper
-            delta_screen = int(m.high_pos - m.low_pos)
+            delta_screen = int(abs(m.high_pos - m.low_pos))
             if delta_screen == 0:
                 downsampled = []
             else:
-                # TODO: implement other downsampling methods
-                from chaco.downsample.lttb import (
-                    largest_triangle_three_buckets,
-                )
-
+                method = get_downsample_method(self.downsample_method)
+                bounds = (self.index_range.low, self.index_range.high)
                 downsampled = [
-                    largest_triangle_three_buckets(p, delta_screen)
+                    method(p, delta_screen, bounds)
                     for p in self._cached_data_pts
                 ]
 
@@ -443,6 +548,78 @@ class LinePlot(BaseXYPlot):
         d = z[:, 0] + z[:, 1]
         # ... TODO ...
 
+    def _incremental_downsampling_available(self):
+        """ Whether the incremental downsampling cache can be used. """
+        return (
+            self.incremental_downsampling
+            and self.index is not None
+            and self.value is not None
+            and self.index.sort_order == "ascending"
+        )
+
+    def _downsample_incremental(self):
+        """ Downsamples the visible data through the incremental cache.
+
+        Unlike :meth:`_downsample`, this reads the visible window directly
+        from the data sources rather than from the gathered points, so the
+        cost of a pan is proportional to the amount of newly exposed data.
+        """
+        if not self._screen_cache_valid:
+            index = self.index.get_data()
+            value = self.value.get_data()
+            size = min(len(index), len(value))
+            m = self.index_mapper
+            n_buckets = int(abs(m.high_pos - m.low_pos))
+            low = self.index_range.low
+            high = self.index_range.high
+
+            if size == 0 or n_buckets == 0 or not high > low:
+                self._cached_screen_pts = []
+            else:
+                if self._downsample_cache is None:
+                    self._downsample_cache = IncrementalDownsampler()
+                points = self._downsample_cache.downsample(
+                    index[:size],
+                    value[:size],
+                    low,
+                    high,
+                    n_buckets,
+                    self.downsample_method,
+                )
+                self._cached_screen_pts = [
+                    self.map_screen(points[start:end])
+                    for start, end in arg_true_runs(isfinite(points[:, 1]))
+                ]
+            self._screen_cache_valid = True
+
+        return self._cached_screen_pts
+
+    def _either_data_updated(self, event=None):
+        if self._downsample_cache is not None:
+            change = getattr(event, "new", None)
+            if isinstance(change, dict) and "appended" in change:
+                self._trim_downsample_cache(event.object, change)
+            else:
+                self._downsample_cache.clear()
+        super()._either_data_updated(event)
+
+    def _trim_downsample_cache(self, source, change):
+        """ Keeps the cached downsampled points of data which is unchanged
+        after values are appended to one of the data sources.
+        """
+        index = self.index.get_data()
+        if len(index) == 0:
+            self._downsample_cache.clear()
+            return
+        # the position of the first appended value
+        position = source.get_size() - len(change["appended"])
+        position = min(max(position, 0), len(index) - 1)
+        self._downsample_cache.discard_outside(index[0], index[position])
+
+    def _downsample_method_changed(self):
+        self._screen_cache_valid = False
+        self.invalidate_and_redraw()
+
     @cached_property
     def _get_effective_color(self):
         alpha = self.color_[-1] if len(self.color_) == 4 else 1
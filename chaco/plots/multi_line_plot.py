@@ -12,34 +12,51 @@
 """
 
 
-# Standard library imports
-import warnings
-from math import ceil, floor
-
 # Major library imports
 import numpy as np
-from numpy import argsort, array, invert, isnan, take, transpose
+from numpy import (
+    arange,
+    broadcast_to,
+    argsort,
+    column_stack,
+    concatenate,
+    cumsum,
+    diff,
+    empty,
+    errstate,
+    flatnonzero,
+    fmax,
+    fmin,
+    int8,
+    invert,
+    isnan,
+    split,
+    take_along_axis,
+    zeros,
+)
 
 # Enthought library imports
 from enable.api import black_color_trait, ColorTrait, LineStyle
 from traits.api import (
+    Any,
     Float,
-    List,
     Str,
     Bool,
     Callable,
     Property,
     cached_property,
     Instance,
+    Int,
     Array,
     Union,
 )
 from traitsui.api import Item, View, ScrubberEditor, HGroup
 
 from chaco.array_data_source import ArrayDataSource
-from chaco.base import arg_find_runs, bin_search
+from chaco.base import bin_search, sorted_range_slice
 from chaco.base_xy_plot import BaseXYPlot
 from chaco.chaco_traits import Optional
+from chaco.downsample.extrema import m4_rows
 
 
 class MultiLinePlot(BaseXYPlot):
@@ -184,13 +201,20 @@ class MultiLinePlot(BaseXYPlot):
         ],
     )
 
-    # Cached list of non-NaN arrays of (x,y) data-space points; regardless of
-    # self.orientation, this is always stored as (index_pt, value_pt).  This is
-    # different from the default BaseXYPlot definition.
-    _cached_data_pts = List
+    # The gathered traces which are drawn with all of the visible points of
+    # a sorted index, as a tuple (index, values, traces) of the visible
+    # index values, the M by N array of the values of the traces, and the
+    # indices of the traces; or None.  Regardless of self.orientation, the
+    # data is always stored as index and value points.
+    _cached_grid = Any
+
+    # The other gathered traces, as a tuple (points, ends, traces) of an N by
+    # 2 array of the (index, value) points of all of the runs of non-NaN
+    # points, the end of each run in the array, and the trace of each run.
+    _cached_runs = Any
 
-    # Cached list of non-NaN arrays of (x,y) screen-space points.
-    _cached_screen_pts = List
+    # The number of traces when the points were gathered.
+    _n_cached_traces = Int
 
     # ------------------------------------------------------------------------
     #
@@ -231,12 +255,32 @@ class MultiLinePlot(BaseXYPlot):
     # def interpolate(self, index_value):
 
     def get_screen_points(self):
+        """Returns a list of the lists of the runs of screen points of each
+        trace.
+        """
         self._gather_points()
-        scrn_pts_list = [
-            [self.map_screen(ary) for ary in line]
-            for line in self._cached_data_pts
-        ]
-        return scrn_pts_list
+        if not self._cache_valid:
+            return []
+
+        lines = [[] for k in range(self._n_cached_traces)]
+        if self._cached_grid is not None:
+            # the index is mapped once for all of the traces
+            index, values, traces = self._cached_grid
+            screen_pts = empty(values.shape + (2,))
+            if self.orientation == "h":
+                x, y = 0, 1
+            else:
+                x, y = 1, 0
+            screen_pts[:, :, x] = self.index_mapper.map_screen(index)
+            screen_pts[:, :, y] = self.value_mapper.map_screen(values)
+            for trace, run in zip(traces.tolist(), screen_pts):
+                lines[trace].append(run)
+
+        points, ends, traces = self._cached_runs
+        runs = split(self.map_screen(points), ends[:-1])
+        for trace, run in zip(traces.tolist(), runs):
+            lines[trace].append(run)
+        return lines
 
     # ------------------------------------------------------------------------
     # Private methods
@@ -297,6 +341,13 @@ class MultiLinePlot(BaseXYPlot):
         """
         Collects the data points that are within the bounds of the plot and
         caches them.
+
+        The points of all of the traces are gathered at once: the columns of
+        the data are culled to the index range, the traces are culled to the
+        value range, and the remaining points are split into runs without
+        NaNs.  With a sorted index, the traces without NaNs are kept as one
+        2D array, and if **use_downsampling** is True they are downsampled
+        to the width of the plot.
         """
 
         if self._cache_valid:
@@ -307,159 +358,187 @@ class MultiLinePlot(BaseXYPlot):
 
         index = self.index.get_data()
         varray = self._trace_data
-
-        if varray.size == 0:
-            self._cached_data_pts = []
-            self._cached_valid = True
-            return
-
-        coordinates = self.yindex.get_data()
-
-        if self.fast_clip:
-            coord_min = float(coordinates[0])
-            coord_max = coordinates[-1]
-            slice_min = max(
-                0,
-                ceil(
-                    (varray.shape[0] - 1)
-                    * (self.value_range.low - coord_min)
-                    / (coord_max - coord_min)
-                ),
-            )
-            slice_max = min(
-                varray.shape[0],
-                1 + floor(
-                    (varray.shape[0] - 1)
-                    * (self.value_range.high - coord_min)
-                    / (coord_max - coord_min)
-                ),
-            )
-            varray = varray[slice_min:slice_max]
-            # FIXME: The y coordinates must also be sliced to match varray.
-
-        # Check to see if the data is completely outside the view region.
-        outside = False
-        # Check x coordinates.
-        low, high = self.index.get_bounds()
-        if low > self.index_range.high or high < self.index_range.low:
-            outside = True
-
-        # Check y coordinates. Use varray because it is nased on the yindex,
-        # but has been shifted up or down depending on the values.
-        ylow, yhigh = varray.min(), varray.max()
-        if ylow > self.value_range.high or yhigh < self.value_range.low:
-            outside = True
-
-        if outside:
-            self._cached_data_pts = []
-            self._cached_valid = True
-            return
+        self._n_cached_traces = varray.shape[0]
+        self._cached_grid = None
+        self._cached_runs = (empty((0, 2)), arange(0), arange(0))
 
         if (
-            len(index) == 0
-            or varray.shape[0] == 0
-            or varray.shape[1] == 0
+            varray.size == 0
+            or len(index) == 0
             or len(index) != varray.shape[1]
         ):
-            self._cached_data_pts = []
             self._cache_valid = True
             return
 
-        size_diff = varray.shape[1] - len(index)
-        if size_diff > 0:
-            warnings.warn(
-                "Chaco.LinePlot: value.shape[1] %d - len(index) %d = %d\n"
-                % (varray.shape[1], len(index), size_diff)
+        # With a sorted index, the visible columns can be found by binary
+        # search, and only (zero-copy) slices of the data are examined.
+        sorted_index = self.index.sort_order != "none"
+        if sorted_index:
+            window = sorted_range_slice(
+                index,
+                self.index_range.low,
+                self.index_range.high,
+                self.index.sort_order,
+                pad=1,
             )
-            index_max = len(index)
-            varray = varray[:, :index_max]
+            index = index[window]
+            varray = varray[:, window]
+
+        traces, has_nans = self._visible_traces(varray)
+        if len(traces) < varray.shape[0]:
+            values = varray[traces]
+        else:
+            values = varray
+        in_range = self.index_range.mask_data(index)
+
+        if not in_range.any():
+            # The view is between two points of the index data, so draw the
+            # points bracketing it.
+            self._cached_runs = self._bracketing_runs(index, values, traces)
+        elif sorted_index and not isnan(index).any():
+            # The traces without NaNs are drawn with every visible point,
+            # or downsampled together because they share their index.
+            solid = invert(has_nans)
+            if not solid.all():
+                self._cached_runs = self._nan_free_runs(
+                    index, values[has_nans], in_range, traces[has_nans]
+                )
+                values = values[solid]
+            if self.use_downsampling:
+                self._cached_runs = self._concatenate_runs(
+                    self._cached_runs,
+                    self._downsampled_runs(index, values, traces[solid]),
+                )
+            else:
+                self._cached_grid = (index, values, traces[solid])
         else:
-            index_max = varray.shape[1]
-            index = index[:index_max]
-
-        # Split the index and value raw data into non-NaN chunks.
-        # nan_mask is a boolean M by N array.
-        nan_mask = invert(isnan(varray)) & invert(isnan(index))
-        blocks_list = []
-        for nm in nan_mask:
-            blocks = [b for b in arg_find_runs(nm, "flat") if nm[b[0]] != 0]
-            blocks_list.append(blocks)
-
-        line_points = []
-        for k, blocks in enumerate(blocks_list):
-            points = []
-            for block in blocks:
-                start, end = block
-                block_index = index[start:end]
-                block_value = varray[k, start:end]
-                index_mask = self.index_mapper.range.mask_data(block_index)
-
-                runs = [
-                    r
-                    for r in arg_find_runs(index_mask, "flat")
-                    if index_mask[r[0]] != 0
-                ]
-
-                # Check to see if our data view region is between two points in the
-                # index data.  If so, then we have to reverse map our current view
-                # into the appropriate index and draw the bracketing points.
-                if runs == []:
-                    data_pt = self.map_data(
-                        (self.x_mapper.low_pos, self.y_mapper.low_pos)
-                    )
-                    if self.index.sort_order == "none":
-                        indices = argsort(index)
-                        sorted_index = take(index, indices)
-                        sorted_value = take(varray[k], indices)
-                        sort = 1
-                    else:
-                        sorted_index = index
-                        sorted_value = varray[k]
-                        if self.index.sort_order == "ascending":
-                            sort = 1
-                        else:
-                            sort = -1
-                    ndx = bin_search(sorted_index, data_pt, sort)
-                    if ndx == -1:
-                        # bin_search can return -1 if data_pt is outside the bounds
-                        # of the source data
-                        continue
-
-                    z = transpose(
-                        array(
-                            (
-                                sorted_index[ndx: ndx + 2],
-                                sorted_value[ndx: ndx + 2],
-                            )
-                        )
-                    )
-                    points.append(z)
-
-                else:
-                    # Expand the width of every group of points so we draw the lines
-                    # up to their next point, outside the plot area
-                    data_end = len(index_mask)
-                    for run in runs:
-                        start, end = run
-                        if start != 0:
-                            start -= 1
-                        if end != data_end:
-                            end += 1
-
-                        run_data = transpose(
-                            array(
-                                (
-                                    block_index[start:end],
-                                    block_value[start:end],
-                                )
-                            )
-                        )
-                        points.append(run_data)
-            line_points.append(points)
-
-        self._cached_data_pts = line_points
+            self._cached_runs = self._nan_free_runs(
+                index, values, in_range, traces
+            )
+
         self._cache_valid = True
 
+    def _visible_traces(self, varray):
+        """Returns the indices of the rows of *varray* which may be visible,
+        and whether each of these rows has NaNs.
+
+        If **fast_clip** is True, the visible traces are those whose base
+        coordinate is in the value range; otherwise they are the traces with
+        values on both sides of the value range.
+        """
+        n_traces, n_points = varray.shape
+        if n_points == 0:
+            return arange(0), zeros(0, dtype=bool)
+
+        with errstate(invalid="ignore"):
+            # minimum and maximum propagate NaNs, while fmin and fmax ignore
+            # them; only the traces with NaNs need the second pass.
+            low = varray.min(axis=1)
+            high = varray.max(axis=1)
+            has_nans = isnan(low)
+            if has_nans.any():
+                low[has_nans] = fmin.reduce(varray[has_nans], axis=1)
+                high[has_nans] = fmax.reduce(varray[has_nans], axis=1)
+
+            value_range = self.value_range
+            if self.fast_clip:
+                coordinates = self.yindex.get_data()
+                base = self.scale * coordinates + self.offset
+                visible = value_range.mask_data(base)
+            else:
+                # all-NaN traces have NaN bounds and are culled
+                visible = (high >= value_range.low) & (
+                    low <= value_range.high
+                )
+        traces = flatnonzero(visible)
+        return traces, has_nans[traces]
+
+    def _nan_free_runs(self, index, values, in_range, traces):
+        """Returns the runs of non-NaN points of *values* which are in the
+        index range, extended by one point on either side so that the lines
+        are drawn up to the edges of the plot.
+        """
+        valid = invert(isnan(values)) & invert(isnan(index))
+        inside = valid & in_range
+        keep = inside.copy()
+        keep[:, 1:] |= inside[:, :-1] & valid[:, 1:]
+        keep[:, :-1] |= inside[:, 1:] & valid[:, :-1]
+
+        # Append a column of False to separate the runs of successive rows
+        # once the mask is flattened.
+        n_rows, n_cols = keep.shape
+        padded = zeros((n_rows, n_cols + 1), dtype=bool)
+        padded[:, :-1] = keep
+        flat = padded.ravel()
+        edges = diff(flat.view(int8), prepend=int8(0))
+        starts = flatnonzero(edges == 1)
+        ends = flatnonzero(edges == -1)
+
+        kept = flatnonzero(flat)
+        rows, columns = divmod(kept, n_cols + 1)
+        points = column_stack([index[columns], values[rows, columns]])
+        return points, cumsum(ends - starts), traces[starts // (n_cols + 1)]
+
+    def _downsampled_runs(self, index, values, traces):
+        """Returns one downsampled run of points for each row of *values*,
+        which has no NaNs.
+        """
+        m = self.index_mapper
+        n_buckets = int(abs(m.high_pos - m.low_pos))
+        positions = m4_rows(
+            index,
+            values,
+            n_buckets,
+            (self.index_range.low, self.index_range.high),
+        )
+        return self._runs_at(index, values, traces, positions)
+
+    def _bracketing_runs(self, index, values, traces):
+        """Returns the runs between the points of the traces which bracket
+        the low end of the index range.
+        """
+        data_pt = self.map_data((self.x_mapper.low_pos, self.y_mapper.low_pos))
+        if self.index.sort_order == "none":
+            order = argsort(index)
+            sort = 1
+        else:
+            order = arange(len(index))
+            if self.index.sort_order == "ascending":
+                sort = 1
+            else:
+                sort = -1
+        ndx = bin_search(index[order], data_pt, sort) if len(index) else -1
+        if ndx == -1:
+            # bin_search can return -1 if data_pt is outside the bounds of
+            # the source data
+            return empty((0, 2)), arange(0), traces[:0]
+
+        positions = broadcast_to(order[ndx:ndx + 2], (len(traces), 2))
+        return self._runs_at(index, values, traces, positions)
+
+    def _runs_at(self, index, values, traces, positions):
+        """Returns one run of points for each row of *values*, at the
+        positions in the same row of *positions*.
+        """
+        n_rows, n_points = positions.shape
+        points = empty((n_rows, n_points, 2))
+        points[:, :, 0] = index[positions]
+        points[:, :, 1] = take_along_axis(values, positions, axis=1)
+        return (
+            points.reshape(-1, 2),
+            arange(1, n_rows + 1) * n_points,
+            traces,
+        )
+
+    def _concatenate_runs(self, runs, other_runs):
+        points, ends, traces = runs
+        other_points, other_ends, other_traces = other_runs
+        return (
+            concatenate([points, other_points]),
+            concatenate([ends, other_ends + len(points)]),
+            concatenate([traces, other_traces]),
+        )
+
     # See base_xy_plot.py for:
     # def _downsample(self):
     # def _downsample_vectorized(self):
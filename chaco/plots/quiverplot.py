@@ -53,10 +53,10 @@ class QuiverPlot(ScatterPlot):
     _cached_vector_data = Array
     _selected_vector_data = Array
 
-    def _gather_points_old(self):
+    def _gather_points(self):
         # In addition to the standard scatterplot _gather_points, we need
         # to also grab the vectors that fall inside the view range
-        super()._gather_points_old()
+        super()._gather_points()
 
         if not self.index or not self.value:
             return
@@ -72,7 +72,9 @@ class QuiverPlot(ScatterPlot):
 
         if self._cached_selected_pts is not None:
             indices = self._cached_selection_point_mask
-            self._selected_vector_data = compress(indices, vectors, axis=0)
+            self._selected_vector_data = compress(
+                indices, self._cached_vector_data, axis=0
+            )
         else:
             self._selected_vector_data = None
 
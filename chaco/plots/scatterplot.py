@@ -20,16 +20,28 @@ from numpy import (
     around,
     array,
     asarray,
+    bincount,
+    ceil,
     column_stack,
     empty,
+    floor,
+    full,
+    intp,
     isfinite,
     isnan,
+    log1p,
+    logical_and,
+    maximum,
+    minimum,
+    nan,
     nanargmin,
     ndarray,
     sqrt,
     sum,
     transpose,
+    uint8,
     where,
+    zeros,
 )
 
 # Enthought library imports
@@ -41,14 +53,17 @@ from enable.api import (
     MarkerNameDict,
     MarkerTrait,
 )
+from kiva.agg import GraphicsContextArray
 from kiva.constants import STROKE
 from traits.api import (
     Any,
     Array,
     ArrayOrNone,
     Bool,
+    Enum,
     Float,
     Callable,
+    Int,
     Property,
     Tuple,
     cached_property,
@@ -59,7 +74,8 @@ from traitsui.api import View, VGroup, Item
 # Local relative imports
 from chaco.base_xy_plot import BaseXYPlot
 from chaco.speedups import scatterplot_gather_points
-from chaco.base import reverse_map_1d
+from chaco.base import reverse_map_1d, sorted_range_slice
+from chaco.spatial_index import GridIndex
 
 # ------------------------------------------------------------------------------
 # TraitsUI View for customizing a scatter plot.
@@ -201,6 +217,68 @@ def render_markers(
                     gc.draw_path(STROKE)
 
 
+def bin_screen_points(points, rect, values=None, statistic="mean"):
+    """Bins a set of (x,y) screen points into a 2D histogram of pixels.
+
+    Parameters
+    ----------
+    points : array of (x,y) points
+        The screen points to bin
+    rect : tuple of (x, y, width, height)
+        The screen rectangle covered by the histogram, with one bin per
+        pixel; *width* and *height* must be integers.  Points outside the
+        rectangle are ignored.
+    values : 1D array
+        An optional value for each point, which is aggregated per bin
+    statistic : "mean" or "max"
+        How the values of the points in each bin are aggregated
+
+    Returns
+    -------
+    counts : height by width array of int
+        The number of points in each bin.  As in an image, the first row is
+        the top of the rectangle.
+    aggregate : height by width array of float or None
+        The mean or maximum of the values in each bin, or NaN for an empty
+        bin.  None if no values were given.
+    """
+    x0, y0, width, height = rect
+    points = asarray(points, dtype=float).reshape(-1, 2)
+    x = points[:, 0] - x0
+    y = points[:, 1] - y0
+    inside = (x >= 0) & (x <= width) & (y >= 0) & (y <= height)
+    if not inside.all():
+        x = x[inside]
+        y = y[inside]
+        if values is not None:
+            values = asarray(values)[inside]
+
+    # Points on the right or top edge belong to the last column or row.
+    columns = minimum(floor(x), width - 1).astype(intp)
+    rows = (height - 1) - minimum(floor(y), height - 1).astype(intp)
+    bins = rows * width + columns
+    n_bins = width * height
+
+    counts = bincount(bins, minlength=n_bins)
+    if values is None:
+        aggregate = None
+    elif statistic == "mean":
+        with_counts = counts > 0
+        aggregate = full(n_bins, nan)
+        sums = bincount(bins, weights=values, minlength=n_bins)
+        aggregate[with_counts] = sums[with_counts] / counts[with_counts]
+        aggregate = aggregate.reshape(height, width)
+    elif statistic == "max":
+        aggregate = full(n_bins, -float("inf"))
+        maximum.at(aggregate, bins, values)
+        aggregate[counts == 0] = nan
+        aggregate = aggregate.reshape(height, width)
+    else:
+        raise ValueError("Unknown statistic: {!r}".format(statistic))
+
+    return counts.reshape(height, width), aggregate
+
+
 # ------------------------------------------------------------------------------
 # The scatter plot
 # ------------------------------------------------------------------------------
@@ -258,6 +336,27 @@ class ScatterPlot(BaseXYPlot):
     # TraitsUI View for customizing the plot.
     traits_view = ScatterPlotView()
 
+    # How the points are drawn:
+    #
+    # markers:
+    #     Draw a marker for each point.
+    # density:
+    #     Draw an image of the number of points in each screen pixel, which
+    #     takes time proportional to the number of points but is much faster
+    #     than drawing the same number of markers.
+    # auto:
+    #     Draw markers unless there are more than **density_threshold**
+    #     points within the bounds of the plot.
+    render_style = Enum("auto", "markers", "density", requires_redraw=True)
+
+    # The number of visible points above which the "auto" render style draws
+    # a density image instead of markers.
+    density_threshold = Int(1000000, requires_redraw=True)
+
+    # Hit-tests use a grid index of the data points, which is built by the
+    # first hit-test after the data changes (overrides BaseXYPlot).
+    use_subdivision = True
+
     # ------------------------------------------------------------------------
     # Selection and selection rendering
     # A selection on the lot is indicated by setting the index or value
@@ -285,8 +384,10 @@ class ScatterPlot(BaseXYPlot):
     _cached_selected_pts = ArrayOrNone(transient=True)
     _cached_selected_screen_pts = Array(transient=True)
     _cached_point_mask = Array(transient=True)
+    # The mask of the selected points among the cached data points.
     _cached_selection_point_mask = Array(transient=True)
     _selection_cache_valid = Bool(False, transient=True)
+    _subdivision = Any(transient=True)
 
     # ------------------------------------------------------------------------
     # Overridden PlotRenderer methods
@@ -386,6 +487,10 @@ class ScatterPlot(BaseXYPlot):
                 return ndx
             else:
                 return None
+        elif self.use_subdivision and not index_only:
+            return self._map_index_subdivision(
+                screen_pt, threshold, index_data, value_data
+            )
         else:
             # Brute force implementation
             all_data = transpose(array([index_data, value_data]))
@@ -407,6 +512,53 @@ class ScatterPlot(BaseXYPlot):
     # Private methods; implements the BaseXYPlot stub methods
     # ------------------------------------------------------------------------
 
+    def _map_index_subdivision(
+        self, screen_pt, threshold, index_data, value_data
+    ):
+        """Finds the point closest to *screen_pt* using the grid index.
+
+        Gives the same result as the brute force search in map_index, but
+        only maps the points in the data-space rectangle around *screen_pt*
+        to screen space.
+        """
+        if self._subdivision is None:
+            self._update_subdivision()
+
+        # Allow for the rounding of the screen points to whole pixels.
+        radius = threshold + 1.0
+        sx, sy = screen_pt
+        corners = self.map_data(
+            (
+                array([sx - radius, sx + radius]),
+                array([sy - radius, sy + radius]),
+            )
+        )
+        index_low, index_high = sorted(corners[0])
+        value_low, value_high = sorted(corners[1])
+        candidates = self._subdivision.query(
+            index_low, index_high, value_low, value_high
+        )
+        if len(candidates) == 0:
+            return None
+
+        points = column_stack([index_data[candidates], value_data[candidates]])
+        delta = around(self.map_screen(points)) - array([screen_pt])
+        distances = sqrt(sum(delta * delta, axis=1))
+        closest_ndx = nanargmin(distances)
+        if distances[closest_ndx] <= threshold:
+            return candidates[closest_ndx]
+        else:
+            return None
+
+    def _update_subdivision(self):
+        self._subdivision = GridIndex(
+            self.index.get_data(), self.value.get_data()
+        )
+
+    def _set_up_subdivision(self):
+        # The grid index is built lazily by the next hit-test.
+        self._subdivision = None
+
     def _gather_points_old(self):
         """
         Collects the data points that are within the bounds of the plot and
@@ -427,17 +579,46 @@ class ScatterPlot(BaseXYPlot):
             self._cache_valid = True
             return
 
-        index_range_mask = self.index_mapper.range.mask_data(index)
-        value_range_mask = self.value_mapper.range.mask_data(value)
+        index_range = self.index_mapper.range
+        if self.index.sort_order == "none":
+            window = slice(None)
+            window_index = index
+            window_value = value
+            index_range_mask = index_range.mask_data(index)
+            nan_mask = (
+                isfinite(index) & index_mask & isfinite(value) & value_mask
+            )
+        else:
+            # With a sorted index the points within the index range form a
+            # contiguous window, which can be found by binary search.
+            window = sorted_range_slice(
+                index, index_range.low, index_range.high, self.index.sort_order
+            )
+            window_index = index[window]
+            window_value = value[window]
+            index_range_mask = True
+            nan_mask = (
+                isfinite(window_index)
+                & index_mask[window]
+                & isfinite(window_value)
+                & value_mask[window]
+            )
+        value_range_mask = self.value_mapper.range.mask_data(window_value)
+        window_mask = nan_mask & index_range_mask & value_range_mask
 
-        nan_mask = isfinite(index) & index_mask & isfinite(value) & value_mask
-        point_mask = nan_mask & index_range_mask & value_range_mask
+        if window == slice(None):
+            point_mask = window_mask
+        else:
+            point_mask = zeros(len(index), dtype=bool)
+            point_mask[window] = window_mask
 
         if not self._cache_valid:
-            if not point_mask.all():
-                points = column_stack([index[point_mask], value[point_mask]])
+            if not window_mask.all():
+                points = column_stack(
+                    [window_index[window_mask], window_value[window_mask]]
+                )
             else:
-                points = column_stack([index, value])
+                points = column_stack([window_index, window_value])
             self._cached_data_pts = points
             self._cached_point_mask = point_mask
             self._cache_valid = True
@@ -479,53 +660,128 @@ class ScatterPlot(BaseXYPlot):
                 self._selection_cache_valid = True
 
     def _gather_points_fast(self):
+        """
+        Collects the data points that are within the bounds of the plot and
+        the selected points among them, in a single pass over the data.
+        """
         if self._cache_valid and self._selection_cache_valid:
             return
 
         if not self.index or not self.value:
             return
 
-        index, index_mask = self.index.get_data_mask()
-        value, value_mask = self.value.get_data_mask()
+        index = self.index.get_data()
+        value = self.value.get_data()
+
+        if len(index) == 0 or len(value) == 0 or len(index) != len(value):
+            self._cached_data_pts = []
+            self._cached_point_mask = []
+            self._cached_selected_pts = None
+            self._cache_valid = True
+            self._selection_cache_valid = True
+            return
 
         index_range = self.index_mapper.range
         value_range = self.value_mapper.range
+        if self.index.sort_order == "none":
+            window = slice(0, len(index))
+        else:
+            # With a sorted index the points within the index range form a
+            # contiguous window, which can be found by binary search.
+            window = sorted_range_slice(
+                index, index_range.low, index_range.high, self.index.sort_order
+            )
+        start, stop, _ = window.indices(len(index))
 
-        kw = {}
+        kw = self._gather_selection_args(len(index), start, stop)
+        empty_selection = kw is None
+        if empty_selection:
+            kw = {}
         for axis in ("index", "value"):
             ds = getattr(self, axis)
-            if ds.metadata.get("selections", None) is not None:
-                kw[axis + "_sel"] = ds.metadata["selections"]
-            if ds.metadata.get("selection_mask", None) is not None:
-                kw[axis + "_sel_mask"] = ds.metadata["selection_mask"]
+            if ds.is_masked():
+                kw[axis + "_mask"] = ds.get_data_mask()[1][start:stop]
 
+        window_mask = empty(stop - start, dtype=bool)
         points, selections = scatterplot_gather_points(
-            index,
+            index[start:stop],
             index_range.low,
             index_range.high,
-            value,
+            value[start:stop],
             value_range.low,
             value_range.high,
-            index_mask=index_mask,
-            value_mask=value_mask,
+            point_mask=window_mask,
             **kw
         )
 
-        if not self._cache_valid:
-            self._cached_data_pts = points
-            self._cache_valid = True
+        if stop - start == len(index):
+            point_mask = window_mask
+        else:
+            point_mask = zeros(len(index), dtype=bool)
+            point_mask[start:stop] = window_mask
+
+        self._cached_data_pts = points
+        self._cached_point_mask = point_mask
+        self._cache_valid = True
+
+        if empty_selection:
+            self._cached_selected_pts = points[:0]
+            self._cached_selection_point_mask = zeros(len(points), dtype=bool)
+        elif selections is not None:
+            self._cached_selected_pts = points[selections]
+            self._cached_selection_point_mask = selections
+        else:
+            self._cached_selected_pts = None
+        self._selection_cache_valid = True
 
-        if not self._selection_cache_valid:
-            if selections is not None and len(selections) > 0:
-                self._cached_selected_pts = points[selections]
-                self._selection_cache_valid = True
-            else:
-                self._cached_selected_pts = None
-                self._selection_cache_valid = True
+    def _gather_selection_args(self, size, start, stop):
+        """Returns the selection arguments for scatterplot_gather_points,
+        restricted to the window of data from *start* to *stop*.
+
+        As in _gather_points_old, the first data source with a usable
+        "selection_masks" or "selections" metadata item is used.  Returns
+        None if the selection is empty, so that the (common) empty selection
+        doesn't need a pass over the data.
+        """
+        for ds in (self.index, self.value):
+            masks = ds.metadata.get("selection_masks", None)
+            selections = ds.metadata.get("selections", None)
+            if masks is not None:
+                masks = [asarray(mask, dtype=bool) for mask in masks]
+                if any(mask.shape != (size,) for mask in masks):
+                    continue
+                if len(masks) == 0:
+                    return None
+                elif len(masks) == 1:
+                    mask = masks[0]
+                else:
+                    mask = logical_and.reduce(masks)
+                return {"index_sel_mask": mask[start:stop]}
+            elif selections is not None:
+                # Tuples are not usable as index arrays; they are used for
+                # other kinds of selections, such as ranges of values.
+                if isinstance(selections, tuple):
+                    continue
+                selections = asarray(selections)
+                if len(selections) == 0:
+                    return None
+                if (
+                    selections.dtype.kind not in "iu"
+                    or selections.min() < -size
+                    or selections.max() >= size
+                ):
+                    continue
+                selections = selections.astype(intp) % size
+                selections = selections[
+                    (selections >= start) & (selections < stop)
+                ]
+                if len(selections) == 0:
+                    return None
+                return {"index_sel": selections - start}
+        return {}
 
     def _gather_points(self):
-        # self._gather_points_fast()
-        self._gather_points_old()
+        self._gather_points_fast()
 
     def _render(self, gc, points, icon_mode=False):
         """
@@ -538,17 +794,20 @@ class ScatterPlot(BaseXYPlot):
             gc.save_state()
             gc.clip_to_rect(self.x, self.y, self.width, self.height)
 
-        self.render_markers_func(
-            gc,
-            points,
-            self.marker,
-            self.marker_size,
-            self.effective_color,
-            self.line_width,
-            self.effective_outline_color,
-            self.custom_symbol,
-            point_mask=self._cached_point_mask,
-        )
+        if not icon_mode and self._use_density_rendering(len(points)):
+            self._render_density(gc, points)
+        else:
+            self.render_markers_func(
+                gc,
+                points,
+                self.marker,
+                self.marker_size,
+                self.effective_color,
+                self.line_width,
+                self.effective_outline_color,
+                self.custom_symbol,
+                point_mask=self._cached_point_mask,
+            )
 
         if (
             self._cached_selected_pts is not None
@@ -576,10 +835,55 @@ class ScatterPlot(BaseXYPlot):
         point = array([x + width / 2, y + height / 2])
         self._render(gc, [point], icon_mode=True)
 
+    def _use_density_rendering(self, n_points):
+        """Returns whether *n_points* points should be drawn as a density
+        image rather than as markers.
+        """
+        if self.render_style == "auto":
+            return n_points > self.density_threshold
+        return self.render_style == "density"
+
+    def _density_rect(self):
+        """Returns the screen rectangle covered by the density image, with
+        one bin for each screen pixel of the plot.
+
+        Screen pixels are centered on integer coordinates, so that a pixel
+        of the image covers the same pixel as a marker at its center.
+        """
+        width = max(int(ceil(self.width)), 1)
+        height = max(int(ceil(self.height)), 1)
+        return (self.x - 0.5, self.y - 0.5, width, height)
+
+    def _render_density(self, gc, points):
+        """Draws the number of points in each pixel as an image.
+
+        The color of the image is the color of the markers, with an opacity
+        proportional to the logarithm of the number of points in the pixel.
+        """
+        rect = self._density_rect()
+        counts, _ = bin_screen_points(points, rect)
+        image = zeros(counts.shape + (4,))
+        if counts.max() > 0:
+            color = self.effective_color
+            image[..., :3] = color[:3]
+            image[..., 3] = color[3] * log1p(counts) / log1p(counts.max())
+        self._draw_density_image(gc, image, rect)
+
+    def _draw_density_image(self, gc, image, rect):
+        """Draws an height by width by 4 array of RGBA values between 0 and
+        1 over the screen rectangle *rect*.
+        """
+        bitmap = around(image * 255).astype(uint8)
+        gc.draw_image(GraphicsContextArray(bitmap, pix_format="rgba32"), rect)
+
     # ------------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------------
 
+    def _either_data_updated(self, event=None):
+        self._subdivision = None
+        super()._either_data_updated(event)
+
     def _either_metadata_updated(self, event):
         if self.show_selection:
             # Only redraw when we are showing the selection. Otherwise, there
@@ -13,11 +13,13 @@ import numpy as np
 from enable.api import ColorTrait, LineStyle, black_color_trait
 from kiva.api import CAP_ROUND
 from traits.api import (
+    Any,
     Array,
     Bool,
     Enum,
     Float,
     Instance,
+    Int,
     Property,
     Str,
     cached_property,
@@ -30,6 +32,10 @@ from chaco.abstract_mapper import AbstractMapper
 from chaco.base import point_dtype, rgba_dtype
 from chaco.base_xy_plot import BaseXYPlot
 
+# An estimate of the number of cells of the Agg rasterizer which the segments
+# drawn as one path may cover, well below the number at which it overflows.
+_MAX_PATH_CELLS = 2 ** 21
+
 
 class SegmentPlot(BaseXYPlot):
     """ Plot that draws a collection of line segments. """
@@ -99,6 +105,16 @@ class SegmentPlot(BaseXYPlot):
     #: The width multiple to use for non-selected segments.
     selection_width = Float(1.0)
 
+    #: The maximum number of groups of segments to draw together when the
+    #: segments have different colors or widths, or are translucent.  The
+    #: colors and widths are quantized into at most this many groups, and
+    #: the segments of each group are drawn as a single path.  The groups
+    #: are drawn one after the other rather than in the order of the data,
+    #: and overlapping translucent segments of a group are not blended with
+    #: each other.  If 0, such segments are drawn one at a time with their
+    #: exact colors and widths.
+    max_style_groups = Int(256, redraw=True)
+
     #: RGBA values for rendering individual segments, in the case where
     #: color_by_data is True.  This is a length N array with the rgba_dtype
     #: and are computed using the current color or color mapper and color_data,
@@ -107,6 +123,7 @@ class SegmentPlot(BaseXYPlot):
         Array,
         observe=[
             "color_by_data",
+            "color",
             "alpha",
             "color_mapper.updated",
             "color_data.data_changed",
@@ -120,13 +137,48 @@ class SegmentPlot(BaseXYPlot):
     #: The widths of the individual lines in screen units, if mapped to data.
     #: The values are computed with the width mapper.
     screen_widths = Property(
-        Array, observe=["width_mapper.updated", "width_data.data_changed"]
+        Array,
+        observe=[
+            "width_by_data",
+            "line_width",
+            "width_mapper.updated",
+            "width_data.data_changed",
+        ],
     )
 
     selected_mask = Property(
         observe=["selection_metadata_name", "index.metadata_changed"]
     )
 
+    # ------------------------------------------------------------------------
+    # Private traits
+    # ------------------------------------------------------------------------
+
+    # The indices in the data of the segments in _cached_data_pts, or None
+    # if all of the segments are visible.
+    _cached_segment_indices = Any
+
+    # The quantized styles of the segments: the number of the group of each
+    # segment, and the colors and widths of the groups.  None if all of the
+    # segments have the same style.
+    _style_groups = Property(
+        observe=[
+            "color_by_data",
+            "color",
+            "alpha",
+            "color_mapper.updated",
+            "color_data.data_changed",
+            "selected_mask",
+            "selection_color",
+            "selection_alpha",
+            "width_by_data",
+            "line_width",
+            "width_mapper.updated",
+            "width_data.data_changed",
+            "max_style_groups",
+        ]
+    )
+
     # These BaseXYPlot methods either don't make sense or aren't currently
     # implemented for this plot type.
 
@@ -180,11 +232,46 @@ class SegmentPlot(BaseXYPlot):
         else:
             points = np.column_stack([index, value]).reshape(-1, 2, 2)
 
-        # TODO filter for segments intersecting the visible region
+        visible = self._visible_segments(points)
+        if visible.all():
+            self._cached_segment_indices = None
+        else:
+            indices = np.flatnonzero(visible)
+            points = points[indices]
+            self._cached_segment_indices = indices
 
         self._cached_data_pts = points
         self._cache_valid = True
 
+    def _visible_segments(self, points):
+        """Returns a mask of the segments of an Nx2x2 array of data points
+        which may be visible.
+
+        A segment may be visible if the bounding box of its end points
+        intersects the plot, expanded by half of the widest line.  The
+        curves of all of the render styles stay within these boxes.
+        Segments with NaN coordinates are never visible.
+        """
+        visible = np.ones(len(points), dtype=bool)
+        if len(points) == 0:
+            return visible
+
+        pad = 0.5 * np.max(self.screen_widths, initial=0.0) + 1.0
+        for axis, mapper in enumerate(
+            (self.index_mapper, self.value_mapper)
+        ):
+            low_pos, high_pos = sorted((mapper.low_pos, mapper.high_pos))
+            bounds = mapper.map_data(
+                np.array([low_pos - pad, high_pos + pad])
+            )
+            if len(bounds) < 2:
+                # the mapper has an empty screen or data range
+                continue
+            coordinates = points[:, :, axis]
+            visible &= coordinates.max(axis=1) >= bounds.min()
+            visible &= coordinates.min(axis=1) <= bounds.max()
+        return visible
+
     def _render(self, gc, segments):
         """Render an array of shape (N, 2, 2) of screen-space
         points as a collection of segments.
@@ -194,8 +281,7 @@ class SegmentPlot(BaseXYPlot):
             # nothing to plot
             return
 
-        colors = self.effective_colors
-        widths = self.screen_widths
+        groups = self._render_groups(segments)
 
         with gc:
             gc.clip_to_rect(self.x, self.y, self.width, self.height)
@@ -206,35 +292,103 @@ class SegmentPlot(BaseXYPlot):
             starts = starts.ravel().view(point_dtype)
             ends = ends.ravel().view(point_dtype)
             if self.render_style == "orthogonal":
-                self._render_orthogonal(gc, starts, ends, colors, widths)
+                self._render_orthogonal(gc, starts, ends, groups)
             elif self.render_style == "quad":
-                self._render_quad(gc, starts, ends, colors, widths)
+                self._render_quad(gc, starts, ends, groups)
             elif self.render_style == "cubic":
-                self._render_cubic(gc, starts, ends, colors, widths)
+                self._render_cubic(gc, starts, ends, groups)
             else:
-                self._render_line(gc, starts, ends, colors, widths)
+                self._render_line(gc, starts, ends, groups)
 
-    def _render_line(self, gc, starts, ends, colors, widths):
+    def _render_groups(self, segments):
+        """Returns the groups of an array of shape (N, 2, 2) of screen-space
+        segments which are drawn together, as a list of (color, width,
+        segments) tuples, where segments is a slice or an index array of the
+        segments of the group.
+        """
+        n_segments = len(segments)
+        colors = self.effective_colors
+        widths = self.screen_widths
+        indices = self._cached_segment_indices
+        if len(colors) == 1 and len(widths) == 1:
+            if colors[0]["a"] == 1.0 or self.max_style_groups > 0:
+                # a single style, can draw a single unconnected path, faster
+                groups = [(colors[0], float(widths[0]), slice(None))]
+                return self._split_groups(groups, segments)
+
+        if self.max_style_groups <= 0:
+            # draw the segments one at a time
+            if indices is not None:
+                if len(colors) > 1:
+                    colors = colors[indices]
+                if len(widths) > 1:
+                    widths = widths[indices]
+            colors = np.broadcast_to(colors, (n_segments,))
+            widths = np.broadcast_to(widths, (n_segments,))
+            return [
+                (colors[i], float(widths[i]), slice(i, i + 1))
+                for i in range(n_segments)
+            ]
+
+        group_of, group_colors, group_widths = self._style_groups
+        if indices is not None:
+            group_of = group_of[indices]
+        counts = np.bincount(group_of, minlength=len(group_colors))
+        used = np.flatnonzero(counts)
+        if len(used) == 1:
+            color, width = group_colors[used[0]], float(group_widths[used[0]])
+            return self._split_groups([(color, width, slice(None))], segments)
+
+        # a stable sort of small integers is a fast radix sort
+        order = np.argsort(group_of, kind="stable")
+        ends = np.cumsum(counts)
+        groups = [
+            (
+                group_colors[group],
+                float(group_widths[group]),
+                order[ends[group] - counts[group]:ends[group]],
+            )
+            for group in used
+        ]
+        return self._split_groups(groups, segments)
+
+    def _split_groups(self, groups, segments):
+        """Splits the groups of segments which are too large to be drawn as
+        one path.
+
+        The Agg rasterizer overflows on paths which cover too many cells, so
+        the number of cells is estimated from the extents of the segments
+        and the widths of their lines.
+        """
+        extents = np.abs(segments[:, 1] - segments[:, 0]).sum(axis=1)
+        split_groups = []
+        for color, width, members in groups:
+            cells = np.cumsum(2 * extents[members] + 4 * width + 8)
+            # (paths with NaN coordinates are not split)
+            if not cells[-1] > _MAX_PATH_CELLS:
+                split_groups.append((color, width, members))
+                continue
+            if isinstance(members, slice):
+                members = np.arange(len(segments))[members]
+            splits = np.searchsorted(
+                cells, np.arange(_MAX_PATH_CELLS, cells[-1], _MAX_PATH_CELLS)
+            )
+            for chunk in np.split(members, np.unique(splits)):
+                if len(chunk) > 0:
+                    split_groups.append((color, width, chunk))
+        return split_groups
+
+    def _render_line(self, gc, starts, ends, groups):
         """ Render straight lines connecting the start point and end point. """
-        if len(widths) == 1 and len(colors) == 1 and colors[0]["a"] == 1.0:
-            # no alpha, can draw a single unconnected path, faster
-            starts = starts.view(float).reshape(-1, 2)
-            ends = ends.view(float).reshape(-1, 2)
-            gc.set_line_width(widths[0])
-            gc.set_stroke_color(colors[0])
-            gc.line_set(starts, ends)
+        starts = starts.view(float).reshape(-1, 2)
+        ends = ends.view(float).reshape(-1, 2)
+        for color, width, segments in groups:
+            gc.set_stroke_color(color)
+            gc.set_line_width(width)
+            gc.line_set(starts[segments], ends[segments])
             gc.stroke_path()
-        else:
-            for color, width, start, end in np.broadcast(
-                colors, widths, starts, ends
-            ):
-                gc.set_stroke_color(color)
-                gc.set_line_width(float(width))
-                gc.move_to(start["x"], start["y"])
-                gc.line_to(end["x"], end["y"])
-                gc.stroke_path()
 
-    def _render_orthogonal(self, gc, starts, ends, colors, widths):
+    def _render_orthogonal(self, gc, starts, ends, groups):
         """Render orthogonal lines connecting the start point and end point.
 
         Draw the orthogonal line in the direction determined by the
@@ -258,28 +412,17 @@ class SegmentPlot(BaseXYPlot):
                 mids["x"] = ends["x"]
                 mids["y"] = starts["y"]
 
-        if len(widths) == 1 and len(colors) == 1 and colors[0]["a"] == 1.0:
-            # no alpha, can draw a single unconnected path, faster
-            starts = starts.view(float).reshape(-1, 2)
-            mids = mids.view(float).reshape(-1, 2)
-            ends = ends.view(float).reshape(-1, 2)
-            gc.set_line_width(widths[0])
-            gc.set_stroke_color(colors[0])
-            gc.line_set(starts, mids)
-            gc.line_set(mids, ends)
+        starts = starts.view(float).reshape(-1, 2)
+        mids = mids.view(float).reshape(-1, 2)
+        ends = ends.view(float).reshape(-1, 2)
+        for color, width, segments in groups:
+            gc.set_stroke_color(color)
+            gc.set_line_width(width)
+            gc.line_set(starts[segments], mids[segments])
+            gc.line_set(mids[segments], ends[segments])
             gc.stroke_path()
-        else:
-            for color, width, start, end, mid in np.broadcast(
-                colors, widths, starts, ends, mids
-            ):
-                gc.set_stroke_color(color)
-                gc.set_line_width(float(width))
-                gc.move_to(start["x"], start["y"])
-                gc.line_to(mid["x"], mid["y"])
-                gc.line_to(end["x"], end["y"])
-                gc.stroke_path()
 
-    def _render_quad(self, gc, starts, ends, colors, widths):
+    def _render_quad(self, gc, starts, ends, groups):
         """Render quadratic Bezier curves connecting the start and end points.
 
         Draw the orthogonal line in the direction determined by the plot
@@ -303,25 +446,17 @@ class SegmentPlot(BaseXYPlot):
                 mids["x"] = ends["x"]
                 mids["y"] = starts["y"]
 
-        if len(widths) == 1 and len(colors) == 1 and colors[0]["a"] == 1.0:
-            # no alpha, can draw a single unconnected path, faster
-            gc.set_line_width(widths[0])
-            gc.set_stroke_color(colors[0])
-            for start, end, mid in np.broadcast(starts, ends, mids):
-                gc.move_to(start["x"], start["y"])
-                gc.quad_curve_to(mid["x"], mid["y"], end["x"], end["y"])
-            gc.stroke_path()
-        else:
-            for color, width, start, end, mid in np.broadcast(
-                colors, widths, starts, ends, mids
+        for color, width, segments in groups:
+            gc.set_stroke_color(color)
+            gc.set_line_width(width)
+            for start, end, mid in np.broadcast(
+                starts[segments], ends[segments], mids[segments]
             ):
-                gc.set_stroke_color(color)
-                gc.set_line_width(float(width))
                 gc.move_to(start["x"], start["y"])
                 gc.quad_curve_to(mid["x"], mid["y"], end["x"], end["y"])
-                gc.stroke_path()
+            gc.stroke_path()
 
-    def _render_cubic(self, gc, starts, ends, colors, widths):
+    def _render_cubic(self, gc, starts, ends, groups):
         """Render quadratic Bezier curves connecting the start and end points.
 
         Draw the orthogonal line in the direction determined by the plot
@@ -354,12 +489,14 @@ class SegmentPlot(BaseXYPlot):
                 mids_2["x"] = mids_1["x"]
                 mids_2["y"] = ends["y"]
 
-        if len(widths) == 1 and len(colors) == 1 and colors[0]["a"] == 1.0:
-            # no alpha, can draw a single unconnected path, faster
-            gc.set_line_width(widths[0])
-            gc.set_stroke_color(colors[0])
+        for color, width, segments in groups:
+            gc.set_stroke_color(color)
+            gc.set_line_width(width)
             for start, end, mid_1, mid_2 in np.broadcast(
-                starts, ends, mids_1, mids_2
+                starts[segments],
+                ends[segments],
+                mids_1[segments],
+                mids_2[segments],
             ):
                 gc.move_to(start["x"], start["y"])
                 gc.curve_to(
@@ -371,22 +508,6 @@ class SegmentPlot(BaseXYPlot):
                     end["y"],
                 )
             gc.stroke_path()
-        else:
-            for color, width, start, end, mid_1, mid_2 in np.broadcast(
-                colors, widths, starts, ends, mids_1, mids_2
-            ):
-                gc.set_stroke_color(color)
-                gc.set_line_width(float(width))
-                gc.move_to(start["x"], start["y"])
-                gc.curve_to(
-                    mid_1["x"],
-                    mid_1["y"],
-                    mid_2["x"],
-                    mid_2["y"],
-                    end["x"],
-                    end["y"],
-                )
-                gc.stroke_path()
 
     def _render_icon(self, gc, x, y, width, height):
         """Renders a representation of this plot as an icon into the box
@@ -410,6 +531,14 @@ class SegmentPlot(BaseXYPlot):
         self.invalidate_draw()
         self.request_redraw()
 
+    @observe(
+        "width_by_data, line_width, width_mapper.updated, "
+        "width_data.data_changed"
+    )
+    def _widths_updated(self, event):
+        # the segments near the plot are gathered, depending on their widths
+        self._cache_valid = False
+
     @cached_property
     def _get_effective_colors(self):
         if self.color_by_data:
@@ -451,6 +580,63 @@ class SegmentPlot(BaseXYPlot):
 
         return widths
 
+    @cached_property
+    def _get__style_groups(self):
+        colors = self.effective_colors
+        widths = self.screen_widths
+        max_groups = self.max_style_groups
+        if max_groups <= 0 or (len(colors) == 1 and len(widths) == 1):
+            return None
+
+        n_segments = max(len(colors), len(widths))
+        colors = np.broadcast_to(
+            colors.view(np.float32).reshape(-1, 4), (n_segments, 4)
+        )
+        widths = np.broadcast_to(
+            np.asarray(widths, dtype=float).reshape(-1), (n_segments,)
+        )
+
+        # Quantize the channels of the colors and the widths to 8 bits each,
+        # and pack them into one 64 bit key per segment.
+        codes = np.zeros((n_segments, 8), dtype=np.uint8)
+        codes[:, :4] = np.clip(colors * 256, 0, 255).astype(np.uint8)
+        low, high = widths.min(), widths.max()
+        if high > low:
+            codes[:, 4] = np.clip(
+                (widths - low) * (256 / (high - low)), 0, 255
+            ).astype(np.uint8)
+        keys, group_of = np.unique(
+            codes.view(np.uint64).ravel(), return_inverse=True
+        )
+
+        # Drop low bits of the codes until there are few enough groups.
+        fine_codes = keys.view(np.uint8).reshape(-1, 8)
+        shift = 0
+        while len(keys) > max_groups and shift < 8:
+            shift += 1
+            coarse_codes = fine_codes >> np.uint8(shift)
+            keys, coarse_of = np.unique(
+                coarse_codes.view(np.uint64).ravel(), return_inverse=True
+            )
+            if shift == 1:
+                fine_of = group_of
+            group_of = coarse_of[fine_of]
+
+        # Each group is drawn with the mean color and width of its segments.
+        n_groups = len(keys)
+        counts = np.bincount(group_of, minlength=n_groups)
+        group_colors = np.column_stack(
+            [
+                np.bincount(group_of, colors[:, channel], n_groups)
+                for channel in range(4)
+            ]
+        )
+        group_colors /= counts[:, np.newaxis]
+        group_widths = np.bincount(group_of, widths, n_groups) / counts
+        if n_groups <= 2 ** 16:
+            group_of = group_of.astype(np.uint16)
+        return group_of, group_colors, group_widths
+
     @cached_property
     def _get_selected_mask(self):
         name = self.selection_metadata_name
@@ -12,6 +12,7 @@ import unittest
 
 import numpy as np
 from numpy import arange, nan
+from numpy.testing import assert_array_equal
 
 from traits.testing.api import UnittestTools
 
@@ -74,6 +75,18 @@ class BarPlotTest(UnittestTools, unittest.TestCase):
         actual = gc.bmp_array[:, :, :]
         self.assertFalse(np.all(actual == 255))
 
+    def test_barplot_sorted_index(self):
+        self.barplot.index.set_data(arange(10.0), sort_order="ascending")
+        self.barplot.index_range.set_bounds(4.5, 6.5)
+
+        self.barplot._gather_points()
+
+        # points on either side of the range are kept
+        points = self.barplot._cached_data_pts
+        assert_array_equal(
+            (points[:, 0] + points[:, 1]) / 2, [4.0, 5.0, 6.0, 7.0]
+        )
+
     def test_barplot_horizontal(self):
         self.barplot.orientation = 'v'
 
@@ -9,6 +9,7 @@
 # Thanks for using Enthought open source!
 
 import unittest
+from unittest import mock
 from unittest.mock import Mock
 
 import numpy
@@ -21,8 +22,32 @@ from chaco.api import (
     GridDataSource,
     GridMapper,
     ImageData,
+    PlotGraphicsContext,
 )
-from chaco.default_colormaps import Spectral
+from chaco.default_colormaps import Spectral, viridis
+
+
+def make_cmap_plot(data, color_mapper_factory=Spectral):
+    h, w = data.shape
+    index = GridDataSource(
+        xdata=numpy.arange(w + 1), ydata=numpy.arange(h + 1)
+    )
+    index_mapper = GridMapper(range=DataRange2D(index))
+    color_source = ImageData(data=data, value_depth=1)
+    cmap_plot = CMapImagePlot(
+        index=index,
+        index_mapper=index_mapper,
+        value=color_source,
+        value_mapper=color_mapper_factory(DataRange1D(color_source)),
+        bounds=[w, h],
+    )
+    return cmap_plot
+
+
+def render(plot):
+    gc = PlotGraphicsContext(tuple(plot.bounds))
+    gc.render_component(plot)
+    return gc
 
 
 class TestCMapImagePlot(unittest.TestCase):
@@ -54,3 +79,61 @@ class TestCMapImagePlot(unittest.TestCase):
 
         # Then
         window.redraw.assert_called_once_with()
+
+    def test_palette_change_reuses_lut_indices(self):
+        data = numpy.random.RandomState(0).uniform(size=(20, 30))
+        data[3, 4] = numpy.nan
+        cmap_plot = make_cmap_plot(data)
+        render(cmap_plot)
+        indices = cmap_plot._cached_lut_indices
+        mapped_image = cmap_plot._cached_mapped_image
+        numpy.testing.assert_array_equal(
+            mapped_image, cmap_plot.color_mapper.map_uint8(data)
+        )
+
+        new_mapper = viridis(cmap_plot.color_mapper.range)
+        with mock.patch.object(
+            type(new_mapper), "map_lut_indices"
+        ) as map_lut_indices:
+            cmap_plot.color_mapper = new_mapper
+            render(cmap_plot)
+
+        map_lut_indices.assert_not_called()
+        self.assertIs(cmap_plot._cached_lut_indices, indices)
+        # the previous image is reused for the new colors
+        self.assertIs(cmap_plot._cached_mapped_image, mapped_image)
+        numpy.testing.assert_array_equal(
+            mapped_image, new_mapper.map_uint8(data)
+        )
+
+    def test_range_change_recomputes_lut_indices(self):
+        data = numpy.linspace(0.0, 1.0, 600).reshape(20, 30)
+        cmap_plot = make_cmap_plot(data)
+        render(cmap_plot)
+        indices = cmap_plot._cached_lut_indices.copy()
+
+        cmap_plot.color_mapper.range.set_bounds(0.0, 2.0)
+        render(cmap_plot)
+
+        self.assertEqual(
+            cmap_plot._cached_lut_indices.max(), indices.max() // 2
+        )
+        numpy.testing.assert_array_equal(
+            cmap_plot._cached_mapped_image,
+            cmap_plot.color_mapper.map_uint8(data),
+        )
+
+    def test_data_change_recomputes_lut_indices(self):
+        data = numpy.linspace(0.0, 1.0, 600).reshape(20, 30)
+        cmap_plot = make_cmap_plot(data)
+        cmap_plot.color_mapper.range.low_setting = 0.0
+        cmap_plot.color_mapper.range.high_setting = 1.0
+        render(cmap_plot)
+
+        cmap_plot.value.set_data(data[::-1])
+        render(cmap_plot)
+
+        numpy.testing.assert_array_equal(
+            cmap_plot._cached_mapped_image,
+            cmap_plot.color_mapper.map_uint8(data[::-1]),
+        )
@@ -102,3 +102,38 @@ class TestColormappedScatterplot(unittest.TestCase):
         self.gc.render_component(self.scatterplot)
         actual = self.gc.bmp_array[:, :, :]
         self.assertFalse(np.all(actual == 255))
+
+    def test_scatter_density(self):
+        """ Coverage test to check density rendering works """
+        for statistic in ["mean", "max", "count"]:
+            self.scatterplot.render_style = "density"
+            self.scatterplot.density_statistic = statistic
+            gc = PlotGraphicsContext((50, 50))
+            gc.render_component(self.scatterplot)
+            actual = gc.bmp_array[:, :, :]
+            self.assertFalse(np.all(actual == 255))
+
+    def test_scatter_density_colors(self):
+        # two points in the same pixel are drawn with the color of their
+        # mean or maximum color value; the bitmap is in BGRA order
+        self.index.set_data(np.array([0.0, 0.0, 10.0]))
+        self.value.set_data(np.array([0.0, 0.0, 10.0]))
+        self.color_data.set_data(np.array([0.0, 10.0, 5.0]))
+        self.scatterplot.render_style = "density"
+        self.scatterplot.padding = 0
+
+        self.scatterplot.density_statistic = "max"
+        gc = PlotGraphicsContext((50, 50))
+        gc.render_component(self.scatterplot)
+        expected = self.color_mapper.map_screen(np.array([10.0]))[0, :3]
+        np.testing.assert_allclose(
+            gc.bmp_array[-1, 0, 2::-1] / 255.0, expected, atol=0.01
+        )
+
+        self.scatterplot.density_statistic = "mean"
+        gc = PlotGraphicsContext((50, 50))
+        gc.render_component(self.scatterplot)
+        expected = self.color_mapper.map_screen(np.array([5.0]))[0, :3]
+        np.testing.assert_allclose(
+            gc.bmp_array[-1, 0, 2::-1] / 255.0, expected, atol=0.01
+        )
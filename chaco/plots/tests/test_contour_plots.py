@@ -0,0 +1,274 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from chaco.api import (
+    DataRange2D,
+    GridDataSource,
+    GridMapper,
+    ImageData,
+    PlotGraphicsContext,
+)
+from chaco._workers import get_executor
+from chaco.plots.contour.contour_line_plot import ContourLinePlot, _simplify
+from chaco.plots.contour.contour_poly_plot import ContourPolyPlot
+from chaco.tests._tools import queued_ui_dispatch
+
+
+def make_contour_plot(plot_class, **traits):
+    xs = np.linspace(-2, 2, 41)
+    ys = np.linspace(-1, 1, 21)
+    x, y = np.meshgrid(xs, ys)
+    index = GridDataSource(xs, ys, sort_order=("ascending", "ascending"))
+    mapper = GridMapper(range=DataRange2D(index))
+    traits.setdefault("bounds", [80, 40])
+    plot = plot_class(
+        index=index,
+        value=ImageData(data=np.exp(-(x ** 2 + y ** 2))),
+        index_mapper=mapper,
+        **traits
+    )
+    return plot
+
+
+def render(plot):
+    gc = PlotGraphicsContext((plot.width, plot.height))
+    gc.render_component(plot)
+    return gc
+
+
+def wait_for_worker():
+    # the worker runs one task at a time, so this waits for earlier tasks
+    get_executor("contour").submit(lambda: None).result()
+
+
+class TestContourLinePlot(unittest.TestCase):
+    def setUp(self):
+        ui_dispatch = queued_ui_dispatch()
+        self.process_ui_events = ui_dispatch.__enter__()
+        self.addCleanup(ui_dispatch.__exit__, None, None, None)
+
+    def wait_for_traces(self):
+        wait_for_worker()
+        self.process_ui_events()
+
+    def test_adding_a_level_only_traces_the_new_level(self):
+        plot = make_contour_plot(ContourLinePlot, levels=[0.2, 0.5])
+        render(plot)
+        self.assertEqual(set(plot._cached_contours), {0.2, 0.5})
+
+        with mock.patch.object(plot, "_trace", wraps=plot._trace) as trace:
+            plot.levels = [0.2, 0.5, 0.8]
+            render(plot)
+
+        trace.assert_called_once()
+        self.assertEqual(trace.call_args[0][0], [(0.8,)])
+        self.assertEqual(set(plot._cached_contours), {0.2, 0.5, 0.8})
+        for traces in plot._cached_contours.values():
+            self.assertGreater(len(traces), 0)
+            self.assertEqual(traces[0].shape[1], 2)
+
+    def test_restyling_does_not_retrace(self):
+        plot = make_contour_plot(ContourLinePlot, levels=[0.2, 0.5])
+        render(plot)
+
+        with mock.patch.object(plot, "_trace", wraps=plot._trace) as trace:
+            plot.widths = [2.0]
+            plot.colors = "red"
+            render(plot)
+
+        trace.assert_not_called()
+
+    def test_data_change_retraces(self):
+        plot = make_contour_plot(ContourLinePlot, levels=[0.5])
+        render(plot)
+        cntr = plot._cntr
+        before = plot._cached_contours[0.5]
+
+        plot.value.set_data(plot.value.get_data() * 0.6)
+        render(plot)
+
+        self.assertIsNot(plot._cntr, cntr)
+        after = plot._cached_contours[0.5]
+        # the level encloses a smaller area of the lower peak
+        self.assertLess(np.ptp(after[0][:, 0]), np.ptp(before[0][:, 0]))
+
+    def test_trace_in_background(self):
+        plot = make_contour_plot(
+            ContourLinePlot, levels=[0.2, 0.5], trace_in_background=True
+        )
+        render(plot)
+        self.wait_for_traces()
+
+        self.assertFalse(plot._pending_traces)
+        self.assertFalse(plot._contour_cache_valid)
+        self.assertEqual(set(plot._trace_cache), {(0.2,), (0.5,)})
+
+        render(plot)
+        self.assertTrue(plot._contour_cache_valid)
+        self.assertEqual(set(plot._cached_contours), {0.2, 0.5})
+        self.assertGreater(len(plot._cached_contours[0.5]), 0)
+
+    def test_previous_traces_drawn_until_ready(self):
+        plot = make_contour_plot(
+            ContourLinePlot, levels=[0.5], trace_in_background=True
+        )
+        render(plot)
+        self.wait_for_traces()
+        render(plot)
+        old_traces = plot._cached_contours[0.5]
+
+        # hold the tracer so that the new traces cannot be computed yet
+        with plot._cntr_lock:
+            plot.value.set_data(plot.value.get_data() * 0.6)
+            render(plot)
+            self.assertIs(plot._cached_contours[0.5], old_traces)
+            self.assertFalse(plot._contour_cache_valid)
+        self.wait_for_traces()
+
+        render(plot)
+        self.assertIsNot(plot._cached_contours[0.5], old_traces)
+        self.assertFalse(plot._stale_traces)
+
+    def test_background_traces_arrive_on_ui_thread(self):
+        plot = make_contour_plot(
+            ContourLinePlot, levels=[0.5], trace_in_background=True
+        )
+        render(plot)
+        wait_for_worker()
+
+        # the traces are only added to the cache by the UI thread
+        self.assertEqual(plot._trace_cache, {})
+        self.assertEqual(plot._pending_traces, {(0.5,)})
+        self.process_ui_events()
+        self.assertEqual(set(plot._trace_cache), {(0.5,)})
+
+    def test_trace_in_background_without_ui(self):
+        plot = make_contour_plot(
+            ContourLinePlot, levels=[0.5], trace_in_background=True
+        )
+
+        with mock.patch(
+            "chaco.base_contour_plot.can_dispatch_to_ui", return_value=False
+        ):
+            render(plot)
+
+        self.assertFalse(plot._pending_traces)
+        self.assertEqual(set(plot._cached_contours), {0.5})
+
+    def test_background_trace_error_logged(self):
+        plot = make_contour_plot(
+            ContourLinePlot, levels=[0.5], trace_in_background=True
+        )
+
+        with mock.patch.object(
+            plot, "_trace", side_effect=ValueError("bad data")
+        ), self.assertLogs("chaco.base_contour_plot", "ERROR"):
+            render(plot)
+            self.wait_for_traces()
+
+        self.assertFalse(plot._pending_traces)
+        self.assertEqual(plot._trace_cache, {})
+
+
+class TestContourLineRendering(unittest.TestCase):
+    def test_offscreen_traces_are_culled(self):
+        plot = make_contour_plot(ContourLinePlot, levels=[0.2, 0.5, 0.8])
+        render(plot)
+        view = plot._visible_data_bounds()
+        for level in [0.2, 0.5, 0.8]:
+            self.assertEqual(
+                len(plot._visible_traces(level, view, None)),
+                len(plot._cached_contours[level]),
+            )
+
+        # zoom into a corner outside of the 0.5 and 0.8 contours
+        plot.index_mapper.range.set_bounds((-2.0, -1.0), (-1.5, -0.5))
+        render(plot)
+        view = plot._visible_data_bounds()
+        for level in [0.5, 0.8]:
+            self.assertEqual(plot._visible_traces(level, view, None), [])
+
+    def test_vertical_orientation(self):
+        horizontal = make_contour_plot(ContourLinePlot, levels=[0.5])
+        vertical = make_contour_plot(
+            ContourLinePlot, levels=[0.5], orientation="v", bounds=[40, 80]
+        )
+        h_drawn = render(horizontal).bmp_array[:, :, :3].min(axis=2) < 128
+        v_drawn = render(vertical).bmp_array[:, :, :3].min(axis=2) < 128
+
+        self.assertGreater(h_drawn.sum(), 0)
+        # swapping the axes also flips the bitmap rows
+        np.testing.assert_array_equal(v_drawn, h_drawn[::-1, ::-1].T)
+
+    def test_simplified_traces_cached_per_zoom_level(self):
+        plot = make_contour_plot(ContourLinePlot, levels=[0.5])
+        render(plot)
+        cell_size = plot._simplify_cell_size()
+        simplified = plot._simplified_traces(0.5, cell_size)
+
+        # panning keeps the zoom level
+        plot.index_mapper.range.set_bounds((-1.9, -0.9), (2.1, 1.1))
+        render(plot)
+        self.assertEqual(plot._simplify_cell_size(), cell_size)
+        self.assertIs(plot._simplified_traces(0.5, cell_size), simplified)
+
+        plot.index_mapper.range.set_bounds((-0.5, -0.25), (0.5, 0.25))
+        render(plot)
+        self.assertNotEqual(plot._simplify_cell_size(), cell_size)
+        self.assertEqual(len(plot._simplified_contours), 2)
+
+    def test_simplify_cell_size(self):
+        plot = make_contour_plot(ContourLinePlot, levels=[0.5])
+        render(plot)
+        # 4 by 2 data units over 80 by 40 pixels
+        self.assertEqual(plot._simplify_cell_size(), (2 ** -5, 2 ** -5))
+
+        plot.simplify = False
+        with mock.patch.object(
+            plot, "_simplified_traces", wraps=plot._simplified_traces
+        ) as simplified_traces:
+            render(plot)
+        simplified_traces.assert_not_called()
+
+    def test_simplify(self):
+        trace = np.array(
+            [
+                [0.1, 0.1],
+                [0.2, 0.3],
+                [0.9, 0.9],
+                [1.2, 0.5],
+                [1.3, 0.6],
+                [1.4, 0.7],
+            ]
+        )
+        simplified = _simplify(trace, (1.0, 1.0))
+        np.testing.assert_array_equal(simplified, trace[[0, 3, 5]])
+        simplified = _simplify(trace[:2], (1.0, 1.0))
+        np.testing.assert_array_equal(simplified, trace[:2])
+
+
+class TestContourPolyPlot(unittest.TestCase):
+    def test_adding_a_level_only_traces_the_new_polygons(self):
+        plot = make_contour_plot(ContourPolyPlot, levels=[0.2, 0.5])
+        render(plot)
+        self.assertEqual(set(plot._cached_polys), {(0.2, 0.5)})
+
+        with mock.patch.object(plot, "_trace", wraps=plot._trace) as trace:
+            plot.levels = [0.2, 0.5, 0.8]
+            render(plot)
+
+        trace.assert_called_once()
+        self.assertEqual(trace.call_args[0][0], [(0.5, 0.8)])
+        self.assertEqual(set(plot._cached_polys), {(0.2, 0.5), (0.5, 0.8)})
@@ -30,6 +30,7 @@ from chaco.api import (
     ImageData,
     ImagePlot,
     Plot,
+    TiledImageData,
 )
 
 
@@ -83,8 +84,10 @@ def image_from_renderer(renderer, orientation):
     return rendered_image
 
 
-def rendered_image_result(image, filename=None, **plot_kwargs):
-    data_source = ImageData(data=image)
+def rendered_image_result(
+    image, filename=None, data_source_class=ImageData, **plot_kwargs
+):
+    data_source = data_source_class(data=image)
     index, index_mapper = get_image_index_and_mapper(image)
     renderer = ImagePlot(
         value=data_source,
@@ -204,6 +207,52 @@ class TestResultImage(unittest.TestCase):
         self.assertEqual(type(screen_pt), np.ndarray)
         self.assertEqual(screen_pt.shape, (0, 2))
 
+    def test_tiled_image(self):
+        # A zoomed-out tiled image is drawn from the pyramid level with one
+        # pixel per screen pixel.
+        scale = 8
+        big = np.repeat(np.repeat(RGB, scale, axis=0), scale, axis=1)
+        data_source = TiledImageData(data=big, tile_size=64)
+
+        for orientation in ["h", "v"]:
+            for origin in ["top left", "bottom left", "top right"]:
+                with self.subTest(orientation=orientation, origin=origin):
+                    index, index_mapper = get_image_index_and_mapper(big)
+                    renderer = ImagePlot(
+                        value=data_source,
+                        index=index,
+                        index_mapper=index_mapper,
+                        orientation=orientation,
+                        origin=origin,
+                    )
+                    renderer.bounds = (201, 101)
+                    if orientation == "v":
+                        renderer.bounds = renderer.bounds[::-1]
+                    with temp_image_file() as filename:
+                        save_renderer_result(renderer, filename)
+                        rendered_image = ImageData.fromfile(filename).data
+
+                    expected_image = IMAGE
+                    if orientation == "v":
+                        expected_image = expected_image.T
+                    if "bottom" in origin:
+                        expected_image = expected_image[::-1]
+                    if "right" in origin:
+                        expected_image = expected_image[:, ::-1]
+                    rms = calculate_rms(
+                        rendered_image[TRIM_RENDERED], expected_image
+                    )
+                    self.assertLess(rms, MAX_RMS_ERROR)
+
+                    cached_shape = renderer._cached_image.bmp_array.shape
+                    self.assertEqual(cached_shape, (100, 200, 3))
+
+    def test_tiled_image_zoomed_in(self):
+        # At full resolution, a tiled image is drawn as any other image.
+        self.verify_result_image(
+            RGB, IMAGE, origin="top left", data_source_class=TiledImageData
+        )
+
     # regression test for enthought/chaco#528
     @unittest.skipIf(is_null, "Skip on 'null' toolkit")
     @unittest.skipIf(
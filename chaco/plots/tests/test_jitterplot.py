@@ -139,3 +139,37 @@ class Jitterplot1DTest(unittest.TestCase):
         assert_almost_equal(
             self.scatterplot.map_data(points), array([9.0, 4.5])
         )
+
+    def test_jitter_within_width(self):
+        self.scatterplot.do_layout()
+        pts = self.scatterplot.get_screen_points()
+        jitter = pts[:, 0] - self.scatterplot._marker_position
+
+        self.assertEqual(pts.shape, (10, 2))
+        self.assertTrue(np.all(jitter >= 0))
+        self.assertTrue(np.all(jitter < self.scatterplot.jitter_width))
+        # the points are spread out, even when they have similar values
+        self.assertGreater(len(np.unique(np.round(jitter, 3))), 5)
+
+    def test_jitter_stable_across_pan(self):
+        self.scatterplot.do_layout()
+        jitter = self.scatterplot.get_screen_points()[:, 0].copy()
+
+        self.scatterplot.index_mapper.range.set_bounds(2.5, 20.0)
+        pts = self.scatterplot.get_screen_points()
+
+        assert_almost_equal(pts[:, 0], jitter)
+
+    def test_jitter_deterministic(self):
+        data = np.linspace(0.0, 1.0, 100000)
+        other = JitterPlot(
+            index=ArrayDataSource(data),
+            index_mapper=self.scatterplot.index_mapper,
+            border_visible=False,
+        )
+        other.outer_bounds = list(self.size)
+        self.scatterplot.index.set_data(data.copy())
+
+        assert_almost_equal(
+            self.scatterplot.map_screen(data), other.map_screen(data)
+        )
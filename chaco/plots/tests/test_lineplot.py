@@ -0,0 +1,192 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+
+from chaco.api import (
+    ArrayDataSource,
+    DataRange1D,
+    LinearMapper,
+    LinePlot,
+    PlotGraphicsContext,
+)
+
+
+class LinePlotTest(unittest.TestCase):
+    def setUp(self):
+        self.size = (400, 200)
+        x = np.linspace(0.0, 100.0, 200001)
+        y = np.sin(x)
+        y[150000] = 10.0
+        y[1000:1010] = np.nan
+        self.index = ArrayDataSource(x, sort_order="ascending")
+        self.value = ArrayDataSource(y)
+        index_range = DataRange1D(self.index)
+        value_range = DataRange1D(self.value)
+        self.plot = LinePlot(
+            index=self.index,
+            value=self.value,
+            index_mapper=LinearMapper(range=index_range),
+            value_mapper=LinearMapper(range=value_range),
+            border_visible=False,
+        )
+        self.plot.outer_bounds = list(self.size)
+
+    def test_lod_pyramid(self):
+        self.plot.use_lod_pyramid = True
+
+        self.plot._gather_points()
+
+        points = self.plot._cached_data_pts
+        n_points = sum(len(pts) for pts in points)
+        self.assertLess(n_points, 10000)
+        self.assertEqual(max(pts[:, 1].max() for pts in points), 10.0)
+        self.assertEqual(min(pts[:, 0].min() for pts in points), 0.0)
+        self.assertEqual(max(pts[:, 0].max() for pts in points), 100.0)
+        self.assertGreaterEqual(len(points), 2)
+
+        gc = PlotGraphicsContext(self.size)
+        gc.render_component(self.plot)
+
+    def test_lod_pyramid_zoomed(self):
+        self.plot.use_lod_pyramid = True
+        self.plot.index_range.set_bounds(50.0, 50.1)
+
+        self.plot._gather_points()
+
+        # zoomed in far enough that the raw data is used
+        points = self.plot._cached_data_pts
+        self.assertEqual(len(points), 1)
+        self.assertLessEqual(points[0][0, 0], 50.0)
+        self.assertGreaterEqual(points[0][-1, 0], 50.1)
+        self.assertLess(len(points[0]), 400)
+
+    def test_lod_pyramid_values_longer_than_index(self):
+        self.plot.use_lod_pyramid = True
+        y = np.cos(np.linspace(0.0, 100.5, 201006))
+        y[200500] = -10.0
+        self.value.set_data(y)
+        self.plot.outer_bounds = [100, 200]
+
+        with self.assertWarns(UserWarning):
+            self.plot._gather_points()
+
+        points = self.plot._cached_data_pts
+        self.assertLess(sum(len(pts) for pts in points), 1000)
+        self.assertEqual(max(pts[:, 0].max() for pts in points), 100.0)
+        self.assertGreater(min(pts[:, 1].min() for pts in points), -10.0)
+
+    def test_lod_pyramid_invalidated_by_data_change(self):
+        self.plot.use_lod_pyramid = True
+        self.plot._gather_points()
+        pyramid = self.value.get_lod_pyramid()
+
+        self.value.set_data(np.cos(self.index.get_data()))
+
+        self.assertIsNot(self.value.get_lod_pyramid(), pyramid)
+
+    def test_sorted_index_window(self):
+        self.plot.index_range.set_bounds(50.0, 50.1)
+
+        self.plot._gather_points()
+
+        points = self.plot._cached_data_pts
+        self.assertEqual(len(points), 1)
+        # one point on either side of the range is kept
+        self.assertEqual(len(points[0]), 201 + 2)
+        self.assertLess(points[0][0, 0], 50.0)
+        self.assertGreater(points[0][-1, 0], 50.1)
+
+    def test_downsample_methods(self):
+        self.plot.use_downsampling = True
+        for method in ["lttb", "m4", "min_max", "stride"]:
+            self.plot.downsample_method = method
+
+            screen_points = self.plot.get_screen_points()
+
+            n_points = sum(len(pts) for pts in screen_points)
+            self.assertLess(n_points, 5000)
+            gc = PlotGraphicsContext(self.size)
+            gc.render_component(self.plot)
+
+    def test_m4_keeps_spike(self):
+        self.plot.use_downsampling = True
+        self.plot.downsample_method = "m4"
+
+        self.plot._gather_points()
+        self.plot._downsample()
+
+        screen_points = np.concatenate(self.plot._cached_screen_pts)
+        spike = self.plot.map_screen([[75.0, 10.0]])[0]
+        self.assertAlmostEqual(screen_points[:, 1].max(), spike[1])
+
+    def test_incremental_downsampling(self):
+        self.plot.use_downsampling = True
+        self.plot.incremental_downsampling = True
+        self.plot.downsample_method = "m4"
+        self.plot.index_range.set_bounds(20.0, 40.0)
+
+        screen_points = self.plot.get_screen_points()
+        cache = self.plot._downsample_cache
+        cached = cache.points
+
+        self.plot.index_range.set_bounds(21.0, 41.0)
+        panned_points = self.plot.get_screen_points()
+
+        self.assertIs(self.plot._downsample_cache, cache)
+        self.assertGreater(len(cache.points), len(cached))
+        self.assertGreater(len(screen_points), 0)
+        self.assertGreater(len(panned_points), 0)
+
+        self.value.set_data(np.cos(self.index.get_data()))
+        self.assertIsNone(cache.points)
+
+    def test_incremental_downsampling_append(self):
+        self.plot.use_downsampling = True
+        self.plot.incremental_downsampling = True
+        self.plot.downsample_method = "m4"
+        size = self.index.get_size()
+        last = self.index.get_data()[-1]
+        step = last - self.index.get_data()[-2]
+        self.plot.index_range.set_bounds(last - 20.0, last + 1.0)
+        self.plot.get_screen_points()
+        cache = self.plot._downsample_cache
+        cached_high = cache.points[-1, 0]
+
+        new_index = last + step * np.arange(1, 101)
+        self.index.append_data(new_index, capacity=size)
+        self.value.append_data(np.sin(new_index), capacity=size)
+
+        # only the buckets covering the new data are discarded
+        self.assertIs(self.plot._downsample_cache, cache)
+        self.assertLess(cache.points[-1, 0], last)
+        self.assertGreater(cache.points[-1, 0], last - 1.0)
+        self.assertLessEqual(cache.points[-1, 0], cached_high)
+
+        self.plot.get_screen_points()
+        points = cache.points
+        self.assertEqual(points[-1, 0], new_index[-1])
+        self.assertTrue(np.all(np.diff(points[:, 0]) >= 0))
+        # each appended value is a sample of the line
+        appended = points[points[:, 0] > last]
+        np.testing.assert_allclose(appended[:, 1], np.sin(appended[:, 0]))
+
+    def test_map_index_unsorted(self):
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0.0, 100.0, 1000)
+        self.index.set_data(x, sort_order="none")
+        self.value.set_data(np.zeros(1000))
+
+        for data_x in [0.5, 33.3, 99.0]:
+            screen_pt = self.plot.map_screen(np.array([[data_x, 0.0]]))[0]
+            ndx = self.plot.map_index(screen_pt)
+            self.assertEqual(ndx, np.argmin(abs(x - data_x)))
@@ -0,0 +1,164 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from chaco.api import (
+    ArrayDataSource,
+    DataRange1D,
+    LinearMapper,
+    MultiArrayDataSource,
+    PlotGraphicsContext,
+)
+from chaco.plots.multi_line_plot import MultiLinePlot
+
+
+class MultiLinePlotTest(unittest.TestCase):
+    def setUp(self):
+        self.size = (400, 200)
+        self.make_plot(np.linspace(0.0, 100.0, 1001))
+
+    def make_plot(self, x, n_traces=10):
+        self.x = x
+        self.data = np.sin(x + np.arange(n_traces)[:, np.newaxis])
+        self.index = ArrayDataSource(x, sort_order="ascending")
+        yindex = ArrayDataSource(np.arange(0.0, 10.0 * n_traces, 10.0))
+        self.plot = MultiLinePlot(
+            index=self.index,
+            yindex=yindex,
+            value=MultiArrayDataSource(self.data),
+            index_mapper=LinearMapper(range=DataRange1D(self.index)),
+            value_mapper=LinearMapper(range=DataRange1D(yindex)),
+            global_min=-1.0,
+            global_max=1.0,
+            border_visible=False,
+        )
+        self.plot.outer_bounds = list(self.size)
+
+    def trace_points(self, lines):
+        """Returns the data points of the runs of screen points of each
+        trace.
+        """
+        return [[self.map_data(run) for run in runs] for runs in lines]
+
+    def map_data(self, screen_pts):
+        return np.column_stack(
+            [
+                self.plot.index_mapper.map_data(screen_pts[:, 0]),
+                self.plot.value_mapper.map_data(screen_pts[:, 1]),
+            ]
+        )
+
+    def test_all_points(self):
+        lines = self.trace_points(self.plot.get_screen_points())
+
+        self.assertEqual(len(lines), 10)
+        trace_data = self.plot._trace_data
+        for runs, values in zip(lines, trace_data):
+            self.assertEqual(len(runs), 1)
+            assert_allclose(runs[0][:, 0], self.x)
+            assert_allclose(runs[0][:, 1], values, atol=1e-9)
+
+        gc = PlotGraphicsContext(self.size)
+        gc.render_component(self.plot)
+
+    def test_traces_split_at_nans(self):
+        self.data[3, 100:110] = np.nan
+        self.plot.value.set_data(self.data)
+
+        lines = self.trace_points(self.plot.get_screen_points())
+
+        self.assertEqual(
+            [len(runs) for runs in lines], [1] * 3 + [2] + [1] * 6
+        )
+        first, second = lines[3]
+        assert_allclose(first[:, 0], self.x[:100])
+        assert_allclose(second[:, 0], self.x[110:])
+
+        gc = PlotGraphicsContext(self.size)
+        gc.render_component(self.plot)
+
+    def test_index_window(self):
+        self.plot.index_range.set_bounds(50.0, 60.0)
+
+        lines = self.trace_points(self.plot.get_screen_points())
+
+        for runs in lines:
+            self.assertEqual(len(runs), 1)
+            self.assertLessEqual(runs[0][0, 0], 50.0)
+            self.assertGreaterEqual(runs[0][-1, 0], 60.0)
+            self.assertLess(len(runs[0]), 110)
+
+    def test_traces_culled_by_value_range(self):
+        # the traces are 2.5 units from their coordinates at most
+        self.plot.value_range.set_bounds(31.0, 55.0)
+
+        lines = self.plot.get_screen_points()
+
+        self.assertEqual(len(lines), 10)
+        visible = [k for k, runs in enumerate(lines) if runs]
+        self.assertEqual(visible, [3, 4, 5])
+        trace_data = self.plot._trace_data
+        for k in visible:
+            values = self.map_data(lines[k][0])[:, 1]
+            assert_allclose(values, trace_data[k], atol=1e-9)
+
+    def test_fast_clip(self):
+        self.plot.fast_clip = True
+        self.plot.value_range.set_bounds(31.0, 55.0)
+
+        lines = self.plot.get_screen_points()
+
+        visible = [k for k, runs in enumerate(lines) if runs]
+        self.assertEqual(visible, [4, 5])
+        values = self.map_data(lines[4][0])[:, 1]
+        assert_allclose(values, self.plot._trace_data[4], atol=1e-9)
+
+    def test_view_between_points(self):
+        self.plot.index_range.set_bounds(50.01, 50.05)
+
+        lines = self.trace_points(self.plot.get_screen_points())
+
+        for runs in lines:
+            self.assertEqual(len(runs), 1)
+            assert_allclose(runs[0][:, 0], [50.0, 50.1])
+
+    def test_downsampling(self):
+        x = np.linspace(0.0, 100.0, 200001)
+        self.make_plot(x, n_traces=5)
+        self.data[2, 150000] = 10.0
+        self.data[4, 1000:1010] = np.nan
+        self.plot.value.set_data(self.data)
+        self.plot.use_downsampling = True
+
+        lines = self.trace_points(self.plot.get_screen_points())
+
+        trace_data = self.plot._trace_data
+        for k, runs in enumerate(lines):
+            if k == 4:
+                # traces with NaNs are not downsampled
+                self.assertEqual(len(runs), 2)
+                continue
+            self.assertEqual(len(runs), 1)
+            points = runs[0]
+            self.assertLessEqual(len(points), 4 * self.size[0])
+            assert_allclose(points[[0, -1], 0], [0.0, 100.0])
+            assert_allclose(
+                points[:, 1].max(), np.max(trace_data[k]), atol=1e-9
+            )
+            assert_allclose(
+                points[:, 1].min(), np.min(trace_data[k]), atol=1e-9
+            )
+
+        gc = PlotGraphicsContext(self.size)
+        gc.render_component(self.plot)
@@ -15,6 +15,7 @@ from enable.compiled_path import CompiledPath
 
 # Chaco imports
 from chaco.api import create_scatter_plot, PlotGraphicsContext
+from chaco.plots.scatterplot import bin_screen_points
 
 
 class DrawScatterplotCase(unittest.TestCase):
@@ -82,3 +83,188 @@ class DrawScatterplotCase(unittest.TestCase):
         gc.render_component(scatterplot)
         actual = gc.bmp_array[:, :, :]
         self.assertFalse(np.all(actual == 255))
+
+    def test_scatter_density(self):
+        """ Coverage test to check density rendering works """
+        size = (50, 50)
+        scatterplot = create_scatter_plot(
+            data=[list(range(10)), list(range(10))],
+            border_visible=False,
+            render_style="density",
+        )
+        scatterplot.outer_bounds = list(size)
+        gc = PlotGraphicsContext(size)
+        gc.render_component(scatterplot)
+        actual = gc.bmp_array[:, :, :]
+        self.assertFalse(np.all(actual == 255))
+
+    def test_scatter_density_auto(self):
+        size = (50, 50)
+        scatterplot = create_scatter_plot(
+            data=[list(range(10)), list(range(10))],
+            border_visible=False,
+            density_threshold=5,
+        )
+        scatterplot.outer_bounds = list(size)
+        self.assertEqual(scatterplot.render_style, "auto")
+        self.assertTrue(scatterplot._use_density_rendering(10))
+        self.assertFalse(scatterplot._use_density_rendering(5))
+
+        # a density image only colors the pixels which contain points
+        gc = PlotGraphicsContext(size)
+        gc.render_component(scatterplot)
+        actual = gc.bmp_array[:, :, :3]
+        self.assertEqual(np.sum(np.any(actual != 255, axis=-1)), 10)
+
+
+class BinScreenPointsCase(unittest.TestCase):
+    def test_counts(self):
+        points = np.array(
+            [[10.5, 20.5], [10.9, 20.1], [13.0, 21.0], [14.0, 23.0]]
+        )
+        counts, aggregate = bin_screen_points(points, (10, 20, 4, 3))
+
+        self.assertIsNone(aggregate)
+        # the first row is the top of the rectangle, and points on the top
+        # or right edge are in the last row or column
+        expected = np.array(
+            [
+                [0, 0, 0, 1],
+                [0, 0, 0, 1],
+                [2, 0, 0, 0],
+            ]
+        )
+        np.testing.assert_array_equal(counts, expected)
+
+    def test_points_outside(self):
+        points = np.array([[9.9, 20.5], [11.0, 23.1], [11.0, 21.0]])
+        counts, _ = bin_screen_points(points, (10, 20, 4, 3))
+        self.assertEqual(counts.sum(), 1)
+        self.assertEqual(counts[1, 1], 1)
+
+    def test_statistics(self):
+        points = np.array([[0.5, 0.5], [0.2, 0.7], [1.5, 0.5]])
+        values = np.array([1.0, 3.0, 5.0])
+
+        counts, mean = bin_screen_points(points, (0, 0, 3, 1), values)
+        np.testing.assert_array_equal(counts, [[2, 1, 0]])
+        np.testing.assert_array_equal(mean, [[2.0, 5.0, np.nan]])
+
+        _, maximum = bin_screen_points(points, (0, 0, 3, 1), values, "max")
+        np.testing.assert_array_equal(maximum, [[3.0, 5.0, np.nan]])
+
+        with self.assertRaises(ValueError):
+            bin_screen_points(points, (0, 0, 3, 1), values, "median")
+
+
+class ScatterplotGatherPointsCase(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        x = random.uniform(0.0, 10.0, size=1000)
+        y = random.uniform(0.0, 10.0, size=1000)
+        x[::13] = np.nan
+        self.scatterplot = create_scatter_plot(
+            data=[x, y], border_visible=False
+        )
+        self.scatterplot.index_range.set_bounds(2.0, 8.0)
+        self.scatterplot.value_range.set_bounds(1.0, 9.0)
+
+    def assert_gather_matches_old(self):
+        plot = self.scatterplot
+        plot._gather_points_old()
+        expected_pts = plot._cached_data_pts
+        expected_mask = plot._cached_point_mask
+        expected_selected = plot._cached_selected_pts
+
+        plot._cache_valid = plot._selection_cache_valid = False
+        plot._gather_points()
+
+        np.testing.assert_array_equal(plot._cached_data_pts, expected_pts)
+        np.testing.assert_array_equal(plot._cached_point_mask, expected_mask)
+        if expected_selected is None:
+            self.assertIsNone(plot._cached_selected_pts)
+        else:
+            # the old implementation also keeps selected points which are
+            # outside of the ranges
+            in_view = (
+                (expected_selected[:, 0] >= 2.0)
+                & (expected_selected[:, 0] <= 8.0)
+                & (expected_selected[:, 1] >= 1.0)
+                & (expected_selected[:, 1] <= 9.0)
+            )
+            np.testing.assert_array_equal(
+                plot._cached_selected_pts, expected_selected[in_view]
+            )
+
+    def test_gather_points(self):
+        self.assert_gather_matches_old()
+
+    def test_gather_points_sorted(self):
+        index = np.linspace(0.0, 10.0, 1000)
+        self.scatterplot.index.set_data(index, sort_order="ascending")
+
+        self.assert_gather_matches_old()
+
+    def test_gather_points_selections(self):
+        self.scatterplot.index.metadata["selections"] = [1, 5, 300, 600]
+
+        self.assert_gather_matches_old()
+
+    def test_gather_points_selection_masks(self):
+        mask = np.zeros(1000, dtype=bool)
+        mask[100:400] = True
+        self.scatterplot.value.metadata["selection_masks"] = [mask]
+
+        self.assert_gather_matches_old()
+
+    def test_gather_points_range_selection(self):
+        # range selections are not index selections
+        self.scatterplot.index.metadata["selections"] = (2.0, 5.0)
+        self.scatterplot.value.metadata.pop("selections")
+
+        self.scatterplot._gather_points()
+
+        self.assertIsNone(self.scatterplot._cached_selected_pts)
+
+
+class ScatterplotMapIndexCase(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        x = random.uniform(0.0, 10.0, size=20000)
+        y = random.uniform(0.0, 10.0, size=20000)
+        x[::13] = np.nan
+        self.scatterplot = create_scatter_plot(
+            data=[x, y], border_visible=False
+        )
+        self.scatterplot.outer_bounds = [300, 300]
+        self.scatterplot.do_layout()
+
+    def test_map_index_matches_brute_force(self):
+        brute_force = create_scatter_plot(
+            data=[
+                self.scatterplot.index.get_data(),
+                self.scatterplot.value.get_data(),
+            ],
+            border_visible=False,
+            use_subdivision=False,
+        )
+        brute_force.outer_bounds = [300, 300]
+        brute_force.do_layout()
+
+        for screen_pt in [(0, 0), (10.3, 200.7), (150, 150), (299, 120)]:
+            for threshold in [0.0, 2.0, 7.0]:
+                self.assertEqual(
+                    self.scatterplot.map_index(screen_pt, threshold),
+                    brute_force.map_index(screen_pt, threshold),
+                )
+
+    def test_map_index_data_changed(self):
+        self.scatterplot.map_index((150, 150), 5.0)
+        self.assertIsNotNone(self.scatterplot._subdivision)
+
+        self.scatterplot.index.set_data(np.full(20000, 5.0))
+        self.scatterplot.value.set_data(np.full(20000, 5.0))
+
+        self.assertIsNone(self.scatterplot._subdivision)
+        screen_pt = self.scatterplot.map_screen([5.0, 5.0])[0]
+        self.assertEqual(self.scatterplot.map_index(screen_pt, 1.0), 0)
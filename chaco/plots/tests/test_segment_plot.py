@@ -311,3 +311,91 @@ class SegmentPlotTest(unittest.TestCase):
         gc.render_component(self.segment_plot)
         actual = gc.bmp_array[:, :, :]
         self.assertFalse(np.all(actual == 255))
+
+    def test_segment_culling(self):
+        self.set_color_data()
+        self.segment_plot.index_range.set_bounds(3.5, 9.0)
+
+        self.segment_plot._gather_points()
+
+        assert_array_equal(
+            self.segment_plot._cached_segment_indices, [2, 3, 4]
+        )
+        assert_array_equal(
+            self.segment_plot._cached_data_pts[:, 0, 0], [4, 6, 8]
+        )
+        gc = PlotGraphicsContext(self.size)
+        gc.render_component(self.segment_plot)
+        actual = gc.bmp_array[:, :, :]
+        self.assertFalse(np.all(actual == 255))
+
+    def test_segment_culling_nan(self):
+        self.segment_plot.value.set_data(array([1, 2, np.nan, 4] + [1] * 6))
+
+        self.segment_plot._gather_points()
+
+        assert_array_equal(
+            self.segment_plot._cached_segment_indices, [0, 2, 3, 4]
+        )
+
+    def test_segment_style_groups(self):
+        color_data_source = ArrayDataSource(np.linspace(0.0, 1.0, 1000))
+        color_range = DataRange1D()
+        color_range.add(color_data_source)
+        self.segment_plot.index.set_data(arange(2000))
+        self.segment_plot.value.set_data(arange(2000) % 7)
+        self.segment_plot.color_by_data = True
+        self.segment_plot.color_data = color_data_source
+        self.segment_plot.color_mapper = viridis(range=color_range, steps=1000)
+        self.segment_plot.max_style_groups = 16
+
+        self.segment_plot.index_range.set_bounds(500, 1500)
+        self.segment_plot._gather_points()
+        segments = self.segment_plot.get_screen_points()
+        groups = self.segment_plot._render_groups(segments)
+
+        self.assertLessEqual(len(groups), 16)
+        members = np.concatenate([group[2] for group in groups])
+        assert_array_equal(np.sort(members), arange(len(segments)))
+        # the colors of the segments of a group are quantized to one of a
+        # few levels per channel
+        colors = self.segment_plot.effective_colors.view(np.float32)
+        colors = colors.reshape(-1, 4)
+        indices = self.segment_plot._cached_segment_indices
+        for color, width, group in groups:
+            self.assertEqual(width, 1.0)
+            group_colors = colors[indices[group]]
+            self.assertLess(np.abs(group_colors - color).max(), 0.25)
+
+        gc = PlotGraphicsContext(self.size)
+        gc.render_component(self.segment_plot)
+        actual = gc.bmp_array[:, :, :]
+        self.assertFalse(np.all(actual == 255))
+
+    def test_segment_style_groups_disabled(self):
+        self.set_color_data()
+        self.segment_plot.max_style_groups = 0
+
+        segments = self.segment_plot.get_screen_points()
+        groups = self.segment_plot._render_groups(segments)
+
+        self.assertEqual(len(groups), 5)
+        assert_array_equal(
+            [group[0] for group in groups],
+            self.segment_plot.effective_colors,
+        )
+
+    def test_segment_large_path(self):
+        # long diagonal segments which overflow the rasterizer if they are
+        # drawn as one path
+        n = 20000
+        index = np.column_stack([np.zeros(n), np.full(n, 9.0)]).ravel()
+        value = np.column_stack([arange(n), arange(n)[::-1]]).ravel()
+        self.segment_plot.index.set_data(index)
+        self.segment_plot.value.set_data(value)
+        self.segment_plot.line_width = 3.0
+
+        gc = PlotGraphicsContext(self.size)
+        gc.render_component(self.segment_plot)
+        actual = gc.bmp_array[:, :, :]
+        self.assertFalse(np.all(actual == 255))
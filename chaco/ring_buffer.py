@@ -0,0 +1,96 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Defines the RingBuffer class, used to stream data into data sources.
+"""
+import numpy as np
+
+
+class RingBuffer(object):
+    """ A contiguous 1D array which supports amortized O(1) appends.
+
+    The values are kept in a larger storage array with free space after the
+    end of the data, so most appends only copy the new values.  When an
+    append would run past the end of the storage, the values which are kept
+    are copied into a new storage array with room for at least as many
+    values again.
+
+    An optional capacity passed to :meth:`append` bounds the number of
+    values which are kept; the oldest values are discarded first.  Since the
+    storage is never written to before the end of the data, the arrays
+    returned by :meth:`get` are never modified by later appends.
+
+    Parameters
+    ----------
+    data : 1D array
+        The initial values of the buffer.  The data is copied.
+    """
+
+    def __init__(self, data=None):
+        if data is None:
+            data = np.empty(shape=(0,))
+        data = np.asarray(data)
+        self._storage = self._allocate(len(data), data.dtype)
+        self._storage[: len(data)] = data
+        self._start = 0
+        self._end = len(data)
+
+    def __len__(self):
+        return self._end - self._start
+
+    def get(self):
+        """ Returns the values in the buffer as a contiguous array view.
+        """
+        return self._storage[self._start:self._end]
+
+    def append(self, values, capacity=None):
+        """ Appends values to the end of the buffer.
+
+        Parameters
+        ----------
+        values : 1D array
+            The values to append.
+        capacity : int or None
+            If given, only the most recent *capacity* values are kept.
+
+        Returns
+        -------
+        discarded : int
+            The number of values removed from the start of the buffer.
+        """
+        values = np.atleast_1d(np.asarray(values))
+        size = len(self)
+        if capacity is None:
+            keep = size
+        else:
+            values = values[max(len(values) - capacity, 0):]
+            keep = min(size, capacity - len(values))
+
+        dtype = self._storage.dtype
+        if not np.can_cast(values.dtype, dtype, "safe"):
+            dtype = np.result_type(dtype, values.dtype)
+
+        start = self._end - keep
+        end = self._end + len(values)
+        if end > len(self._storage) or dtype != self._storage.dtype:
+            storage = self._allocate(keep + len(values), dtype)
+            storage[:keep] = self._storage[start:self._end]
+            self._storage = storage
+            start, end = 0, keep + len(values)
+
+        self._storage[end - len(values):end] = values
+        self._start = start
+        self._end = end
+        return size - keep
+
+    @staticmethod
+    def _allocate(size, dtype):
+        """ Returns storage with room for *size* values and as many again. """
+        return np.empty(max(2 * size, 16), dtype=dtype)
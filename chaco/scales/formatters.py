@@ -12,9 +12,13 @@
 Classes for formatting labels for values or times.
 """
 
+from locale import LC_TIME, getlocale
 from math import ceil, floor, fmod, log10
+import re
 
+import numpy
 from numpy import abs, all, array, asarray, amax, amin
+from . import safetime
 from .safetime import strftime, time, safe_fromtimestamp, localtime
 import warnings
 
@@ -26,6 +30,7 @@ __all__ = [
     "OffsetFormatter",
     "TimeFormatter",
     "strftimeEx",
+    "format_times",
 ]
 
 
@@ -443,6 +448,251 @@ def strftimeEx(fmt, t, timetuple=None):
     return strftime(fmt, timetuple)
 
 
+# The zero-padded strings of small numbers, indexed by the number.
+_TWO_DIGITS = array(["%02d" % i for i in range(100)])
+_THREE_DIGITS = array(["%03d" % i for i in range(1001)])
+
+# Matches the directives of the formats accepted by strftimeEx.
+_DIRECTIVE = re.compile(r"%\((ms_|ms|us)\)|%(.)", re.DOTALL)
+
+# The parsed formats, keyed by the format string.
+_parsed_formats = {}
+
+# The locale's names of days, months and AM/PM, keyed by the directive and
+# the locale.
+_locale_names = {}
+
+
+def format_times(fmt, times):
+    """Formats an array of times with strftimeEx.
+
+    The labels are computed for all of the times at once with NumPy, rather
+    than by converting and formatting each time in turn, so formatting many
+    times is much faster than calling strftimeEx for each.  The calendar
+    fields are those of ``localtime(t)``, as in TimeFormatter.format().
+
+    Parameters
+    ----------
+    fmt : str or callable
+        A format accepted by strftimeEx.
+    times : array of numbers
+        Floating-point numbers of seconds since epoch.
+
+    Returns
+    -------
+    A list of formatted strings.
+    """
+    times = asarray(times, dtype=float).ravel()
+    fields = _time_fields(times)
+    if fields is None:
+        return [strftimeEx(fmt, t, localtime(t)) for t in times]
+    return _format_fields(fmt, fields)
+
+
+def _time_fields(times):
+    """Returns the calendar fields of the local times of an array of times
+    since epoch, as a dict of arrays, or None if some of the times are out of
+    the range handled by NumPy.
+    """
+    if len(times) == 0 or not numpy.isfinite(times).all():
+        return None
+    if amax(abs(times)) > 2.5e11:
+        # beyond the years 1000 to 9999
+        return None
+
+    epoch = numpy.datetime64(safetime.EPOCH, "us")
+    # like timedelta(seconds=t), round to the nearest microsecond
+    local = epoch + numpy.rint(times * 1e6).astype("timedelta64[us]")
+    years = local.astype("datetime64[Y]")
+    months = local.astype("datetime64[M]")
+    days = local.astype("datetime64[D]")
+    year = years.astype(numpy.int64) + 1970
+    if year.min() < 1000 or year.max() > 9999:
+        return None
+
+    seconds = (local - days).astype("timedelta64[s]").astype(numpy.int64)
+    return {
+        "times": times,
+        "year": year,
+        "month": (months - years).astype(numpy.int64) + 1,
+        "day": (days - months).astype(numpy.int64) + 1,
+        "hour": seconds // 3600,
+        "minute": seconds // 60 % 60,
+        "second": seconds % 60,
+        # 1970-01-01 was a Thursday, and Monday is 0
+        "wday": (days.astype(numpy.int64) + 3) % 7,
+        "yday": (days - years).astype(numpy.int64) + 1,
+    }
+
+
+def _format_fields(fmt, fields):
+    """Formats the times whose calendar fields are given with strftimeEx.
+    """
+    times = fields["times"]
+    if callable(fmt):
+        batch_function = _BATCH_FUNCTIONS.get(fmt)
+        if batch_function is None:
+            return [fmt(t) for t in times]
+        return batch_function(fields).tolist()
+
+    tokens = _parse_format(fmt)
+    if tokens is None:
+        return [strftimeEx(fmt, t, localtime(t)) for t in times]
+
+    labels = None
+    for is_directive, token in tokens:
+        if is_directive:
+            strings = _directive_strings(token, fields)
+        else:
+            strings = token
+        if labels is None:
+            labels = numpy.broadcast_to(
+                asarray(strings, dtype=str), times.shape
+            )
+        else:
+            labels = numpy.char.add(labels, strings)
+    if labels is None:
+        return [""] * len(times)
+    return labels.tolist()
+
+
+def _parse_format(fmt):
+    """Splits a strftimeEx format into a list of (is directive, text)
+    pairs, or returns None if the format has directives which cannot be
+    formatted by _directive_strings.
+    """
+    if fmt in _parsed_formats:
+        return _parsed_formats[fmt]
+
+    # strftimeEx formats either %(ms), or %(ms_) and %(us)
+    has_ms = "%(ms)" in fmt
+    tokens = []
+    position = 0
+    for match in _DIRECTIVE.finditer(fmt):
+        if match.start() > position:
+            tokens.append((False, fmt[position:match.start()]))
+        position = match.end()
+        if match.group(1) is not None:
+            if (match.group(1) == "ms") != has_ms:
+                # strftimeEx leaves this for strftime
+                tokens = None
+                break
+            tokens.append((True, match.group()[1:]))
+        elif match.group(2) in _SIMPLE_DIRECTIVES:
+            tokens.append((True, match.group(2)))
+        else:
+            tokens = None
+            break
+    else:
+        if position < len(fmt):
+            tokens.append((False, fmt[position:]))
+
+    _parsed_formats[fmt] = tokens
+    return tokens
+
+
+def _directive_strings(directive, fields):
+    """Returns the strings of a directive for an array of times."""
+    if directive == "%":
+        return "%"
+    elif directive == "(ms)":
+        times = _round(fields["times"], 3)
+        fraction = times - numpy.floor(times)
+        return _THREE_DIGITS[numpy.rint(1e3 * fraction).astype(int)]
+    elif directive in ("(ms_)", "(us)"):
+        times = _round(fields["times"], 6)
+        fraction = times - numpy.floor(times)
+        ms_, us = divmod(numpy.rint(1e6 * fraction).astype(int), 1000)
+        return _THREE_DIGITS[ms_ if directive == "(ms_)" else us]
+    elif directive in _LOCALE_DIRECTIVES:
+        names = _get_locale_names(directive)
+        if directive in "aA":
+            return names[fields["wday"]]
+        elif directive in "bB":
+            return names[fields["month"] - 1]
+        else:
+            return names[fields["hour"] // 12]
+    elif directive == "Y":
+        return _unique_strings(str, fields["year"])
+    elif directive == "y":
+        return _TWO_DIGITS[fields["year"] % 100]
+    elif directive == "j":
+        return _THREE_DIGITS[fields["yday"]]
+    elif directive == "I":
+        return _TWO_DIGITS[(fields["hour"] + 11) % 12 + 1]
+    else:
+        return _TWO_DIGITS[fields[_NUMBER_DIRECTIVES[directive]]]
+
+
+def _round(values, decimals):
+    """Rounds an array like the builtin round(), which rounds the exact
+    decimal value of each float rather than its product by a power of ten.
+    """
+    scaled = values * 10.0 ** decimals
+    rounded = numpy.round(values, decimals)
+    # the results can only differ for values which are within the rounding
+    # error of the product of a half
+    tolerance = 1e-3 + 4 * abs(numpy.spacing(scaled))
+    near_half = abs(scaled - numpy.floor(scaled) - 0.5) < tolerance
+    for i in numpy.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), decimals)
+    return rounded
+
+
+def _get_locale_names(directive):
+    """Returns the locale's names of the days, months or AM/PM, memoized
+    for the current locale.
+    """
+    key = (directive, getlocale(LC_TIME))
+    names = _locale_names.get(key)
+    if names is None:
+        fmt = "%" + directive
+        if directive in "aA":
+            # 2001-01-01 was a Monday
+            values = [
+                strftime(fmt, (2001, 1, 1 + i, 0, 0, 0, i, 1 + i, -1))
+                for i in range(7)
+            ]
+        elif directive in "bB":
+            values = [
+                strftime(fmt, (2001, i, 1, 0, 0, 0, 0, 1, -1))
+                for i in range(1, 13)
+            ]
+        else:
+            values = [
+                strftime(fmt, (2001, 1, 1, hour, 0, 0, 0, 1, -1))
+                for hour in (0, 12)
+            ]
+        names = _locale_names[key] = array(values)
+    return names
+
+
+def _unique_strings(function, values):
+    """Applies a function returning strings to each distinct value."""
+    unique, inverse = numpy.unique(values, return_inverse=True)
+    return array([function(value) for value in unique])[inverse]
+
+
+# The directives for numbers formatted with two digits, and their fields.
+_NUMBER_DIRECTIVES = {
+    "m": "month",
+    "d": "day",
+    "H": "hour",
+    "M": "minute",
+    "S": "second",
+}
+
+_LOCALE_DIRECTIVES = "aAbBp"
+
+_SIMPLE_DIRECTIVES = set(_NUMBER_DIRECTIVES) | set(_LOCALE_DIRECTIVES) | {
+    "%",
+    "Y",
+    "y",
+    "j",
+    "I",
+}
+
+
 def _two_digit_year(t):
     """Round to the nearest Jan 1, roughly."""
     dt = safe_fromtimestamp(t)
@@ -461,6 +711,38 @@ def _four_digit_year(t):
     return str(year)
 
 
+def _strip_leading_zeros(label):
+    """Strips the leading zeros of a time label."""
+    stripped = label.lstrip("0")
+    if stripped != label and (stripped == "" or not stripped[0].isdigit()):
+        # A label such as '000ms' should leave one zero.
+        stripped = "0" + stripped
+    return stripped
+
+
+def _rounded_years(fields):
+    """Returns the years of the times, rounded to the nearest Jan 1."""
+    return fields["year"] + (fields["month"] >= 7)
+
+
+def _two_digit_years(fields):
+    """Formats the years of many times like _two_digit_year."""
+    return numpy.char.add("'", _TWO_DIGITS[_rounded_years(fields) % 100])
+
+
+def _four_digit_years(fields):
+    """Formats the years of many times like _four_digit_year."""
+    return _unique_strings(str, _rounded_years(fields))
+
+
+# Functions which format the calendar fields of many times at once, keyed by
+# the format function which they replace.
+_BATCH_FUNCTIONS = {
+    _two_digit_year: _two_digit_years,
+    _four_digit_year: _four_digit_years,
+}
+
+
 class TimeFormatter(object):
     """Formatter for time values."""
 
@@ -597,14 +879,38 @@ class TimeFormatter(object):
                 format = good_formats[-1]
 
         # Apply the format to the tick values
-        labels = []
         resol_ndx = self.format_order.index(resol)
-
-        # This dictionary maps the name of a time resolution (in self.format_order)
-        # to its index in a time.localtime() timetuple.  The default is to map
-        # everything to index 0, which is year.  This is not ideal; it might cause
-        # a problem with the tick at midnight, january 1st, 0 a.d. being incorrectly
-        # promoted at certain tick resolutions.
+        fields = _time_fields(asarray(ticks, dtype=float).ravel())
+        if fields is None:
+            return self._format_each(ticks, format, resol, resol_ndx)
+
+        # The format of each tick, as an index into format_order of a
+        # resolution whose first format is used, or -1 for *format*.
+        format_ndx = self._promote_formats(fields, resol, resol_ndx)
+        labels = numpy.empty(len(ticks), dtype=object)
+        for ndx in numpy.unique(format_ndx):
+            if ndx < 0:
+                tick_format = format
+            else:
+                tick_format = self.formats[self.format_order[ndx]][1][0]
+            selected = format_ndx == ndx
+            labels[selected] = _format_fields(
+                tick_format,
+                {name: value[selected] for name, value in fields.items()},
+            )
+
+        if self.strip_leading_zeros:
+            return [_strip_leading_zeros(s) for s in labels]
+        return labels.tolist()
+
+    def _time_tuple_ndx_for_resol(self):
+        """Returns a dict which maps the name of a time resolution (in
+        self.format_order) to its index in a time.localtime() timetuple.
+        """
+        # The default is to map everything to index 0, which is year.  This
+        # is not ideal; it might cause a problem with the tick at midnight,
+        # january 1st, 0 a.d. being incorrectly promoted at certain tick
+        # resolutions.
         time_tuple_ndx_for_resol = dict.fromkeys(self.format_order, 0)
         time_tuple_ndx_for_resol.update(
             {
@@ -615,12 +921,50 @@ class TimeFormatter(object):
                 "hours": 3,
             }
         )
+        return time_tuple_ndx_for_resol
+
+    def _promote_formats(self, fields, resol, resol_ndx):
+        """Returns the format of each tick as chosen by _format_each, as an
+        index into format_order of the resolution whose first format is
+        used, or -1 for the format of the resolution of the ticks.
+        """
+        timetuple_fields = ("year", "month", "day", "hour", "minute", "second")
+        field_for_resol = {
+            resol_name: timetuple_fields[ndx]
+            for resol_name, ndx in self._time_tuple_ndx_for_resol().items()
+        }
+
+        format_ndx = numpy.full(len(fields["times"]), -1)
+        # the ticks still being promoted
+        active = numpy.ones(len(format_ndx), dtype=bool)
+        next_ndx = resol_ndx
+        hybrid_handled = False
+        while True:
+            active &= fields[field_for_resol[self.format_order[next_ndx]]] == 0
+            if not active.any():
+                break
+            next_ndx += 1
+            if next_ndx == len(self.format_order):
+                break
+            if resol in ("minsec", "hourmin") and not hybrid_handled:
+                if resol == "minsec":
+                    hybrid = (fields["minute"] == 0) & (fields["second"] != 0)
+                else:
+                    hybrid = (fields["hour"] == 0) & (fields["minute"] != 0)
+                hybrid &= active
+                format_ndx[hybrid] = resol_ndx - 1
+                active &= ~hybrid
+                hybrid_handled = True
+            format_ndx[active] = next_ndx
+        return format_ndx
+
+    def _format_each(self, ticks, format, resol, resol_ndx):
+        """Formats the ticks one at a time, for times which are out of the
+        range of _time_fields.
+        """
+        labels = []
+        time_tuple_ndx_for_resol = self._time_tuple_ndx_for_resol()
 
-        # As we format each tick, check to see if we are at a boundary of the
-        # next higher unit of time.  If so, replace the current format with one
-        # from that resolution.  This is not the best heuristic in the world,
-        # but it works!  There is some trickiness here due to having to deal
-        # with hybrid formats in a reasonable manner.
         for t in ticks:
             try:
                 tm = localtime(t)
@@ -663,11 +1007,7 @@ class TimeFormatter(object):
                 s = strftimeEx(next_format, t, tm)
 
             if self.strip_leading_zeros:
-                ss = s.lstrip("0")
-                if ss != s and (ss == "" or not ss[0].isdigit()):
-                    # A label such as '000ms' should leave one zero.
-                    ss = "0" + ss
-                labels.append(ss)
+                labels.append(_strip_leading_zeros(s))
             else:
                 labels.append(s)
 
@@ -451,6 +451,11 @@ class ScaleSystem(object):
         self.fill_ratio = 0.3
         self.default_numticks = 8
 
+        # The label widths of the scales for the last interval, keyed by the
+        # scale.
+        self._label_widths_key = None
+        self._label_widths = {}
+
     def ticks(self, start, end, numticks=None):
         """Computes nice locations for tick marks.
 
@@ -544,23 +549,16 @@ class ScaleSystem(object):
                 if len(self.scales) == 0:
                     scales = [self.default_scale]
                 else:
-                    scales = self.scales
+                    scales = self._get_width_candidates(
+                        start, end, char_width
+                    )
 
-            counts, widths = zip(
-                *[
-                    s.label_width(start, end, char_width=char_width)
-                    for s in scales
-                ]
+            scale, count = self._closest_label_width(
+                scales, start, end, char_width
             )
-            widths = array(widths)
-            closest = argmin(abs(widths - char_width * self.fill_ratio))
             if numlabels is None:
-                numlabels = scales[closest].num_ticks(
-                    start, end, counts[closest]
-                )
-            labels = scales[closest].labels(
-                start, end, numlabels, char_width=char_width
-            )
+                numlabels = scale.num_ticks(start, end, count)
+            labels = scale.labels(start, end, numlabels, char_width=char_width)
 
         return labels
 
@@ -585,14 +583,104 @@ class ScaleSystem(object):
         return closest_scale
 
     def _get_scale_bisect(self, start, end, numticks):
+        scale_intervals, sorted_scales = self._sort_scales(
+            start, end, numticks
+        )
+        ndx = bisect(scale_intervals, numticks)
+        if ndx == len(sorted_scales):
+            ndx -= 1
+        return sorted_scales[ndx]
+
+    def _sort_scales(self, start, end, numticks=None):
+        """Returns the scales sorted by the approximate number of ticks they
+        produce for the interval, from the fewest to the most, and their
+        numbers of ticks.
+        """
+        if numticks is None:
+            numticks = self.default_numticks
         scale_intervals = [
             s.num_ticks(start, end, numticks) for s in self.scales
         ]
-        sorted_scales = sorted(zip(scale_intervals, self.scales))
-        ndx = bisect(sorted_scales, numticks, lo=0, hi=len(self.scales))
-        if ndx == len(self.scales):
-            ndx -= 1
-        return sorted_scales[ndx][1]
+        order = sorted(
+            range(len(self.scales)), key=scale_intervals.__getitem__
+        )
+        return (
+            [scale_intervals[i] for i in order],
+            [self.scales[i] for i in order],
+        )
+
+    def _get_width_candidates(self, start, end, char_width):
+        """Returns the scales whose labels may come closest to filling
+        **fill_ratio** of *char_width*.
+
+        The width of the labels of an arbitrary scale need not grow with its
+        number of ticks, so this returns all of the scales.
+        """
+        return list(self.scales)
+
+    def _bisect_width_candidates(self, start, end, char_width):
+        """Returns the few scales whose labels may come closest to filling
+        **fill_ratio** of *char_width*, for scale systems whose label widths
+        grow with the number of ticks.
+
+        Rather than estimating the width of the labels of every scale, this
+        bisects the scales sorted by their number of ticks for the first one
+        whose labels are at least as wide as the target, and returns it and
+        its neighbours.  The neighbours cover the small dips in width where a
+        scale switches to a shorter label format.
+        """
+        target = char_width * self.fill_ratio
+        scale_intervals, scales = self._sort_scales(start, end)
+        low, high = 0, len(scales)
+        while low < high:
+            mid = (low + high) // 2
+            width = self._label_width(scales[mid], start, end, char_width)[1]
+            if width < target:
+                low = mid + 1
+            else:
+                high = mid
+
+        first = max(low - 1, 0)
+        last = min(low + 2, len(scales))
+        # include the scales with as many ticks as the outermost candidates
+        while (
+            first > 0
+            and scale_intervals[first - 1] == scale_intervals[first]
+        ):
+            first -= 1
+        while (
+            last < len(scales)
+            and scale_intervals[last] == scale_intervals[last - 1]
+        ):
+            last += 1
+        candidates = scales[first:last]
+        # keep the order of self.scales, which breaks ties
+        return [s for s in self.scales if s in candidates]
+
+    def _closest_label_width(self, scales, start, end, char_width):
+        """Returns the scale whose labels come closest to filling
+        **fill_ratio** of *char_width*, and its number of labels.
+        """
+        counts, widths = zip(
+            *[self._label_width(s, start, end, char_width) for s in scales]
+        )
+        widths = array(widths)
+        closest = argmin(abs(widths - char_width * self.fill_ratio))
+        return scales[closest], counts[closest]
+
+    def _label_width(self, scale, start, end, char_width):
+        """Returns scale.label_width for the interval, memoized until the
+        interval or the available width changes.
+        """
+        key = (start, end, char_width)
+        if key != self._label_widths_key:
+            self._label_widths_key = key
+            self._label_widths = {}
+        width = self._label_widths.get(scale)
+        if width is None:
+            width = scale.label_width(start, end, char_width=char_width)
+            self._label_widths[scale] = width
+        return width
 
     def _get_scale_np(self, start, end, numticks):
         # Extract the intervals from the scales we were given
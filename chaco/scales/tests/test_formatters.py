@@ -9,8 +9,14 @@
 # Thanks for using Enthought open source!
 
 import unittest
+from unittest import mock
+import warnings
 
-from chaco.scales.formatters import strftimeEx, TimeFormatter
+import numpy as np
+
+from chaco.scales.formatters import format_times, strftimeEx, TimeFormatter
+from chaco.scales.safetime import localtime
+from chaco.scales.time_scale import CalendarScaleSystem
 
 
 # ----------------------------------------------------------------
@@ -82,6 +88,41 @@ class TestStrftimeEx(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestFormatTimes(unittest.TestCase):
+    def test_formats_like_strftimeEx(self):
+        rng = np.random.default_rng(0)
+        times = rng.uniform(-1e9, 3e9, 200).tolist()
+        # halves of the last digit, which round() rounds exactly
+        times += [0.0005, 0.0015, 1.0000005, 1e9 + 0.25, -0.0005]
+        formats = [
+            "%Y-%m-%d %H:%M:%S",
+            "%a %A %b %B %d %I%p %j %y %%",
+            "%S.%(ms)s",
+            "%(ms_).%(us)ms",
+            "%(us)us",
+            "%m/%Y",
+        ]
+        for fmt in formats:
+            expected = [strftimeEx(fmt, t, localtime(t)) for t in times]
+            self.assertEqual(format_times(fmt, times), expected, fmt)
+
+    def test_unsupported_directive(self):
+        times = [0.0, 1e9]
+        expected = [strftimeEx("%c", t, localtime(t)) for t in times]
+        self.assertEqual(format_times("%c", times), expected)
+
+    def test_callable_format(self):
+        labels = format_times(lambda t: "%g" % t, [1, 2.5])
+        self.assertEqual(labels, ["1", "2.5"])
+
+    def test_out_of_range(self):
+        times = [1e9, 1e13]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = [strftimeEx("%Y", t, localtime(t)) for t in times]
+            self.assertEqual(format_times("%Y", times), expected)
+
+
 # ----------------------------------------------------------------
 # TimeFormatter tests
 # ----------------------------------------------------------------
@@ -94,3 +135,34 @@ class TestTimeFormatter(unittest.TestCase):
         labels = tf.format(ticks, char_width=130)
         expected = ["5.000ms", "5.300ms", "5.600ms"]
         self.assertEqual(labels, expected)
+
+    def test_format_all_matches_format_each(self):
+        tf = TimeFormatter()
+        css = CalendarScaleSystem()
+        for start in [0.0, 1.5e9, -2e9]:
+            for span in np.geomspace(1e-4, 200 * 365 * 24 * 3600, 15):
+                for scale in css.scales:
+                    if scale.num_ticks(start, start + span) > 200:
+                        continue
+                    ticks = scale.ticks(start, start + span, 8)
+                    labels = tf.format(ticks, char_width=500, ticker=scale)
+                    with mock.patch(
+                        "chaco.scales.formatters._time_fields",
+                        return_value=None,
+                    ):
+                        expected = tf.format(
+                            ticks, char_width=500, ticker=scale
+                        )
+                    self.assertEqual(labels, expected)
+
+    def test_promoted_formats(self):
+        tf = TimeFormatter()
+        # minutes and seconds crossing midnight, the hour and the minute
+        ticks = [86400.0 - 60, 86400.0 - 30, 86400.0, 86430.0, 86460.0]
+        labels = tf.format(ticks, ticker=mock.Mock(resolution=30.0))
+        with mock.patch(
+            "chaco.scales.formatters._time_fields", return_value=None
+        ):
+            expected = tf.format(ticks, ticker=mock.Mock(resolution=30.0))
+        self.assertEqual(labels, expected)
+        self.assertEqual(len(set(labels)), 5)
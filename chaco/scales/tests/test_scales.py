@@ -10,7 +10,8 @@
 
 import unittest
 
-from numpy import array
+from numpy import argmin, array
+from numpy.random import RandomState
 
 from ..formatters import BasicFormatter, OffsetFormatter
 from ..scales import (
@@ -169,6 +170,46 @@ class ScaleSystemTestCase(TicksTestCase):
         ticks = ticker.ticks(2.0, 3.0, 10)
         self.check_ticks(ticks, frange(2.0, 3.0, 0.1))
 
+    def test_width_based_labels_mixed_scales(self):
+        # the label widths of the default scale do not grow with the number
+        # of ticks of the fixed scales, so every scale must be considered
+        systems = [
+            ScaleSystem(FixedScale(1), FixedScale(10), DefaultScale()),
+            ScaleSystem(
+                DefaultScale(),
+                FixedScale(0.5),
+                FixedScale(10),
+                FixedScale(1e3),
+            ),
+        ]
+        random = RandomState(0)
+        for ticker in systems:
+            for i in range(200):
+                start = random.uniform(-1e4, 1e4)
+                end = start + 10 ** random.uniform(-1, 5)
+                char_width = random.choice([20, 80, 300, 1000])
+
+                counts, widths = zip(
+                    *[
+                        s.label_width(start, end, char_width=char_width)
+                        for s in ticker.scales
+                    ]
+                )
+                target = char_width * ticker.fill_ratio
+                closest = argmin(abs(array(widths) - target))
+                scale = ticker.scales[closest]
+                expected = scale.labels(
+                    start,
+                    end,
+                    scale.num_ticks(start, end, counts[closest]),
+                    char_width=char_width,
+                )
+
+                self.check_labels(
+                    ticker.labels(start, end, char_width=char_width),
+                    expected,
+                )
+
     def test_translation(self):
         pass
 
@@ -11,7 +11,9 @@
 import datetime
 import os
 import contextlib
+import timeit
 import unittest
+from unittest import mock
 
 import numpy as np
 import numpy.testing as nptest
@@ -500,6 +502,78 @@ class TestCalendarScaleSystem(unittest.TestCase):
         self.assertEqual(len(ticks), 11)
         nptest.assert_array_equal(np.array(ticks), np.linspace(0, 10, 11))
 
+    def test_width_based_labels_match_exhaustive_search(self):
+        css = CalendarScaleSystem()
+        start = 1.5e9
+        for span in np.geomspace(1e-3, 300 * 365 * 24 * 3600, 40):
+            for char_width in [40, 300, 4000]:
+                end = start + span
+                target = char_width * css.fill_ratio
+                widths = [
+                    s.label_width(start, end, char_width=char_width)[1]
+                    for s in css.scales
+                ]
+                closest = np.argmin(np.abs(np.array(widths) - target))
+                expected = css.scales[closest]
+
+                scale, _ = css._closest_label_width(
+                    css._get_width_candidates(start, end, char_width),
+                    start,
+                    end,
+                    char_width,
+                )
+                self.assertIs(scale, expected, (span, char_width))
+
+    def test_width_based_labels_estimate_few_widths(self):
+        css = CalendarScaleSystem()
+        start, end = 1.5e9, 1.5e9 + 20 * 365 * 24 * 3600
+        with mock.patch.object(
+            TimeScale, "label_width", autospec=True,
+            side_effect=TimeScale.label_width,
+        ) as label_width:
+            labels = css.labels(start, end, char_width=1500)
+            first_count = label_width.call_count
+            css.labels(start, end, char_width=1500)
+
+        self.assertGreater(len(labels), 0)
+        # a bisection over the scales plus a couple of neighbours
+        self.assertLessEqual(first_count, 8)
+        self.assertLess(first_count, len(css.scales))
+        # the widths are remembered while the interval is unchanged
+        self.assertEqual(label_width.call_count, first_count)
+
+
+TIMING_SETUP = """
+from chaco.scales.time_scale import CalendarScaleSystem
+
+css = CalendarScaleSystem()
+start = 1.5e9
+spans = [3600.0 * 24 * 365 * years for years in (1, 20, 100)]
+"""
+
+
+class TestCalendarScaleSystemTiming(unittest.TestCase):
+    def test_timing_long_time_axis(self):
+        # pans a wide time axis, so that every redraw picks a scale afresh
+        statement = """
+for span in spans:
+    for i in range(10):
+        css.labels(start + i * 3600.0, start + i * 3600.0 + span,
+                   char_width=2000)
+"""
+        timer = timeit.Timer(statement, setup=TIMING_SETUP)
+
+        t = min(timer.repeat(repeat=3, number=5)) / 150.0
+
+        # Fairly arbitrary: labelling an axis should take a small fraction
+        # of a frame.  A capable machine should be about 10 times faster.
+        # For reference:
+        #    Time               Notes
+        #    0.00045            2026/10/17, exhaustive width search
+        #    0.00040            2026/10/17, bisected width search
+        #    0.00021            2026/10/17, batch time formatting
+        self.assertLess(t, 0.01)
+
 
 # TODO: Add more tests of the ticks() and labels() methods of
 # the CalendarScaleSystem.
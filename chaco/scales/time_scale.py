@@ -454,3 +454,10 @@ class CalendarScaleSystem(ScaleSystem):
             closest_scale = self._get_scale_np(start, end, numticks)
 
         return closest_scale
+
+    def _get_width_candidates(self, start, end, char_width):
+        # The ticks of time scales are a fixed interval apart, so their label
+        # widths grow with their number of ticks and can be bisected.
+        if all(isinstance(scale, TimeScale) for scale in self.scales):
+            return self._bisect_width_candidates(start, end, char_width)
+        return super()._get_width_candidates(start, end, char_width)
@@ -0,0 +1,109 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Defines the GridIndex class, a spatial index for fast hit-testing.
+"""
+from math import sqrt
+
+import numpy as np
+
+
+class GridIndex(object):
+    """ A uniform grid of cells over a set of 2D points.
+
+    The points are sorted by the cell they fall in, so the points in any
+    rectangle can be found by looking only at the cells which overlap the
+    rectangle.  Building the index takes ``O(N log N)`` time, and a query
+    for a small rectangle takes time proportional to the number of points
+    near the rectangle, independent of the total number of points.
+
+    Points with a non-finite coordinate are not indexed.
+
+    Parameters
+    ----------
+    x, y : 1D arrays
+        The coordinates of the points.  If the arrays have different
+        lengths, the extra values of the longer one are ignored.
+    points_per_cell : int
+        The average number of points per cell to aim for.
+    max_cells : int
+        The maximum number of cells along each axis.
+    """
+
+    def __init__(self, x, y, points_per_cell=8, max_cells=4096):
+        size = min(len(x), len(y))
+        x = np.asarray(x[:size], dtype=float)
+        y = np.asarray(y[:size], dtype=float)
+        positions = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        x = x[positions]
+        y = y[positions]
+
+        n_cells = int(sqrt(len(positions) / points_per_cell))
+        self.n_cells = min(max(n_cells, 1), max_cells)
+        if len(positions) > 0:
+            self.x_bounds = (x.min(), x.max())
+            self.y_bounds = (y.min(), y.max())
+        else:
+            self.x_bounds = self.y_bounds = (0.0, 0.0)
+
+        cells = (
+            self._cell(x, self.x_bounds) * self.n_cells
+            + self._cell(y, self.y_bounds)
+        )
+        order = np.argsort(cells, kind="stable")
+        self.positions = positions[order]
+        self.x = x[order]
+        self.y = y[order]
+        # the points in cell i are at self.starts[i]:self.starts[i + 1]
+        self.starts = np.searchsorted(
+            cells[order], np.arange(self.n_cells ** 2 + 1)
+        )
+
+    def query(self, x_low, x_high, y_low, y_high):
+        """ Returns the positions of the points within a rectangle.
+
+        Returns
+        -------
+        positions : 1D int array
+            The sorted positions in the original arrays of the points with
+            ``x_low <= x <= x_high`` and ``y_low <= y <= y_high``.
+        """
+        if (
+            len(self.positions) == 0
+            or x_high < self.x_bounds[0] or x_low > self.x_bounds[1]
+            or y_high < self.y_bounds[0] or y_low > self.y_bounds[1]
+        ):
+            return np.empty(shape=(0,), dtype=np.intp)
+
+        first_x, last_x = self._cell(np.array([x_low, x_high]), self.x_bounds)
+        first_y, last_y = self._cell(np.array([y_low, y_high]), self.y_bounds)
+
+        # the cells in each column of the grid are contiguous
+        columns = np.arange(first_x, last_x + 1) * self.n_cells
+        starts = self.starts[columns + first_y]
+        ends = self.starts[columns + last_y + 1]
+        candidates = np.concatenate(
+            [np.arange(start, end) for start, end in zip(starts, ends)]
+        )
+
+        x = self.x[candidates]
+        y = self.y[candidates]
+        inside = (x >= x_low) & (x <= x_high) & (y >= y_low) & (y <= y_high)
+        return np.sort(self.positions[candidates[inside]])
+
+    def _cell(self, values, bounds):
+        """ Returns the cell coordinates of values along one axis. """
+        low, high = bounds
+        if not high > low:
+            return np.zeros(len(values), dtype=np.intp)
+        scale = self.n_cells / (high - low)
+        cells = np.floor((values - low) * scale)
+        np.clip(cells, 0, self.n_cells - 1, out=cells)
+        return cells.astype(np.intp)
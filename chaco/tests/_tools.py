@@ -9,10 +9,13 @@
 # Thanks for using Enthought open source!
 
 from contextlib import contextmanager
+from queue import Empty, Queue
 
 import sys
 import traceback
 
+from traits import trait_notifiers
+
 
 # ######### Testing tools
 
@@ -38,3 +41,32 @@ def store_exceptions_on_all_threads():
         if len(exceptions) > 0:
             raise exceptions[0]
         sys.excepthook = sys.__excepthook__
+
+
+@contextmanager
+def queued_ui_dispatch():
+    """Context manager that registers a UI handler which queues the handlers
+    dispatched to the UI thread from other threads.
+
+    It yields a function which calls the queued handlers in the calling
+    thread, as the event loop of a UI would.
+    """
+    queue = Queue()
+
+    def ui_handler(handler, *args, **kwargs):
+        queue.put((handler, args, kwargs))
+
+    def process_ui_events():
+        while True:
+            try:
+                handler, args, kwargs = queue.get_nowait()
+            except Empty:
+                return
+            handler(*args, **kwargs)
+
+    old_handler = trait_notifiers.get_ui_handler()
+    trait_notifiers.set_ui_handler(ui_handler)
+    try:
+        yield process_ui_events
+    finally:
+        trait_notifiers.set_ui_handler(old_handler)
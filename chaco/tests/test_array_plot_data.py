@@ -59,3 +59,28 @@ class ArrayPlotDataTestCase(unittest.TestCase):
         with self.monitor_events(plot_data) as events:
             plot_data.del_data("Grumpy")
             self.assertEqual(events, [{"removed": ["Grumpy"]}])
+
+    def test_append_data(self):
+        plot_data = ArrayPlotData(x=numpy.arange(5))
+
+        with self.monitor_events(plot_data) as events:
+            plot_data.append_data("x", numpy.arange(5, 8), capacity=6)
+            plot_data.append_data("y", [1.0])
+
+        numpy.testing.assert_array_equal(
+            plot_data.get_data("x"), numpy.arange(2, 8)
+        )
+        numpy.testing.assert_array_equal(plot_data.get_data("y"), [1.0])
+        self.assertEqual(sorted(events[0]), ["appended", "discarded"])
+        numpy.testing.assert_array_equal(
+            events[0]["appended"]["x"], [5, 6, 7]
+        )
+        self.assertEqual(events[0]["discarded"], {"x": 2})
+        self.assertEqual(events[1], {"added": ["y"]})
+
+        # setting the data replaces the appended array
+        plot_data.set_data("x", numpy.arange(3))
+        plot_data.append_data("x", [3])
+        numpy.testing.assert_array_equal(
+            plot_data.get_data("x"), numpy.arange(4)
+        )
@@ -69,6 +69,70 @@ class ArrayDataSourceTestCase(UnittestTools, unittest.TestCase):
         self.assertEqual(self.data_source.get_bounds(), (2, 20))
         self.assertEqual(self.data_source.sort_order, "descending")
 
+    def test_append_data(self):
+        with self.assertTraitChanges(
+            self.data_source, "data_changed", count=1
+        ) as result:
+            self.data_source.append_data([20, -5, 3])
+
+        assert_array_equal(
+            self.data_source.get_data(), list(range(10)) + [20, -5, 3]
+        )
+        self.assertEqual(self.data_source.get_bounds(), (-5, 20))
+        change = result.events[0][3]
+        assert_array_equal(change["appended"], [20, -5, 3])
+        self.assertEqual(change["discarded"], 0)
+
+    def test_set_appended_data(self):
+        data_source = ArrayDataSource(np.array([5.0, 0.0, 1.0, 9.0]))
+        data = np.array([1.0, 9.0, 2.0, 3.0])
+
+        with self.assertTraitChanges(
+            data_source, "data_changed", count=1
+        ) as result:
+            data_source.set_appended_data(data, 2, discarded=2)
+
+        self.assertIs(data_source.get_data(), data)
+        self.assertEqual(data_source.get_bounds(), (1.0, 9.0))
+        change = result.events[0][3]
+        assert_array_equal(change["appended"], [2.0, 3.0])
+        self.assertEqual(change["discarded"], 2)
+
+        # mismatched sizes set the data
+        data_source.set_appended_data(np.array([7.0, 8.0]), 1)
+        self.assertEqual(data_source.get_bounds(), (7.0, 8.0))
+
+    def test_append_data_capacity(self):
+        data_source = ArrayDataSource(np.array([5.0, 0.0, 1.0, 9.0]))
+
+        data_source.append_data([2.0, 3.0], capacity=4)
+
+        assert_array_equal(data_source.get_data(), [1.0, 9.0, 2.0, 3.0])
+        self.assertEqual(data_source.get_bounds(), (1.0, 9.0))
+
+        data_source.append_data([4.0, 5.0], capacity=4)
+
+        assert_array_equal(data_source.get_data(), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(data_source.get_bounds(), (2.0, 5.0))
+
+    def test_append_data_matches_set_data(self):
+        values = np.random.RandomState(0).normal(size=1000)
+        values[::7] = nan
+        data_source = ArrayDataSource(values[:10])
+        for start in range(10, 1000, 10):
+            data_source.append_data(values[start:start + 10], capacity=100)
+            expected = ArrayDataSource(values[max(start - 90, 0):start + 10])
+            self.assertEqual(
+                data_source.get_bounds(), expected.get_bounds()
+            )
+
+    def test_append_data_sorted(self):
+        data_source = ArrayDataSource(arange(10), sort_order="ascending")
+
+        data_source.append_data(arange(10, 15), capacity=8)
+
+        self.assertEqual(data_source.get_bounds(), (7, 14))
+
     def test_set_mask(self):
         with self.assertTraitChanges(
             self.data_source, "data_changed", count=1
@@ -215,8 +279,38 @@ class ArrayDataSourceTestCase(UnittestTools, unittest.TestCase):
         myarray = array([12, 3, 0, 9, 2, 18, 3])
         data_source = ArrayDataSource(myarray, sort_order="none")
 
-        with self.assertRaises(NotImplementedError):
-            data_source.reverse_map(3)
+        self.assertIn(data_source.reverse_map(3), (1, 6))
+        self.assertEqual(data_source.reverse_map(10.0), 3)
+        self.assertEqual(data_source.reverse_map(11.0), 0)
+        self.assertEqual(data_source.reverse_map(18), 5)
+        self.assertIsNone(data_source.reverse_map(19))
+        self.assertEqual(
+            data_source.reverse_map(-1, outside_returns_none=False), 2
+        )
+
+    def test_reverse_map_unsorted_nan(self):
+        data_source = ArrayDataSource(array([5.0, nan, 1.0, 3.0, nan]))
+        self.assertEqual(data_source.reverse_map(3.2), 3)
+        self.assertEqual(data_source.reverse_map(5.0), 0)
+        self.assertEqual(data_source.reverse_map(1.1), 2)
+
+        data_source = ArrayDataSource(array([nan, nan]))
+        self.assertIsNone(data_source.reverse_map(1.0))
+
+    def test_sort_permutation(self):
+        data_source = ArrayDataSource(array([3.0, nan, 1.0, 2.0, 1.0]))
+        permutation = data_source.get_sort_permutation()
+        assert_array_equal(permutation, [2, 4, 3, 0, 1])
+        self.assertIs(data_source.get_sort_permutation(), permutation)
+
+        data_source.append_data(array([0.0]))
+        assert_array_equal(
+            data_source.get_sort_permutation(), [5, 2, 4, 3, 0, 1]
+        )
+        self.assertEqual(data_source.reverse_map(0.1), 5)
+
+        data_source.set_data(array([2.0, 1.0]))
+        assert_array_equal(data_source.get_sort_permutation(), [1, 0])
 
     def test_metadata(self):
         self.assertEqual(
@@ -0,0 +1,137 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+from unittest import mock
+
+from kiva.api import Font
+
+from chaco.api import (
+    DataRange1D,
+    LinearMapper,
+    PlotAxis,
+    PlotGraphicsContext,
+)
+from chaco.axis import TICK_LABEL_CACHE, TickLabelCache
+from chaco.label import Label
+
+
+def make_axis(low=0.0, high=10.0, **traits):
+    mapper = LinearMapper(
+        range=DataRange1D(low=low, high=high), low_pos=0, high_pos=200
+    )
+    return PlotAxis(
+        mapper=mapper,
+        orientation="bottom",
+        position=[0, 0],
+        bounds=[200, 30],
+        **traits
+    )
+
+
+def render(axis):
+    gc = PlotGraphicsContext((200, 30))
+    gc.render_component(axis)
+
+
+class TestTickLabelCache(unittest.TestCase):
+    def setUp(self):
+        self.gc = PlotGraphicsContext((10, 10))
+        self.font = Font("sans-serif", size=10)
+
+    def test_get_reuses_labels(self):
+        cache = TickLabelCache()
+        black = (0.0, 0.0, 0.0, 1.0)
+        label, bbox = cache.get(self.gc, "1.5", self.font, black)
+
+        self.assertIsInstance(label, Label)
+        self.assertEqual(label.text, "1.5")
+        self.assertEqual(len(bbox), 2)
+        self.assertEqual(
+            cache.get(self.gc, "1.5", self.font, black), (label, bbox)
+        )
+
+        other, _ = cache.get(self.gc, "1.5", self.font, (1.0, 0, 0, 1.0))
+        self.assertIsNot(other, label)
+        other, _ = cache.get(
+            self.gc, "1.5", self.font, black, rotate_angle=45.0
+        )
+        self.assertIsNot(other, label)
+        other, _ = cache.get(
+            self.gc, "1.5", Font("sans-serif", size=12), black
+        )
+        self.assertIsNot(other, label)
+        self.assertEqual(len(cache), 4)
+
+    def test_least_recently_used_labels_discarded(self):
+        cache = TickLabelCache(max_size=2)
+        black = (0.0, 0.0, 0.0, 1.0)
+        first, _ = cache.get(self.gc, "1", self.font, black)
+        cache.get(self.gc, "2", self.font, black)
+        cache.get(self.gc, "1", self.font, black)
+        cache.get(self.gc, "3", self.font, black)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(self.gc, "1", self.font, black)[0], first)
+
+
+class TestPlotAxisLabels(unittest.TestCase):
+    def setUp(self):
+        TICK_LABEL_CACHE.clear()
+        self.addCleanup(TICK_LABEL_CACHE.clear)
+
+    def test_labels(self):
+        axis = make_axis()
+        render(axis)
+        texts = [label.text for label in axis.ticklabel_cache]
+        self.assertEqual(texts, ["0", "2", "4", "6", "8", "10"])
+        self.assertEqual(len(axis._tick_label_bounding_boxes), 6)
+
+    def test_axes_share_labels(self):
+        axis = make_axis()
+        render(axis)
+        other_axis = make_axis()
+
+        with mock.patch("chaco.axis.Label", wraps=Label) as label_class:
+            render(other_axis)
+
+        label_class.assert_not_called()
+        for label, other_label in zip(
+            axis.ticklabel_cache, other_axis.ticklabel_cache
+        ):
+            self.assertIs(label, other_label)
+
+    def test_pan_only_creates_new_labels(self):
+        axis = make_axis()
+        render(axis)
+        labels = {label.text: label for label in axis.ticklabel_cache}
+
+        axis.mapper.range.set_bounds(2.0, 12.0)
+        with mock.patch("chaco.axis.Label", wraps=Label) as label_class:
+            render(axis)
+
+        texts = [label.text for label in axis.ticklabel_cache]
+        self.assertEqual(texts, ["2", "4", "6", "8", "10", "12"])
+        label_class.assert_called_once()
+        self.assertEqual(label_class.call_args[1]["text"], "12")
+        for label in axis.ticklabel_cache[:-1]:
+            self.assertIs(label, labels[label.text])
+
+    def test_color_change_creates_new_labels(self):
+        axis = make_axis()
+        render(axis)
+        labels = list(axis.ticklabel_cache)
+
+        axis.tick_label_color = "red"
+        render(axis)
+
+        for label, new_label in zip(labels, axis.ticklabel_cache):
+            self.assertIsNot(label, new_label)
+            self.assertEqual(new_label.text, label.text)
@@ -24,6 +24,7 @@ from chaco.base import (
     intersect_range,
     reverse_map_1d,
     point_line_distance,
+    sorted_range_slice,
 )
 
 
@@ -252,8 +253,51 @@ class PointLineDistanceTestCase(unittest.TestCase):
         assert_almost_equal(dist, 0.0)
 
 
+class SortedRangeSliceTestCase(unittest.TestCase):
+    def test_ascending(self):
+        x = arange(10.0)
+        self.assertEqual(sorted_range_slice(x, 2.5, 6.0, "ascending"),
+                         slice(3, 7))
+        self.assertEqual(sorted_range_slice(x, 2.5, 6.0, "ascending", pad=1),
+                         slice(2, 8))
+        self.assertEqual(sorted_range_slice(x, -5, 50, "ascending", pad=1),
+                         slice(0, 10))
+
+    def test_descending(self):
+        x = arange(10.0)[::-1]
+        window = sorted_range_slice(x, 2.5, 6.0, "descending")
+        assert_array_equal(x[window], [6.0, 5.0, 4.0, 3.0])
+        window = sorted_range_slice(x, 2.5, 6.0, "descending", pad=1)
+        assert_array_equal(x[window], [7.0, 6.0, 5.0, 4.0, 3.0, 2.0])
+
+    def test_between_points(self):
+        x = arange(10.0)
+        self.assertEqual(sorted_range_slice(x, 2.25, 2.75, "ascending"),
+                         slice(3, 3))
+        self.assertEqual(
+            sorted_range_slice(x, 2.25, 2.75, "ascending", pad=1),
+            slice(2, 4)
+        )
+
+    def test_unsorted(self):
+        with self.assertRaises(NotImplementedError):
+            sorted_range_slice(arange(10.0), 2.0, 3.0, "none")
+
+
 class IntersectRangeTestCase(unittest.TestCase):
 
+    def test_sorted_matches_unsorted(self):
+        x = linspace(-5.0, 5.0, 101)
+        mask = ones(101, dtype=bool)
+        mask[48] = False
+        for sort_order, data in [("ascending", x), ("descending", x[::-1])]:
+            for low, high in [(-1.05, 0.33), (-10, 10), (2.001, 2.002)]:
+                expected = intersect_range(data, low, high, mask)
+                result = intersect_range(
+                    data, low, high, mask, sort_order=sort_order
+                )
+                assert_array_equal(result, expected)
+
     # zero point test
 
     def test_empty(self):
@@ -9,10 +9,13 @@
 # Thanks for using Enthought open source!
 
 import unittest
+from unittest import mock
 
+import numpy as np
 from numpy import allclose, array, ravel
 
 from chaco.api import ArrayDataSource, ColorMapper, DataRange1D
+from chaco import color_mapper
 
 
 class ColormapperTestCase(unittest.TestCase):
@@ -140,3 +143,54 @@ class ColormapperTestCase(unittest.TestCase):
             "red": [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)],
         }
         assert self.colormap._segmentdata == sd
+
+    def test_map_uint8(self):
+        self.colormap.range.set_bounds(0.0, 1.0)
+        data = array([[0.0, 0.5], [1.0, np.nan]])
+
+        rgba = self.colormap.map_uint8(data)
+
+        self.assertEqual(rgba.shape, (2, 2, 4))
+        self.assertEqual(rgba.dtype, np.uint8)
+        np.testing.assert_array_equal(rgba[..., 0], [[0, 127], [255, 0]])
+        np.testing.assert_array_equal(rgba[..., 3], [[255, 255], [255, 0]])
+
+    def test_map_uint8_out(self):
+        self.colormap.range.set_bounds(0.0, 1.0)
+        data = np.linspace(0.0, 1.0, 20).reshape(4, 5)
+        expected = self.colormap.map_uint8(data)
+        out = np.zeros((4, 5, 4), dtype=np.uint8)
+
+        rgba = self.colormap.map_uint8(data, out=out)
+
+        self.assertIs(rgba, out)
+        np.testing.assert_array_equal(out, expected)
+
+    def test_map_uint8_parallel(self):
+        self.colormap.range.set_bounds(0.0, 1.0)
+        data = np.random.RandomState(0).uniform(size=(50, 20))
+        expected = self.colormap.map_uint8(data)
+
+        with mock.patch.object(color_mapper, "PARALLEL_MAP_SIZE", 100):
+            with mock.patch("os.cpu_count", return_value=4):
+                rgba = self.colormap.map_uint8(data)
+
+        np.testing.assert_array_equal(rgba, expected)
+
+    def test_map_lut_indices_and_colors(self):
+        self.colormap.range.set_bounds(0.0, 1.0)
+        data = np.random.RandomState(0).uniform(-0.5, 1.5, size=(10, 20))
+        data[2, 3] = np.nan
+
+        indices = self.colormap.map_lut_indices(data)
+        rgba = self.colormap.map_lut_colors(indices)
+
+        self.assertEqual(indices.dtype, np.uint16)
+        self.assertEqual(indices[2, 3], self.colormap.steps)
+        np.testing.assert_array_equal(rgba, self.colormap.map_uint8(data))
+
+    def test_lut_indices_key(self):
+        self.colormap.range.set_bounds(0.0, 1.0)
+        key = self.colormap.lut_indices_key()
+        self.colormap.range.set_bounds(0.0, 2.0)
+        self.assertNotEqual(self.colormap.lut_indices_key(), key)
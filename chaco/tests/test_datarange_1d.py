@@ -36,6 +36,18 @@ class Foo(HasTraits):
         self.range_updated = True
 
 
+class CountingDataSource(ArrayDataSource):
+    """
+    An ArrayDataSource which counts the calls to get_bounds.
+    """
+
+    bounds_queries = 0
+
+    def get_bounds(self):
+        self.bounds_queries += 1
+        return super().get_bounds()
+
+
 class DataRangeTestCase(UnittestTools, unittest.TestCase):
     def test_empty_range(self):
         r = DataRange1D()
@@ -363,3 +375,50 @@ class DataRangeTestCase(UnittestTools, unittest.TestCase):
         self.assertEqual(events[-1].new, (-inf, inf))
         self.assertEqual(r.low, -inf)
         self.assertEqual(r.high, inf)
+
+    def test_update_one_of_many_sources(self):
+        sources = [CountingDataSource(arange(i, i + 10.0)) for i in range(200)]
+        r = DataRange1D(*sources)
+        self.assertEqual((r.low, r.high), (0.0, 208.0))
+        for source in sources:
+            source.bounds_queries = 0
+
+        sources[100].set_data(array([-5.0, 500.0]))
+
+        self.assertEqual((r.low, r.high), (-5.0, 500.0))
+        self.assertEqual([s.bounds_queries for s in sources].count(0), 199)
+
+        # shrinking the source holding both bounds restores the others
+        sources[100].set_data(array([100.0, 101.0]))
+
+        self.assertEqual((r.low, r.high), (0.0, 208.0))
+
+    def test_source_updates_match_refresh(self):
+        sources = [
+            ArrayDataSource(array([float(i), i + 1.0])) for i in range(5)
+        ]
+        r = DataRange1D(*sources)
+        updates = [
+            (0, [10.0, 11.0]),
+            (4, [-3.0, 2.0]),
+            (4, []),
+            (2, [NAN, NAN]),
+            (2, [1.0, 50.0]),
+            (1, [-inf, 0.0]),
+            (1, [0.5, 0.6]),
+        ]
+        for index, data in updates:
+            sources[index].set_data(array(data))
+            expected = DataRange1D(*sources)
+            self.assertEqual((r.low, r.high), (expected.low, expected.high))
+
+    def test_fixed_bounds_do_not_query_sources(self):
+        source = CountingDataSource(arange(10.0))
+        r = DataRange1D(source, low_setting=0.0, high_setting=5.0)
+        source.bounds_queries = 0
+
+        source.set_data(arange(20.0))
+
+        self.assertEqual(source.bounds_queries, 0)
+        r.high_setting = "auto"
+        self.assertEqual(r.high, 19.0)
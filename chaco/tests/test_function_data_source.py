@@ -12,13 +12,17 @@
 Test of FunctionDataSource behavior.
 """
 
+from threading import Event
 import unittest
+from unittest import mock
 
 from numpy import array, linspace, ones
 from numpy.testing import assert_array_equal
 
+from chaco._workers import get_executor
 from chaco.api import DataRange1D
 from chaco.function_data_source import FunctionDataSource
+from chaco.tests._tools import queued_ui_dispatch
 from traits.testing.api import UnittestTools
 
 
@@ -146,3 +150,166 @@ class FunctionDataSourceTestCase(UnittestTools, unittest.TestCase):
         )
 
         self.assertEqual(101, self.data_source.get_size())
+
+
+class FunctionEvaluationTestCase(UnittestTools, unittest.TestCase):
+    def setUp(self):
+        ui_dispatch = queued_ui_dispatch()
+        self.process_ui_events = ui_dispatch.__enter__()
+        self.addCleanup(ui_dispatch.__exit__, None, None, None)
+        self.func = mock.Mock(
+            side_effect=lambda low, high, *args: linspace(low, high, 11)
+        )
+        self.data_range = DataRange1D(low_setting=0.0, high_setting=1.0)
+
+    def wait_for_worker(self):
+        # the worker runs one task at a time, so this waits for earlier
+        # tasks, and then their results are passed to the "UI thread"
+        get_executor("function").submit(lambda: None).result()
+        self.process_ui_events()
+
+    def test_cached_results(self):
+        data_source = FunctionDataSource(
+            func=self.func, data_range=self.data_range, max_cached_results=2
+        )
+        self.data_range.high_setting = 2.0
+        self.data_range.high_setting = 1.0
+        self.assertEqual(self.func.call_count, 2)
+        assert_array_equal(data_source.get_data(), linspace(0.0, 1.0, 11))
+
+        self.data_range.high_setting = 3.0
+        self.data_range.high_setting = 1.0
+        # the least recently used (0.0, 2.0) was discarded
+        self.data_range.high_setting = 2.0
+        self.assertEqual(self.func.call_count, 4)
+
+    def test_func_change_clears_cache(self):
+        data_source = FunctionDataSource(
+            func=self.func, data_range=self.data_range, max_cached_results=2
+        )
+        data_source.func = lambda low, high: linspace(low, high, 5)
+        self.data_range.high_setting = 2.0
+        self.data_range.high_setting = 1.0
+        assert_array_equal(data_source.get_data(), linspace(0.0, 1.0, 5))
+
+    def test_evaluate_in_background(self):
+        data_source = FunctionDataSource(
+            func=self.func,
+            data_range=self.data_range,
+            evaluate_in_background=True,
+        )
+        self.wait_for_worker()
+        assert_array_equal(data_source.get_data(), linspace(0.0, 1.0, 11))
+
+        with self.assertTraitChanges(data_source, "data_changed", count=1):
+            self.data_range.high_setting = 2.0
+            self.wait_for_worker()
+        assert_array_equal(data_source.get_data(), linspace(0.0, 2.0, 11))
+
+    def test_background_results_set_on_ui_thread(self):
+        data_source = FunctionDataSource(
+            func=self.func,
+            data_range=self.data_range,
+            evaluate_in_background=True,
+        )
+        self.wait_for_worker()
+
+        self.data_range.high_setting = 2.0
+        get_executor("function").submit(lambda: None).result()
+        # the result waits for the UI thread
+        assert_array_equal(data_source.get_data(), linspace(0.0, 1.0, 11))
+        self.process_ui_events()
+        assert_array_equal(data_source.get_data(), linspace(0.0, 2.0, 11))
+
+    def test_evaluate_in_background_without_ui(self):
+        with mock.patch(
+            "chaco.function_evaluation_mixin.can_dispatch_to_ui",
+            return_value=False,
+        ):
+            data_source = FunctionDataSource(
+                func=self.func,
+                data_range=self.data_range,
+                evaluate_in_background=True,
+            )
+            self.data_range.high_setting = 2.0
+
+        assert_array_equal(data_source.get_data(), linspace(0.0, 2.0, 11))
+
+    def test_superseded_requests_cancelled(self):
+        data_source = FunctionDataSource(
+            func=self.func,
+            data_range=self.data_range,
+            evaluate_in_background=True,
+        )
+        self.wait_for_worker()
+        self.func.reset_mock()
+
+        # hold the worker so that the requests queue up
+        release = Event()
+        get_executor("function").submit(release.wait)
+        for high in [2.0, 3.0, 4.0]:
+            self.data_range.high_setting = high
+        assert_array_equal(data_source.get_data(), linspace(0.0, 1.0, 11))
+        release.set()
+        self.wait_for_worker()
+
+        self.func.assert_called_once_with(0.0, 4.0)
+        assert_array_equal(data_source.get_data(), linspace(0.0, 4.0, 11))
+
+    def test_func_change_cancels_requests(self):
+        data_source = FunctionDataSource(
+            func=self.func,
+            data_range=self.data_range,
+            evaluate_in_background=True,
+        )
+        self.wait_for_worker()
+
+        # hold the worker so that the request is still queued
+        release = Event()
+        get_executor("function").submit(release.wait)
+        self.data_range.high_setting = 2.0
+        data_source.func = lambda low, high: linspace(low, high, 5)
+        release.set()
+        self.wait_for_worker()
+
+        assert_array_equal(data_source.get_data(), linspace(0.0, 1.0, 11))
+
+    def test_progressive_resolutions(self):
+        func = mock.Mock(
+            side_effect=lambda low, high, n: linspace(low, high, n)
+        )
+        data_source = FunctionDataSource(
+            func=func,
+            data_range=self.data_range,
+            evaluate_in_background=True,
+            resolutions=[3, 11],
+            max_cached_results=4,
+        )
+        self.wait_for_worker()
+        self.assertEqual(data_source.get_size(), 11)
+
+        sizes = []
+        data_source.observe(
+            lambda event: sizes.append(data_source.get_size()),
+            "data_changed",
+        )
+        self.data_range.high_setting = 2.0
+        self.wait_for_worker()
+        self.assertEqual(sizes, [3, 11])
+
+        # the finest cached result is shown at once
+        func.reset_mock()
+        self.data_range.high_setting = 1.0
+        self.assertEqual(data_source.get_size(), 11)
+        self.wait_for_worker()
+        func.assert_not_called()
+
+    def test_resolutions_without_background(self):
+        func = mock.Mock(
+            side_effect=lambda low, high, n: linspace(low, high, n)
+        )
+        data_source = FunctionDataSource(
+            func=func, data_range=self.data_range, resolutions=[3, 11]
+        )
+        func.assert_called_once_with(0.0, 1.0, 11)
+        self.assertEqual(data_source.get_size(), 11)
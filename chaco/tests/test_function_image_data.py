@@ -0,0 +1,112 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Test of FunctionImageData behavior.
+"""
+
+from threading import Event
+import unittest
+from unittest import mock
+
+from numpy import linspace, meshgrid
+from numpy.testing import assert_array_equal
+
+from chaco._workers import get_executor
+from chaco.api import DataRange2D
+from chaco.function_image_data import FunctionImageData
+from chaco.tests._tools import queued_ui_dispatch
+from traits.testing.api import UnittestTools
+
+
+def image(x_low, x_high, y_low, y_high, n=11):
+    x, y = meshgrid(linspace(x_low, x_high, n), linspace(y_low, y_high, n))
+    return x * y
+
+
+class FunctionImageDataTestCase(UnittestTools, unittest.TestCase):
+    def setUp(self):
+        ui_dispatch = queued_ui_dispatch()
+        self.process_ui_events = ui_dispatch.__enter__()
+        self.addCleanup(ui_dispatch.__exit__, None, None, None)
+        self.data_range = DataRange2D(low=(0.0, 0.0), high=(1.0, 2.0))
+
+    def wait_for_worker(self):
+        # the worker runs one task at a time, so this waits for earlier
+        # tasks, and then their results are passed to the "UI thread"
+        get_executor("function").submit(lambda: None).result()
+        self.process_ui_events()
+
+    def test_recalculate(self):
+        data_source = FunctionImageData(
+            func=image, data_range=self.data_range
+        )
+        assert_array_equal(data_source.data, image(0.0, 1.0, 0.0, 2.0))
+
+        with self.assertTraitChanges(data_source, "data_changed", count=1):
+            self.data_range.x_range.high_setting = 3.0
+        assert_array_equal(data_source.data, image(0.0, 3.0, 0.0, 2.0))
+
+    def test_set_data(self):
+        data_source = FunctionImageData(func=image)
+        with self.assertRaises(RuntimeError):
+            data_source.set_data(image(0.0, 1.0, 0.0, 1.0))
+
+    def test_progressive_resolutions_in_background(self):
+        func = mock.Mock(side_effect=image)
+        data_source = FunctionImageData(
+            func=func,
+            data_range=self.data_range,
+            evaluate_in_background=True,
+            resolutions=[4, 16],
+            max_cached_results=4,
+        )
+        self.wait_for_worker()
+        self.assertEqual(data_source.get_width(), 16)
+
+        shapes = []
+        data_source.observe(
+            lambda event: shapes.append(data_source.data.shape),
+            "data_changed",
+        )
+        # hold the worker to check that the previous image is kept until the
+        # new one is ready
+        release = Event()
+        get_executor("function").submit(release.wait)
+        self.data_range.x_range.high_setting = 3.0
+        self.assertEqual(shapes, [])
+        release.set()
+        self.wait_for_worker()
+        self.assertEqual(shapes, [(4, 4), (16, 16)])
+        assert_array_equal(data_source.data, image(0.0, 3.0, 0.0, 2.0, 16))
+
+        func.reset_mock()
+        self.data_range.x_range.high_setting = 1.0
+        self.wait_for_worker()
+        func.assert_not_called()
+        assert_array_equal(data_source.data, image(0.0, 1.0, 0.0, 2.0, 16))
+
+    def test_func_change_cancels_requests(self):
+        data_source = FunctionImageData(
+            func=image,
+            data_range=self.data_range,
+            evaluate_in_background=True,
+        )
+        self.wait_for_worker()
+
+        # hold the worker so that the request is still queued
+        release = Event()
+        get_executor("function").submit(release.wait)
+        self.data_range.x_range.high_setting = 3.0
+        data_source.func = lambda *bounds: -image(*bounds)
+        release.set()
+        self.wait_for_worker()
+
+        assert_array_equal(data_source.data, image(0.0, 1.0, 0.0, 2.0))
@@ -15,7 +15,7 @@ Test of ImageData behavior.
 import os
 
 import unittest
-from numpy import arange, swapaxes
+from numpy import arange, array, swapaxes
 from numpy.testing import assert_array_equal
 from pkg_resources import resource_filename
 
@@ -85,6 +85,11 @@ class ImageDataTestCase(UnittestTools, unittest.TestCase):
         bounds = self.data_source.get_bounds()
         self.assertEqual(bounds, (0, 14))
 
+    def test_bounds_bool(self):
+        data_source = ImageData(data=array([[True, False], [False, False]]))
+        bounds = data_source.get_bounds()
+        self.assertEqual(bounds, (False, True))
+
     @unittest.skip("test_bounds_empty() fails in this case")
     def test_bounds_empty(self):
         data_source = ImageData()
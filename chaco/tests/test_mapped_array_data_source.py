@@ -0,0 +1,123 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Test of MappedArrayDataSource behavior.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from chaco.api import MappedArrayDataSource
+from chaco.downsample import lod_pyramid
+
+
+class MappedArrayDataSourceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.data_file = os.path.join(self.directory, "data.dat")
+        self.summary_file = os.path.join(self.directory, "data.npz")
+
+        data = np.random.RandomState(0).normal(size=100000)
+        data[5000:6000] = np.nan
+        data[12345] = -10.0
+        data[54321] = 10.0
+        data.tofile(self.data_file)
+
+    def open_data(self):
+        return np.memmap(self.data_file, dtype=float, mode="r")
+
+    def test_data_not_copied(self):
+        data = self.open_data()
+        data_source = MappedArrayDataSource(data)
+
+        self.assertIs(data_source.get_data(), data)
+        self.assertEqual(data_source.get_bounds(), (-10.0, 10.0))
+        self.assertEqual(data_source.get_lod_pyramid().base_size, 4096)
+        self.assertFalse(os.path.exists(self.summary_file))
+
+    def test_summaries_saved(self):
+        data_source = MappedArrayDataSource(
+            self.open_data(), summary_file=self.summary_file
+        )
+        pyramid = data_source.get_lod_pyramid()
+        self.assertTrue(os.path.exists(self.summary_file))
+
+        with mock.patch(
+            "chaco.array_data_source.nanargminmax"
+        ) as nanargminmax, mock.patch.object(
+            lod_pyramid, "_reduce_data"
+        ) as reduce_data:
+            data_source = MappedArrayDataSource(
+                self.open_data(), summary_file=self.summary_file
+            )
+            bounds = data_source.get_bounds()
+            restored = data_source.get_lod_pyramid()
+
+        nanargminmax.assert_not_called()
+        reduce_data.assert_not_called()
+        self.assertEqual(bounds, (-10.0, 10.0))
+        self.assertEqual(len(restored.levels), len(pyramid.levels))
+        for run, restored_run in zip(
+            pyramid.gather(0, 100000, 10), restored.gather(0, 100000, 10)
+        ):
+            assert_array_equal(run, restored_run)
+
+    def test_summaries_of_modified_file_ignored(self):
+        data_source = MappedArrayDataSource(
+            self.open_data(), summary_file=self.summary_file
+        )
+        data_source.get_lod_pyramid()
+
+        data = self.open_data().copy()
+        data[777] = 20.0
+        data.tofile(self.data_file)
+        stat = os.stat(self.data_file)
+        os.utime(
+            self.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9)
+        )
+
+        data_source = MappedArrayDataSource(
+            self.open_data(), summary_file=self.summary_file
+        )
+        self.assertEqual(data_source.get_bounds(), (-10.0, 20.0))
+        top = data_source.get_lod_pyramid().levels[-1]
+        self.assertEqual(top.argmax[top.maximum.argmax()], 777)
+
+    def test_summaries_of_other_base_size_ignored(self):
+        data_source = MappedArrayDataSource(
+            self.open_data(), summary_file=self.summary_file
+        )
+        data_source.get_lod_pyramid()
+
+        data_source = MappedArrayDataSource(
+            self.open_data(),
+            summary_file=self.summary_file,
+            lod_base_size=64,
+        )
+        self.assertEqual(data_source.get_lod_pyramid().base_size, 64)
+
+    def test_unmapped_data(self):
+        data = np.arange(10.0)[::-1]
+        data_source = MappedArrayDataSource(
+            data, summary_file=self.summary_file
+        )
+
+        self.assertEqual(data_source.get_bounds(), (0.0, 9.0))
+        data_source.append_data(np.array([-1.0]))
+        self.assertEqual(data_source.get_bounds(), (-1.0, 9.0))
+        self.assertFalse(os.path.exists(self.summary_file))
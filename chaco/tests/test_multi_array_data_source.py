@@ -123,6 +123,13 @@ class MultiArrayDataTestCase(UnittestTools, unittest.TestCase):
         bounds = data_source.get_bounds(index=0)
         self.assertEqual(bounds, (3, 12))
 
+    def test_bounds_bool(self):
+        myarray = array([[True, False], [False, False]])
+        data_source = MultiArrayDataSource(myarray)
+        self.assertEqual(data_source.get_bounds(), (False, True))
+        self.assertEqual(data_source.get_bounds(value=0), (False, True))
+        self.assertEqual(data_source.get_bounds(index=1), (False, False))
+
     def test_bounds_empty(self):
         data_source = MultiArrayDataSource()
         bounds = data_source.get_bounds()
@@ -137,6 +144,29 @@ class MultiArrayDataTestCase(UnittestTools, unittest.TestCase):
         self.assertTrue(isnan(bounds[0]))
         self.assertTrue(isnan(bounds[1]))
 
+    def test_bounds_cached(self):
+        myarray = array([[12, 3], [0, 9], [2, 18], [3, 10]])
+        data_source = MultiArrayDataSource(myarray, sort_order="none")
+        self.assertEqual(data_source.get_bounds(value=1), (3, 18))
+
+        # the bounds are cached until the data is set
+        myarray[2, 1] = 20
+        self.assertEqual(data_source.get_bounds(value=1), (3, 18))
+        self.assertEqual(data_source.get_bounds(index=2), (2, 20))
+        data_source.set_data(myarray)
+        self.assertEqual(data_source.get_bounds(value=1), (3, 20))
+
+        # and the slices depend on the dimensions
+        data_source.value_dimension = 0
+        self.assertEqual(data_source.get_bounds(value=1), (0, 9))
+
+    def test_bounds_some_nans(self):
+        myarray = array([[nan, 3], [0, nan], [2, 18], [nan, 10]])
+        data_source = MultiArrayDataSource(myarray)
+        self.assertEqual(data_source.get_bounds(), (0, 18))
+        self.assertEqual(data_source.get_bounds(value=0), (0, 2))
+        self.assertEqual(data_source.get_bounds(index=3), (10, 10))
+
     def test_metadata(self):
         self.assertEqual(
             self.data_source.metadata, {"annotations": [], "selections": []}
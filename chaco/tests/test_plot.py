@@ -54,6 +54,23 @@ class PlotTestCase(unittest.TestCase):
         self.assertIs(renderer_2d.index_range, new_range)
         self.assertIs(renderer_1d.index_range, new_range)
 
+    def test_append_data(self):
+        data = ArrayPlotData(x=arange(10.0), y=arange(10.0))
+        plot = Plot(data)
+        renderer = plot.plot(("x", "y"))[0]
+
+        data.append_data("x", [10.0, 11.0], capacity=10)
+        data.append_data("y", [-5.0, 11.0], capacity=10)
+
+        np.testing.assert_array_equal(
+            renderer.index.get_data(), arange(2.0, 12.0)
+        )
+        self.assertEqual(renderer.value.get_bounds(), (-5.0, 11.0))
+        self.assertEqual(plot.index_range.high, 11.0)
+        # the data sources share the arrays of the plot data
+        self.assertIs(renderer.index.get_data(), data.get_data("x"))
+        self.assertIs(renderer.value.get_data(), data.get_data("y"))
+
     def test_segment_plot(self):
         x = arange(10)
         y = arange(1, 11)
@@ -0,0 +1,63 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from chaco.ring_buffer import RingBuffer
+
+
+class RingBufferTestCase(unittest.TestCase):
+    def test_append_unbounded(self):
+        buffer = RingBuffer(np.arange(5.0))
+
+        for i in range(5, 100):
+            discarded = buffer.append([i])
+            self.assertEqual(discarded, 0)
+
+        assert_array_equal(buffer.get(), np.arange(100.0))
+
+    def test_append_with_capacity(self):
+        buffer = RingBuffer()
+        total = 0
+        for i in range(100):
+            total += buffer.append(np.arange(3 * i, 3 * i + 3), capacity=10)
+
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual(total, 290)
+        assert_array_equal(buffer.get(), np.arange(290, 300))
+
+    def test_append_more_than_capacity(self):
+        buffer = RingBuffer(np.arange(5))
+
+        discarded = buffer.append(np.arange(5, 20), capacity=4)
+
+        self.assertEqual(discarded, 5)
+        assert_array_equal(buffer.get(), [16, 17, 18, 19])
+
+    def test_previous_arrays_unchanged(self):
+        buffer = RingBuffer()
+        buffer.append(np.arange(10), capacity=10)
+        previous = buffer.get()
+
+        for i in range(50):
+            buffer.append([-1], capacity=10)
+
+        assert_array_equal(previous, np.arange(10))
+
+    def test_dtype_promotion(self):
+        buffer = RingBuffer(np.arange(3))
+
+        buffer.append([0.5])
+
+        self.assertEqual(buffer.get().dtype, np.float64)
+        assert_array_equal(buffer.get(), [0.0, 1.0, 2.0, 0.5])
@@ -0,0 +1,53 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from chaco.spatial_index import GridIndex
+
+
+class GridIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self.x = random.normal(size=10000)
+        self.y = random.lognormal(size=10000)
+        self.x[::97] = np.nan
+        self.grid = GridIndex(self.x, self.y)
+
+    def brute_force(self, x_low, x_high, y_low, y_high):
+        return np.flatnonzero(
+            (self.x >= x_low) & (self.x <= x_high)
+            & (self.y >= y_low) & (self.y <= y_high)
+        )
+
+    def test_query(self):
+        for rect in [
+            (-0.1, 0.1, 1.0, 1.2),
+            (-5.0, 5.0, 0.0, 100.0),
+            (1.5, 10.0, -3.0, 0.5),
+            (0.3, 0.3, 0.0, 10.0),
+        ]:
+            assert_array_equal(self.grid.query(*rect), self.brute_force(*rect))
+
+    def test_query_outside(self):
+        self.assertEqual(len(self.grid.query(10.0, 11.0, 0.0, 1.0)), 0)
+
+    def test_empty(self):
+        grid = GridIndex(np.array([np.nan]), np.array([1.0]))
+
+        self.assertEqual(len(grid.query(-1.0, 1.0, -1.0, 1.0)), 0)
+
+    def test_single_point(self):
+        grid = GridIndex(np.array([2.0, 2.0]), np.array([3.0, 3.0]))
+
+        assert_array_equal(grid.query(2.0, 2.0, 3.0, 3.0), [0, 1])
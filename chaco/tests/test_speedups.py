@@ -70,11 +70,268 @@ class GatherPointsBase(object):
         assert_close(desired, points)
 
     def test_selection(self):
-        pass
+        index = linspace(0.0, 10.0, 11)
+        value = linspace(0.0, 1.0, 11)
+        sel_mask = zeros(11, dtype=bool)
+        sel_mask[3:9] = True
+
+        points, selection = self.func(
+            index, 2, 6, value, 0, 1, index_sel_mask=sel_mask
+        )
+        self.assertEqual(selection.tolist(), [False, True, True, True, True])
+
+        points, selection = self.func(
+            index,
+            2,
+            6,
+            value,
+            0,
+            1,
+            index_sel_mask=sel_mask,
+            index_sel=[1, 2, 3, 4],
+        )
+        self.assertEqual(selection.tolist(), [False, True, True, False, False])
 
     def test_selection_range(self):
-        pass
+        # points on the bounds of the ranges are gathered
+        index = linspace(0.0, 10.0, 11)
+        value = linspace(0.0, 1.0, 11)
+        index[5] = np.nan
+        value[6] = np.inf
+        point_mask = np.empty(11, dtype=bool)
+
+        points, selection = self.func(
+            index, 2, 8, value, -np.inf, np.inf, point_mask=point_mask
+        )
+
+        np.testing.assert_array_equal(points[:, 0], [2, 3, 4, 7, 8])
+        np.testing.assert_array_equal(
+            point_mask, [0, 0, 1, 1, 1, 0, 0, 1, 1, 0, 0]
+        )
+        self.assertIsNone(selection)
 
     @property
     def func(self):
         return self.module.scatterplot_gather_points
+
+
+class GatherPointsFallbackTestCase(GatherPointsBase, unittest.TestCase):
+    @property
+    def module(self):
+        from chaco import _speedups_fallback
+
+        return _speedups_fallback
+
+
+class GatherPointsCythonTestCase(GatherPointsBase, unittest.TestCase):
+    @property
+    def module(self):
+        try:
+            from chaco import _cython_speedups
+        except ImportError:
+            self.skipTest("Cython speedups are not available")
+
+        return _cython_speedups
+
+    def test_matches_fallback(self):
+        from chaco import _speedups_fallback
+
+        random = np.random.RandomState(0)
+        index = random.normal(size=1000)
+        value = random.normal(size=1000)
+        index[::7] = np.nan
+        kw = dict(
+            index_mask=random.rand(1000) > 0.1,
+            value_sel_mask=random.rand(1000) > 0.5,
+            index_sel=list(range(0, 1000, 3)),
+        )
+
+        expected_mask = np.empty(1000, dtype=bool)
+        expected = _speedups_fallback.scatterplot_gather_points(
+            index, -1, 1, value, -0.5, 2, point_mask=expected_mask, **kw
+        )
+        point_mask = np.empty(1000, dtype=bool)
+        actual = self.func(
+            index, -1, 1, value, -0.5, 2, point_mask=point_mask, **kw
+        )
+
+        np.testing.assert_array_equal(actual[0], expected[0])
+        np.testing.assert_array_equal(actual[1], expected[1])
+        np.testing.assert_array_equal(point_mask, expected_mask)
+
+
+class MapColorsBase(object):
+
+    # The module to look for the map_colors_rgba32 function in; subclasses
+    # should override this.
+    module = None
+
+    def setUp(self):
+        self.lut = np.arange(40, dtype=np.uint8).reshape(10, 4) + 1
+
+    def test_basic(self):
+        data = np.array([[0.0, 0.45, 0.55], [1.0, -5.0, 5.0]])
+        rgba = self.module.map_colors_rgba32(data, 10, 0.0, 1.0, self.lut)
+        self.assertEqual(rgba.shape, (2, 3, 4))
+        self.assertEqual(rgba.dtype, np.uint8)
+        np.testing.assert_array_equal(
+            rgba[..., 0], self.lut[[[0, 4, 4], [9, 0, 9]], 0]
+        )
+        np.testing.assert_array_equal(rgba[1, 2], self.lut[9])
+
+    def test_nan_is_transparent(self):
+        data = np.array([np.nan, np.inf, -np.inf], dtype=np.float32)
+        rgba = self.module.map_colors_rgba32(data, 10, 0.0, 1.0, self.lut)
+        np.testing.assert_array_equal(
+            rgba, [[0, 0, 0, 0], self.lut[9], self.lut[0]]
+        )
+
+    def test_null_range(self):
+        data = np.array([0.0, 1.0, 2.0])
+        rgba = self.module.map_colors_rgba32(data, 10, 1.0, 1.0, self.lut)
+        np.testing.assert_array_equal(rgba, self.lut[[4, 4, 4]])
+
+    def test_out(self):
+        data = np.linspace(0.0, 1.0, 12).reshape(3, 4)
+        out = np.zeros((3, 4, 4), dtype=np.uint8)
+        rgba = self.module.map_colors_rgba32(
+            data, 10, 0.0, 1.0, self.lut, out=out
+        )
+        self.assertIs(rgba, out)
+        expected = self.module.map_colors_rgba32(data, 10, 0.0, 1.0, self.lut)
+        np.testing.assert_array_equal(out, expected)
+
+        wrong_shape = np.zeros((4, 3, 4), dtype=np.uint8)
+        with self.assertRaises(ValueError):
+            self.module.map_colors_rgba32(
+                data, 10, 0.0, 1.0, self.lut, out=wrong_shape
+            )
+
+    def test_map_colors_uint8(self):
+        data = np.array([0.0, 0.5, 1.0, np.nan])
+        rgba = self.module.map_colors_uint8(
+            data, 10, 0.0, 1.0, *self.lut.T.copy()
+        )
+        np.testing.assert_array_equal(
+            rgba, [self.lut[0], self.lut[4], self.lut[9], [0, 0, 0, 0]]
+        )
+
+
+    def test_lut_indices(self):
+        data = np.array([0.0, 0.45, 1.0, 5.0, -5.0, np.nan])
+        indices = self.module.map_lut_indices(data, 10, 0.0, 1.0)
+        self.assertEqual(indices.dtype, np.uint8)
+        np.testing.assert_array_equal(indices, [0, 4, 9, 9, 0, 10])
+
+        indices = self.module.map_lut_indices(data, 256, 0.0, 1.0)
+        self.assertEqual(indices.dtype, np.uint16)
+        self.assertEqual(indices[-1], 256)
+
+    def test_lut_colors(self):
+        data = np.array([[0.0, 0.45], [1.0, np.nan]])
+        indices = self.module.map_lut_indices(data, 10, 0.0, 1.0)
+        rgba = self.module.map_lut_colors(indices, 10, self.lut)
+        expected = self.module.map_colors_rgba32(data, 10, 0.0, 1.0, self.lut)
+        np.testing.assert_array_equal(rgba, expected)
+
+
+class MapColorsFallbackTestCase(MapColorsBase, unittest.TestCase):
+    @property
+    def module(self):
+        from chaco import _speedups_fallback
+
+        return _speedups_fallback
+
+
+class MapColorsCythonTestCase(MapColorsBase, unittest.TestCase):
+    @property
+    def module(self):
+        try:
+            from chaco import _cython_speedups
+        except ImportError:
+            self.skipTest("Cython speedups are not available")
+
+        return _cython_speedups
+
+    def test_matches_fallback(self):
+        from chaco import _speedups_fallback
+
+        random = np.random.RandomState(0)
+        data = random.uniform(-0.5, 1.5, size=(50, 60))
+        data[::7, ::3] = np.nan
+        lut = random.randint(0, 256, size=(256, 4)).astype(np.uint8)
+
+        expected = _speedups_fallback.map_colors_rgba32(
+            data, 256, 0.0, 1.0, lut
+        )
+        actual = self.module.map_colors_rgba32(data, 256, 0.0, 1.0, lut)
+        np.testing.assert_array_equal(actual, expected)
+
+
+class NanArgMinMaxBase(object):
+
+    # The module to look for the nanargminmax function in; subclasses
+    # should override this.
+    module = None
+
+    def test_basic(self):
+        data = array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 9.0])
+        self.assertEqual(self.module.nanargminmax(data), (1, 5))
+
+    def test_nans_ignored(self):
+        data = array([np.nan, 2.0, np.nan, -1.0, 7.0, np.nan])
+        self.assertEqual(self.module.nanargminmax(data), (3, 4))
+
+    def test_all_nans(self):
+        data = array([np.nan, np.nan])
+        self.assertEqual(self.module.nanargminmax(data), (0, -1))
+        self.assertEqual(self.module.nanargminmax(array([])), (0, -1))
+
+    def test_non_numeric(self):
+        data = array(["b", "a", "c"])
+        self.assertEqual(self.module.nanargminmax(data), (0, -1))
+
+    def test_many_chunks(self):
+        random = np.random.RandomState(0)
+        for dtype in [np.float64, np.float32, np.int64, np.int16, np.uint8]:
+            data = (random.uniform(0.0, 100.0, size=100001)).astype(dtype)
+            data[50000] = 0
+            data[70000] = 100
+            self.assertEqual(
+                self.module.nanargminmax(data),
+                (np.argmin(data), np.argmax(data)),
+            )
+
+    def test_many_chunks_with_nans(self):
+        random = np.random.RandomState(0)
+        data = random.uniform(0.0, 1.0, size=100001)
+        data[:40000] = np.nan
+        data[random.uniform(size=data.shape) < 0.3] = np.nan
+        self.assertEqual(
+            self.module.nanargminmax(data),
+            (np.nanargmin(data), np.nanargmax(data)),
+        )
+
+    def test_strided(self):
+        data = np.arange(20.0).reshape(4, 5)[:, ::-2]
+        # the indices are into the data flattened in C order
+        self.assertEqual(self.module.nanargminmax(data), (2, 9))
+
+
+class NanArgMinMaxFallbackTestCase(NanArgMinMaxBase, unittest.TestCase):
+    @property
+    def module(self):
+        from chaco import _speedups_fallback
+
+        return _speedups_fallback
+
+
+class NanArgMinMaxCythonTestCase(NanArgMinMaxBase, unittest.TestCase):
+    @property
+    def module(self):
+        try:
+            from chaco import _cython_speedups
+        except ImportError:
+            self.skipTest("Cython speedups are not available")
+
+        return _cython_speedups
@@ -0,0 +1,122 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Test of TiledImageData behavior.
+"""
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from chaco.api import TiledImageData
+
+
+def reduce_level(data):
+    """Averages 2x2 blocks of pixels, repeating the last row and column of
+    an odd-sized image.
+    """
+    if data.shape[0] % 2:
+        data = np.concatenate([data, data[-1:]], axis=0)
+    if data.shape[1] % 2:
+        data = np.concatenate([data, data[:, -1:]], axis=1)
+    return (
+        data[::2, ::2] + data[1::2, ::2] + data[::2, 1::2] + data[1::2, 1::2]
+    ) / 4
+
+
+class TiledImageDataTestCase(unittest.TestCase):
+    def setUp(self):
+        self.myarray = np.random.RandomState(0).uniform(size=(45, 70))
+        self.data_source = TiledImageData(data=self.myarray, tile_size=8)
+
+    def test_levels(self):
+        # 70 -> 35 -> 18 -> 9 -> 5 pixels wide
+        self.assertEqual(self.data_source.levels, 5)
+        self.assertEqual(self.data_source.get_level_shape(0), (45, 70))
+        self.assertEqual(self.data_source.get_level_shape(2), (12, 18))
+        self.assertEqual(self.data_source.get_level_shape(4), (3, 5))
+
+    def test_get_region_level_0(self):
+        region = self.data_source.get_region(0, 3, 17, -5, 100)
+        assert_array_equal(region, self.myarray[3:17, :])
+
+    def test_get_region(self):
+        expected = self.myarray
+        for level in range(1, self.data_source.levels):
+            expected = reduce_level(expected)
+            height, width = self.data_source.get_level_shape(level)
+            self.assertEqual(expected.shape, (height, width))
+
+            region = self.data_source.get_region(level, 0, height, 0, width)
+            assert_array_almost_equal(region, expected)
+
+            region = self.data_source.get_region(level, 1, 7, 3, 100)
+            assert_array_almost_equal(region, expected[1:7, 3:])
+
+    def test_get_region_uint8(self):
+        rgb = np.zeros((3, 3, 3), dtype=np.uint8)
+        rgb[0, 0] = (255, 10, 3)
+        data_source = TiledImageData(data=rgb, tile_size=1)
+
+        region = data_source.get_region(1, 0, 2, 0, 2)
+
+        self.assertEqual(region.dtype, np.uint8)
+        assert_array_equal(region[0, 0], (64, 2, 1))
+        assert_array_equal(region[1, 1], (0, 0, 0))
+
+    def test_tiles_cached(self):
+        self.data_source.get_region(1, 0, 8, 0, 8)
+        self.assertEqual(list(self.data_source._tile_cache), [(1, 0, 0)])
+
+        # the coarser levels are computed from the cached finer tiles
+        self.data_source.get_region(2, 0, 4, 0, 4)
+        self.assertEqual(len(self.data_source._tile_cache), 5)
+
+    def test_least_recently_used_tiles_discarded(self):
+        self.data_source.max_cached_tiles = 2
+        self.data_source.get_region(1, 0, 1, 0, 1)
+        self.data_source.get_region(1, 0, 1, 8, 9)
+        self.data_source.get_region(1, 0, 1, 0, 1)
+        self.data_source.get_region(1, 8, 9, 0, 1)
+
+        self.assertEqual(
+            list(self.data_source._tile_cache), [(1, 0, 0), (1, 1, 0)]
+        )
+
+    def test_set_data_clears_cache(self):
+        self.data_source.get_region(1, 0, 8, 0, 8)
+        new_array = np.ones((20, 20))
+        self.data_source.set_data(new_array)
+
+        self.assertEqual(len(self.data_source._tile_cache), 0)
+        assert_array_equal(
+            self.data_source.get_region(1, 0, 10, 0, 10), np.ones((10, 10))
+        )
+
+    def test_transposed(self):
+        data_source = TiledImageData(
+            data=self.myarray.T, transposed=True, tile_size=8
+        )
+        assert_array_almost_equal(
+            data_source.get_region(1, 0, 23, 0, 35),
+            reduce_level(self.myarray),
+        )
+
+    def test_transposed_changed_clears_cache(self):
+        self.data_source.get_region(1, 0, 8, 0, 8)
+        self.data_source.transposed = True
+
+        self.assertEqual(len(self.data_source._tile_cache), 0)
+        assert_array_almost_equal(
+            self.data_source.get_region(1, 0, 35, 0, 23),
+            reduce_level(self.myarray.T),
+        )
@@ -0,0 +1,187 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Defines the TiledImageData class.
+"""
+# Standard library imports
+from collections import OrderedDict
+
+# Major library imports
+from numpy import around, concatenate, empty
+
+# Enthought library imports
+from traits.api import Instance, Int, Property
+
+# Local relative imports
+from .image_data import ImageData
+
+
+class TiledImageData(ImageData):
+    """
+    An image data source with a multi-resolution pyramid of its data, for
+    drawing very large images.
+
+    Level 0 of the pyramid is the data itself, and each following level
+    averages blocks of 2x2 pixels of the previous level, so level *k* has
+    ``ceil(width / 2**k)`` by ``ceil(height / 2**k)`` pixels.  When the last
+    row or column of a level has no partner, it is averaged with itself.
+    The levels are split into square tiles, which are only computed when
+    they are first requested and are kept in a cache of limited size, with
+    the least recently used tiles discarded first.
+
+    An ImagePlot drawing a TiledImageData only requests the region of the
+    coarsest level with at least one pixel per screen pixel, so the cost of
+    drawing the image depends on the size of the plot rather than on the
+    size of the image.
+    """
+
+    #: The width and height of the tiles, in pixels.
+    tile_size = Int(256)
+
+    #: The maximum number of tiles to keep in the cache.
+    max_cached_tiles = Int(512)
+
+    #: The number of levels in the pyramid; the last level fits in one tile.
+    levels = Property()
+
+    # ------------------------------------------------------------------------
+    # Private traits
+    # ------------------------------------------------------------------------
+
+    # The computed tiles, keyed by (level, tile row, tile column) and ordered
+    # from the least to the most recently used.
+    _tile_cache = Instance(OrderedDict, (), transient=True)
+
+    # ------------------------------------------------------------------------
+    # Public methods
+    # ------------------------------------------------------------------------
+
+    def get_level_shape(self, level):
+        """Returns the (height, width) in pixels of a level of the pyramid."""
+        scale = 2 ** level
+        return (
+            -(-self.get_height() // scale),
+            -(-self.get_width() // scale),
+        )
+
+    def get_region(self, level, row_min, row_max, col_min, col_max):
+        """Returns a region of a level of the pyramid.
+
+        Parameters
+        ----------
+        level : int
+            The level of the pyramid, where 0 is the full resolution data.
+        row_min, row_max, col_min, col_max : int
+            The region, in pixels of the level, as the slice
+            ``[row_min:row_max, col_min:col_max]``.  The region is clipped
+            to the size of the level.
+
+        Returns
+        -------
+        region : array
+            The pixels of the region, with the same dtype as **data**.
+        """
+        height, width = self.get_level_shape(level)
+        row_min, row_max = max(row_min, 0), min(row_max, height)
+        col_min, col_max = max(col_min, 0), min(col_max, width)
+        if level == 0:
+            return self.data[row_min:row_max, col_min:col_max]
+
+        data = self.data
+        size = self.tile_size
+        region = empty(
+            (max(row_max - row_min, 0), max(col_max - col_min, 0))
+            + data.shape[2:],
+            dtype=data.dtype,
+        )
+        for tile_row in range(row_min // size, -(-row_max // size)):
+            for tile_col in range(col_min // size, -(-col_max // size)):
+                tile = self._get_tile(level, tile_row, tile_col)
+                top, left = tile_row * size, tile_col * size
+                rows = slice(max(row_min, top), min(row_max, top + size))
+                cols = slice(max(col_min, left), min(col_max, left + size))
+                region[
+                    rows.start - row_min:rows.stop - row_min,
+                    cols.start - col_min:cols.stop - col_min,
+                ] = tile[
+                    rows.start - top:rows.stop - top,
+                    cols.start - left:cols.stop - left,
+                ]
+        return region
+
+    # ------------------------------------------------------------------------
+    # Private methods
+    # ------------------------------------------------------------------------
+
+    def _get_tile(self, level, tile_row, tile_col):
+        """Returns a tile of a level of the pyramid, computing it from the
+        previous level if it is not in the cache.
+        """
+        key = (level, tile_row, tile_col)
+        cache = self._tile_cache
+        tile = cache.get(key)
+        if tile is not None:
+            cache.move_to_end(key)
+            return tile
+
+        size = self.tile_size
+        height, width = self.get_level_shape(level)
+        rows = min(size, height - tile_row * size)
+        cols = min(size, width - tile_col * size)
+        top, left = 2 * tile_row * size, 2 * tile_col * size
+        parent = self.get_region(
+            level - 1, top, top + 2 * rows, left, left + 2 * cols
+        )
+        tile = _reduce_2x2(parent, rows, cols)
+
+        cache[key] = tile
+        while len(cache) > max(self.max_cached_tiles, 0):
+            cache.popitem(last=False)
+        return tile
+
+    def _set_data(self, newdata):
+        self._tile_cache.clear()
+        super()._set_data(newdata)
+
+    def _get_levels(self):
+        size = max(self.tile_size, 1)
+        levels = 1
+        while max(self.get_level_shape(levels - 1)) > size:
+            levels += 1
+        return levels
+
+    # ------------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------------
+
+    def _tile_size_changed(self):
+        self._tile_cache.clear()
+
+    def _transposed_changed(self):
+        self._tile_cache.clear()
+
+    def _max_cached_tiles_changed(self, new):
+        while len(self._tile_cache) > max(new, 0):
+            self._tile_cache.popitem(last=False)
+
+
+def _reduce_2x2(pixels, rows, cols):
+    """Averages blocks of 2x2 pixels into an array of *rows* by *cols*
+    pixels.  A missing last row or column is replaced by its neighbour.
+    """
+    if pixels.shape[0] < 2 * rows:
+        pixels = concatenate([pixels, pixels[-1:]], axis=0)
+    if pixels.shape[1] < 2 * cols:
+        pixels = concatenate([pixels, pixels[:, -1:]], axis=1)
+    blocks = pixels.reshape((rows, 2, cols, 2) + pixels.shape[2:])
+    reduced = blocks.mean(axis=(1, 3))
+    if pixels.dtype.kind in "iub":
+        reduced = around(reduced)
+    return reduced.astype(pixels.dtype)
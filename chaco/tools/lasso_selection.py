@@ -12,7 +12,7 @@
 """
 # Major library imports
 import numpy
-from numpy import array, column_stack, empty, vstack, zeros
+from numpy import array, array_equal, column_stack, empty, vstack, zeros
 
 # Enthought library imports
 from traits.api import (
@@ -22,6 +22,7 @@ from traits.api import (
     Event,
     Bool,
     Instance,
+    Int,
     Property,
     Str,
     List,
@@ -33,6 +34,7 @@ from chaco.abstract_controller import AbstractController
 from chaco.abstract_data_source import AbstractDataSource
 from chaco.base_xy_plot import BaseXYPlot
 from chaco.base_2d_plot import Base2DPlot
+from chaco.spatial_index import GridIndex
 
 
 class LassoSelection(AbstractController):
@@ -105,12 +107,39 @@ class LassoSelection(AbstractController):
     _plot = Any()
 
     # To support multiple selections, a list of cached selections and the
-    # active selection are maintained. A single list is not used because the
-    # active selection is re-created every time a new point is added via
-    # the vstack function.
+    # active selection are maintained. The active selection is a view of
+    # the first rows of _active_buffer, which has room for more points, so
+    # that adding a point doesn't copy the existing ones.
     _active_selection = Array
+    _active_buffer = Any
     _previous_selections = List(Array)
 
+    # The data points, with a spatial index of them, and the plot and data
+    # sources they were computed from.  The key is reset to None when the
+    # data of the sources changes.
+    _cached_data = Any
+    _data_index = Any
+    _data_key = Any
+
+    # The data sources whose data_changed events are observed.
+    _data_sources = Any(())
+
+    # The mask of the points in any of the first _committed_count previous
+    # selections.
+    _committed_mask = Any
+    _committed_count = Int(0)
+
+    # The mask of the points in the polygon _active_mask_polygon.  When
+    # points are added to the active selection, the mask is updated by only
+    # testing the points near the added points.
+    _active_mask = Any
+    _active_mask_polygon = Any
+
+    # The last mask of selected points computed by _update_selection, or
+    # None if the committed selections or the selection mode have changed
+    # since.
+    _selection_mask = Any
+
     # ----------------------------------------------------------------------
     # Properties
     # ----------------------------------------------------------------------
@@ -197,6 +226,7 @@ class LassoSelection(AbstractController):
         self._update_selection()
 
         self._previous_selections.append(self._active_selection)
+        self._commit_active_mask()
         self._active_selection = empty((0, 2), dtype=bool)
 
     def selecting_mouse_move(self, event):
@@ -208,9 +238,7 @@ class LassoSelection(AbstractController):
         xform = self.component.get_event_transform(event)
         event.push_transform(xform, caller=self)
         new_point = self._map_data(array((event.x, event.y)))
-        self._active_selection = vstack(
-            (self._active_selection, array((new_point,)))
-        )
+        self._append_active_point(new_point)
         self.updated = True
         if self.incremental_select:
             self._update_selection()
@@ -241,6 +269,9 @@ class LassoSelection(AbstractController):
             self.selection_mode = "invert"
             self._select_all()
 
+    def _selection_mode_changed(self):
+        self._selection_mask = None
+
     # ----------------------------------------------------------------------
     # Protected Methods
     # ----------------------------------------------------------------------
@@ -278,42 +309,204 @@ class LassoSelection(AbstractController):
         if self.selection_datasource is None:
             return
 
-        selected_mask = zeros(
-            self.selection_datasource._data.shape, dtype=bool
+        committed_mask = self._get_committed_mask()
+        active_mask, flipped = self._get_active_mask()
+        previous_mask = self.selection_datasource.metadata.get(
+            self.metadata_name
         )
-        data = self._get_data()
 
         # Compose the selection mask from the cached selections first, then
         # the active selection, taking into account the selection mode only
-        # for the active selection
-
-        for selection in self._previous_selections:
-            selected_mask |= points_in_polygon(data, selection, False).astype(
-                bool, copy=False
+        # for the active selection.  When only a few points of the active
+        # selection changed, only those points are updated.
+        if (
+            flipped is not None
+            and self._selection_mask is not None
+            and previous_mask is self._selection_mask
+        ):
+            selected_mask = previous_mask.copy()
+            selected_mask[flipped] = self._combine_masks(
+                committed_mask[flipped], active_mask[flipped]
+            )
+            changed = len(flipped) > 0
+        else:
+            selected_mask = self._combine_masks(committed_mask, active_mask)
+            changed = previous_mask is None or numpy.any(
+                selected_mask != previous_mask
             )
 
-        active_selection = points_in_polygon(
-            data, self._active_selection, False
-        ).astype(bool, copy=False)
+        if changed:
+            self.selection_datasource.metadata[
+                self.metadata_name
+            ] = selected_mask
+            self._selection_mask = selected_mask
+            self.selection_changed = True
+        else:
+            self._selection_mask = previous_mask
 
+    def _combine_masks(self, committed_mask, active_mask):
+        """Returns the selection mask for points in the committed selections
+        and in the active selection, according to the selection mode.
+        """
         if self.selection_mode == "exclude":
             # XXX I think this should be "set difference"? - CJW
-            selected_mask |= active_selection
-            selected_mask = ~selected_mask
-
+            return ~(committed_mask | active_mask)
         elif self.selection_mode == "invert":
-            selected_mask ^= active_selection
+            return committed_mask ^ active_mask
         else:
-            selected_mask |= active_selection
+            return committed_mask | active_mask
 
-        if numpy.any(
-            selected_mask
-            != self.selection_datasource.metadata[self.metadata_name]
+    def _get_committed_mask(self):
+        """Returns the mask of the points in any of the previous selections.
+        """
+        data, index = self._get_indexed_data()
+        if (
+            self._committed_mask is None
+            or len(self._committed_mask) != len(data)
+            or self._committed_count > len(self._previous_selections)
         ):
-            self.selection_datasource.metadata[
-                self.metadata_name
-            ] = selected_mask
-            self.selection_changed = True
+            self._committed_mask = zeros(len(data), dtype=bool)
+            self._committed_count = 0
+            self._selection_mask = None
+        if self._committed_count < len(self._previous_selections):
+            for selection in self._previous_selections[
+                self._committed_count:
+            ]:
+                self._committed_mask |= self._polygon_mask(selection)
+            self._committed_count = len(self._previous_selections)
+            self._selection_mask = None
+        return self._committed_mask
+
+    def _commit_active_mask(self):
+        """Adds the mask of the active selection, which has just been
+        appended to the previous selections, to the committed mask.
+        """
+        if (
+            self._committed_mask is not None
+            and self._active_mask is not None
+            and self._committed_count == len(self._previous_selections) - 1
+            and self._active_mask_polygon is self._previous_selections[-1]
+        ):
+            self._committed_mask |= self._active_mask
+            self._committed_count += 1
+            self._selection_mask = None
+
+    def _get_active_mask(self):
+        """Returns the mask of the points in the active selection, and the
+        positions of the points whose mask changed since the last call, or
+        None if the whole mask was recomputed.
+
+        Polygons are tested with the even-odd rule, so adding a vertex to a
+        polygon flips the points in the triangle made of the first vertex,
+        the old last vertex and the new last vertex.  As long as points are
+        only added to the active selection, only the points in these
+        triangles need to be tested.
+        """
+        data, index = self._get_indexed_data()
+        polygon = self._active_selection
+        old_polygon = self._active_mask_polygon
+        self._active_mask_polygon = polygon
+
+        if (
+            self._active_mask is None
+            or len(self._active_mask) != len(data)
+            or old_polygon is None
+            or len(old_polygon) == 0
+            or len(old_polygon) > len(polygon)
+            or not array_equal(polygon[: len(old_polygon)], old_polygon)
+        ):
+            self._active_mask = self._polygon_mask(polygon)
+            return self._active_mask, None
+
+        flipped = []
+        for i in range(len(old_polygon), len(polygon)):
+            triangle = array([polygon[0], polygon[i - 1], polygon[i]])
+            positions = self._candidates(triangle)
+            inside = points_in_polygon(data[positions], triangle, False)
+            flipped.append(positions[inside.astype(bool, copy=False)])
+        if len(flipped) == 0:
+            flipped = empty(0, dtype=numpy.intp)
+        elif len(flipped) == 1:
+            flipped = flipped[0]
+        else:
+            # a point may be flipped an even number of times
+            flipped = numpy.concatenate(flipped)
+            flipped, counts = numpy.unique(flipped, return_counts=True)
+            flipped = flipped[counts % 2 == 1]
+        self._active_mask[flipped] ^= True
+        return self._active_mask, flipped
+
+    def _polygon_mask(self, polygon):
+        """Returns the mask of the data points inside a polygon."""
+        data, index = self._get_indexed_data()
+        mask = zeros(len(data), dtype=bool)
+        if len(polygon) > 0:
+            positions = self._candidates(polygon)
+            inside = points_in_polygon(data[positions], polygon, False)
+            mask[positions[inside.astype(bool, copy=False)]] = True
+        return mask
+
+    def _candidates(self, polygon):
+        """Returns the positions of the data points within the bounding box
+        of a polygon.
+        """
+        data, index = self._get_indexed_data()
+        low = polygon.min(axis=0)
+        high = polygon.max(axis=0)
+        return index.query(low[0], high[0], low[1], high[1])
+
+    def _get_indexed_data(self):
+        """Returns the data points and a spatial index of them, which are
+        only recomputed when the data of the plot changes.
+        """
+        plot = self.plot
+        key = (plot, plot.index, plot.value)
+        if self._data_key is None or any(
+            new is not old for new, old in zip(key, self._data_key)
+        ):
+            self._observe_data_sources(key[1:])
+            data = self._get_data()
+            self._cached_data = data
+            self._data_index = GridIndex(data[:, 0], data[:, 1])
+            self._data_key = key
+            self._committed_mask = None
+            self._active_mask = None
+            self._selection_mask = None
+        return self._cached_data, self._data_index
+
+    def _observe_data_sources(self, sources):
+        """Observes the data_changed events of the given data sources
+        instead of the previous ones.
+        """
+        if sources == self._data_sources:
+            return
+        for source in self._data_sources:
+            source.observe(
+                self._data_source_changed, "data_changed", remove=True
+            )
+        for source in sources:
+            source.observe(self._data_source_changed, "data_changed")
+        self._data_sources = sources
+
+    def _data_source_changed(self, event):
+        # The data may have been modified in place, so the indexed data is
+        # recomputed the next time it is needed.
+        self._data_key = None
+
+    def _append_active_point(self, point):
+        """Adds a point to the end of the active selection."""
+        n_points = len(self._active_selection)
+        buffer = self._active_buffer
+        if (
+            buffer is None
+            or self._active_selection.base is not buffer
+            or n_points == len(buffer)
+        ):
+            buffer = empty((max(2 * n_points, 64), 2))
+            buffer[:n_points] = self._active_selection
+            self._active_buffer = buffer
+        buffer[n_points] = point
+        self._active_selection = buffer[: n_points + 1]
 
     def _map_screen(self, points):
         """Maps a point in data space to a point in screen space on the plot.
@@ -0,0 +1,119 @@
+# (C) Copyright 2005-2021 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+import numpy as np
+from kiva.api import points_in_polygon
+
+from chaco.array_plot_data import ArrayPlotData
+from chaco.plot import Plot
+from chaco.tools.lasso_selection import LassoSelection
+from enable.testing import EnableTestAssistant
+
+
+class LassoSelectionTestCase(EnableTestAssistant, unittest.TestCase):
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self.plot_data = ArrayPlotData(
+            x=random.uniform(-10, 10, size=5000),
+            y=random.uniform(-10, 10, size=5000),
+        )
+        plot = Plot(self.plot_data)
+        self.splot = plot.plot(("x", "y"), type="scatter")[0]
+        plot.outer_bounds = [400, 400]
+        plot.do_layout()
+        self.tool = LassoSelection(
+            component=self.splot,
+            selection_datasource=self.splot.index,
+            incremental_select=True,
+        )
+        self.splot.tools.append(self.tool)
+
+    def lasso(self, path, **modifiers):
+        """Drags the lasso along a path of data points."""
+        screen_path = self.splot.map_screen(np.array(path))
+        x, y = screen_path[0]
+        self.mouse_down(interactor=self.tool, x=x, y=y, **modifiers)
+        for x, y in screen_path[1:]:
+            self.mouse_move(interactor=self.tool, x=x, y=y)
+            self.assert_selection_correct()
+        self.mouse_up(interactor=self.tool, x=x, y=y)
+        self.assert_selection_correct()
+
+    def assert_selection_correct(self):
+        """Checks the selection against testing all points against all of
+        the selection polygons.
+        """
+        tool = self.tool
+        data = np.column_stack(
+            [self.plot_data["x"], self.plot_data["y"]]
+        )
+        expected = np.zeros(len(data), dtype=bool)
+        for selection in tool._previous_selections:
+            expected |= points_in_polygon(data, selection).astype(bool)
+        active = points_in_polygon(data, tool._active_selection).astype(bool)
+        if tool.selection_mode == "exclude":
+            expected = ~(expected | active)
+        else:
+            expected |= active
+
+        np.testing.assert_array_equal(
+            self.splot.index.metadata["selection"], expected
+        )
+
+    def test_lasso(self):
+        angles = np.linspace(0, 2 * np.pi, 40)
+        path = np.column_stack([5 * np.cos(angles), 3 * np.sin(2 * angles)])
+        self.lasso(path)
+
+        self.assertEqual(len(self.tool.disjoint_selections), 1)
+        self.assertGreater(self.splot.index.metadata["selection"].sum(), 0)
+
+    def test_multiple_selections(self):
+        self.lasso([[0, 0], [5, 0], [5, 5], [2, 7], [0, 5]])
+        self.lasso([[-8, -8], [-1, -6], [-3, -1], [3, 2]], shift_down=True)
+        self.assertEqual(len(self.tool.disjoint_selections), 2)
+
+        self.lasso([[-9, 9], [9, 9], [0, -9]], control_down=True)
+        self.assertEqual(len(self.tool.disjoint_selections), 3)
+
+    def test_new_selection_replaces_previous(self):
+        self.lasso([[0, 0], [5, 0], [5, 5], [0, 5]])
+        self.lasso([[-5, -5], [-1, -5], [-1, -1], [-5, -1]])
+
+        self.assertEqual(len(self.tool.disjoint_selections), 1)
+        selection = self.splot.index.metadata["selection"]
+        self.assertFalse(np.any(selection & (self.plot_data["x"] > 0)))
+
+    def test_data_changed(self):
+        self.lasso([[0, 0], [5, 0], [5, 5], [0, 5]])
+
+        self.plot_data["x"] = self.plot_data["x"][::-1]
+        self.lasso([[1, 1], [4, 1], [4, 4], [1, 4]], shift_down=True)
+
+    def test_data_modified_in_place(self):
+        self.lasso([[0, 0], [5, 0], [5, 5], [0, 5]])
+
+        x = self.splot.index.get_data()
+        x *= -1.0
+        self.splot.index.set_data(x)
+        self.lasso([[1, 1], [4, 1], [4, 4], [1, 4]], shift_down=True)
+
+    def test_active_selection_buffer(self):
+        path = [[0, 0], [5, 0], [5, 5], [0, 5]]
+        screen_path = self.splot.map_screen(np.array(path))
+        self.mouse_down(interactor=self.tool, x=0, y=0)
+        for x, y in screen_path:
+            self.mouse_move(interactor=self.tool, x=x, y=y)
+
+        active = self.tool._active_selection
+        self.assertIs(active.base, self.tool._active_buffer)
+        np.testing.assert_allclose(active[1:], path)
@@ -10,11 +10,11 @@
 
 from numpy import clip, isinf, ones_like, empty
 
-from chaco.color_mapper import ColorMapper
+from chaco.color_mapper import ColorMapper, map_colors_parallel
 from traits.api import Callable, Tuple, Float, observe
 
 from .chaco_traits import Optional
-from .speedups import map_colors, map_colors_uint8
+from .speedups import map_colors, map_lut_indices
 
 
 class TransformColorMapper(ColorMapper):
@@ -162,22 +162,26 @@ class TransformColorMapper(ColorMapper):
         indices = (norm_data * (self.steps - 1)).astype(int)
         return indices
 
-    def map_uint8(self, data_array):
+    def map_uint8(self, data_array, out=None):
         """Maps an array of data values to an array of colors."""
         norm_data = self._compute_normalized_data(data_array)
-        rgba = map_colors_uint8(
-            norm_data,
-            self.steps,
-            0.0,
-            1.0,
-            self._red_lut_uint8,
-            self._green_lut_uint8,
-            self._blue_lut_uint8,
-            self._alpha_lut_uint8,
+        rgba = map_colors_parallel(
+            norm_data, self.steps, 0.0, 1.0, self._rgba_lut_uint8, out=out
         )
 
         return rgba
 
+    def map_lut_indices(self, data_array, out=None):
+        """Maps an array of data values to indices into the lookup table."""
+        norm_data = self._compute_normalized_data(data_array)
+        return map_lut_indices(norm_data, self.steps, 0.0, 1.0, out=out)
+
+    def lut_indices_key(self):
+        """Returns a value which changes whenever the indices returned by
+        map_lut_indices for the same data would change.
+        """
+        return super().lut_indices_key() + (self.data_func, self.unit_func)
+
     # -------------------------------------------------------------------
     # Private methods
     # -------------------------------------------------------------------